@@ -0,0 +1,520 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+
+Benchmark suite for the public DateUtil operations.
+
+Runs offline with the standard library only:
+
+    python benchmarks/bench_dateutil.py run --output results.json
+    python benchmarks/bench_dateutil.py compare baseline.json results.json --threshold 0.10
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+
+# Benchmark the working tree rather than an installed copy.
+SRC: Final[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+sys.path.insert(0, SRC)
+
+from dateutil import DateFormat, DateUtil, TimezoneUtil, __version__  # noqa: E402
+
+
+# A benchmark factory takes a batch size and returns a callable that performs
+# that many operations per call.
+Factory = Callable[[int], Callable[[], Any]]
+
+# The default batch sizes; 1 is the scalar case.
+DEFAULT_SIZES: Final[List[int]] = [1, 1_000, 10_000]
+
+# The minimum duration of a single timed repeat in nanoseconds.
+MIN_REPEAT_NS: Final[int] = 50_000_000
+
+# A fixed reference instant, so every run benchmarks identical inputs.
+REFERENCE: Final[datetime] = datetime(2024, 6, 1, 12, 30, 45, 123456)
+
+
+def _datetimes(size: int) -> List[datetime]:
+    """
+    Returns a deterministic series of naive datetime objects.
+
+    :param size: The number of values.
+    :type size: int
+
+    :return: The datetime objects, spaced 37 minutes and 11 seconds apart.
+    :rtype: List[datetime]
+    """
+
+    step: timedelta = timedelta(minutes=37, seconds=11, microseconds=17)
+
+    return [REFERENCE + step * index for index in range(size)]
+
+
+def _parse(date_format: DateFormat) -> Factory:
+    """
+    Returns the factory of a string_to_datetime benchmark for one format.
+
+    :param date_format: The format to parse.
+    :type date_format: DateFormat
+
+    :return: The benchmark factory.
+    :rtype: Factory
+    """
+
+    def factory(size: int) -> Callable[[], Any]:
+        values: List[datetime] = _datetimes(size)
+
+        # RFC 2822 parsing needs an offset, which naive values cannot render.
+        if date_format is DateFormat.RFC_2822:
+            values = [value.replace(tzinfo=timezone.utc) for value in values]
+
+        strings: List[str] = [value.strftime(date_format.value) for value in values]
+        parse: Callable[..., datetime] = DateUtil.string_to_datetime
+
+        return lambda: [parse(string, date_format) for string in strings]
+
+    return factory
+
+
+def _format(date_format: DateFormat) -> Factory:
+    """
+    Returns the factory of a datetime_to_string benchmark for one format.
+
+    :param date_format: The format to render.
+    :type date_format: DateFormat
+
+    :return: The benchmark factory.
+    :rtype: Factory
+    """
+
+    def factory(size: int) -> Callable[[], Any]:
+        values: List[datetime] = _datetimes(size)
+
+        if date_format is DateFormat.RFC_2822:
+            values = [value.replace(tzinfo=timezone.utc) for value in values]
+
+        render: Callable[..., str] = DateUtil.datetime_to_string
+
+        return lambda: [render(value, date_format) for value in values]
+
+    return factory
+
+
+def _difference(unit: str) -> Factory:
+    """
+    Returns the factory of a calculate_difference benchmark for one unit.
+
+    :param unit: The unit to calculate the difference in.
+    :type unit: str
+
+    :return: The benchmark factory.
+    :rtype: Factory
+    """
+
+    def factory(size: int) -> Callable[[], Any]:
+        values: List[datetime] = _datetimes(size)
+        end: datetime = values[-1] + timedelta(days=1)
+        difference: Callable[..., Any] = DateUtil.calculate_difference
+
+        return lambda: [difference(value, unit, end) for value in values]
+
+    return factory
+
+
+def _scalar(function: Callable[[datetime], Any]) -> Factory:
+    """
+    Returns the factory of a benchmark that applies a function to every value.
+
+    :param function: The function to apply.
+    :type function: Callable[[datetime], Any]
+
+    :return: The benchmark factory.
+    :rtype: Factory
+    """
+
+    def factory(size: int) -> Callable[[], Any]:
+        values: List[datetime] = _datetimes(size)
+
+        return lambda: [function(value) for value in values]
+
+    return factory
+
+
+def _repeat(function: Callable[[], Any]) -> Factory:
+    """
+    Returns the factory of a benchmark that calls a function once per operation.
+
+    :param function: The function to call.
+    :type function: Callable[[], Any]
+
+    :return: The benchmark factory.
+    :rtype: Factory
+    """
+
+    def factory(size: int) -> Callable[[], Any]:
+        calls: range = range(size)
+
+        return lambda: [function() for _ in calls]
+
+    return factory
+
+
+def _increment_many(mode: str) -> Factory:
+    """
+    Returns the factory of an increment_many benchmark over aware values.
+
+    :param mode: The arithmetic mode ("wall" or "absolute").
+    :type mode: str
+
+    :return: The benchmark factory.
+    :rtype: Factory
+    """
+
+    def factory(size: int) -> Callable[[], Any]:
+        values: List[datetime] = TimezoneUtil.localize_many(_datetimes(size), "UTC")
+
+        return lambda: DateUtil.increment_many(values, "days", 1, mode=mode)
+
+    return factory
+
+
+def _convert_many(size: int) -> Callable[[], Any]:
+    """
+    Returns the convert_many benchmark callable.
+
+    :param size: The batch size.
+    :type size: int
+
+    :return: The benchmark callable.
+    :rtype: Callable[[], Any]
+    """
+
+    values: List[datetime] = TimezoneUtil.localize_many(_datetimes(size), "UTC")
+
+    return lambda: TimezoneUtil.convert_many(values, None, "Europe/Berlin")
+
+
+def benchmarks() -> Dict[str, Factory]:
+    """
+    Returns every benchmark by name.
+
+    :return: A dictionary mapping each benchmark name to its factory.
+    :rtype: Dict[str, Factory]
+    """
+
+    result: Dict[str, Factory] = {}
+
+    for date_format in DateFormat:
+        result[f"parse.{date_format.name}"] = _parse(date_format)
+        result[f"format.{date_format.name}"] = _format(date_format)
+
+    for unit in ("seconds", "days", "months"):
+        result[f"difference.{unit}"] = _difference(unit)
+
+    start: datetime = REFERENCE - timedelta(days=365)
+    end: datetime = REFERENCE + timedelta(days=3650)
+
+    result.update(
+        {
+            "increment.days": _scalar(lambda value: DateUtil.increment(value, "days", 1)),
+            "increment.years": _scalar(lambda value: DateUtil.increment(value, "years", 1)),
+            "increment_many.wall": _increment_many("wall"),
+            "increment_many.absolute": _increment_many("absolute"),
+            "convert_many.Europe/Berlin": _convert_many,
+            "validate.is_valid_date": _scalar(DateUtil.is_valid_date),
+            "validate.is_date_in_range": _scalar(
+                lambda value: DateUtil.is_date_in_range(value, start, end)
+            ),
+            "validate.is_valid_iso_format": _scalar(
+                lambda value, iso=REFERENCE.isoformat(): DateUtil.is_valid_iso_format(iso)
+            ),
+            "validate.is_valid_date_format": _scalar(
+                lambda value: DateUtil.is_valid_date_format("2024-06-01")
+            ),
+            "boundary.start_of_day": _repeat(DateUtil.start_of_day),
+            "boundary.start_of_week": _repeat(DateUtil.start_of_week),
+            "boundary.end_of_month": _repeat(DateUtil.end_of_month),
+            "boundary.today": _repeat(DateUtil.today),
+        }
+    )
+
+    return result
+
+
+def measure(
+    function: Callable[[], Any],
+    operations: int,
+    repeats: int,
+) -> Dict[str, float]:
+    """
+    Times a benchmark callable.
+
+    The number of calls per repeat is calibrated so that every repeat runs
+    for at least MIN_REPEAT_NS, then the repeats are timed individually.
+
+    :param function: The benchmark callable.
+    :type function: Callable[[], Any]
+    :param operations: The number of operations performed per call.
+    :type operations: int
+    :param repeats: The number of timed repeats.
+    :type repeats: int
+
+    :return: The minimum, median and maximum nanoseconds per operation.
+    :rtype: Dict[str, float]
+    """
+
+    loops: int = 1
+
+    # Calibrate the loop count, doubling until a repeat is long enough.
+    while True:
+        start: int = perf_counter_ns()
+
+        for _ in range(loops):
+            function()
+
+        elapsed: int = perf_counter_ns() - start
+
+        if elapsed >= MIN_REPEAT_NS:
+            break
+
+        loops *= 2
+
+    timings: List[float] = []
+
+    for _ in range(repeats):
+        start = perf_counter_ns()
+
+        for _ in range(loops):
+            function()
+
+        timings.append((perf_counter_ns() - start) / (loops * operations))
+
+    return {
+        "min_ns": min(timings),
+        "median_ns": statistics.median(timings),
+        "max_ns": max(timings),
+    }
+
+
+def measure_import(repeats: int) -> Dict[str, float]:
+    """
+    Times "import dateutil" in fresh interpreters.
+
+    :param repeats: The number of interpreters to start.
+    :type repeats: int
+
+    :return: The minimum, median and maximum import time in nanoseconds.
+    :rtype: Dict[str, float]
+    """
+
+    code: str = (
+        "import time; start = time.perf_counter_ns(); import dateutil; "
+        "print(time.perf_counter_ns() - start)"
+    )
+
+    environment: Dict[str, str] = dict(os.environ, PYTHONPATH=SRC)
+    timings: List[float] = []
+
+    for _ in range(repeats):
+        output: str = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            env=environment,
+            text=True,
+        ).stdout
+
+        timings.append(float(output.strip()))
+
+    return {
+        "min_ns": min(timings),
+        "median_ns": statistics.median(timings),
+        "max_ns": max(timings),
+    }
+
+
+def run(
+    sizes: List[int],
+    repeats: int,
+    pattern: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Runs the benchmark suite.
+
+    :param sizes: The batch sizes to run every benchmark with.
+    :type sizes: List[int]
+    :param repeats: The number of timed repeats per benchmark.
+    :type repeats: int
+    :param pattern: Only run benchmarks whose name contains this substring.
+    :type pattern: Optional[str]
+
+    :return: The machine-readable results, including environment metadata.
+    :rtype: Dict[str, Any]
+    """
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    for name, factory in benchmarks().items():
+        if pattern and pattern not in name:
+            continue
+
+        for size in sizes:
+            key: str = f"{name}[{size}]"
+            results[key] = measure(
+                function=factory(size),
+                operations=size,
+                repeats=repeats,
+            )
+
+            print(f"{key:<45} {results[key]['min_ns']:>12.1f} ns/op", file=sys.stderr)
+
+    if not pattern or pattern in "import":
+        results["import"] = measure_import(repeats)
+
+        print(f"{'import':<45} {results['import']['min_ns']:>12.1f} ns", file=sys.stderr)
+
+    return {
+        "meta": {
+            "dateutil": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "repeats": repeats,
+            "sizes": sizes,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Compares two result sets and prints a report.
+
+    The minimum time per operation is compared, as it is the least noisy statistic.
+
+    :param baseline: The stored baseline results.
+    :type baseline: Dict[str, Any]
+    :param current: The results to check.
+    :type current: Dict[str, Any]
+    :param threshold: The relative slowdown (e.g. 0.10 for 10%) that counts as a regression.
+    :type threshold: float
+
+    :return: The regressions as (name, baseline ns, current ns, relative change) tuples.
+    :rtype: List[Tuple[str, float, float, float]]
+    """
+
+    regressions: List[Tuple[str, float, float, float]] = []
+
+    for name, result in sorted(current["results"].items()):
+        reference: Optional[Dict[str, float]] = baseline["results"].get(name)
+
+        if reference is None:
+            print(f"{name:<45} {'(new)':>12} {result['min_ns']:>12.1f}")
+            continue
+
+        change: float = result["min_ns"] / reference["min_ns"] - 1
+        flag: str = "REGRESSION" if change > threshold else ""
+
+        print(
+            f"{name:<45} {reference['min_ns']:>12.1f} {result['min_ns']:>12.1f} "
+            f"{change:>+8.1%} {flag}"
+        )
+
+        if change > threshold:
+            regressions.append((name, reference["min_ns"], result["min_ns"], change))
+
+    return regressions
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmark command line interface.
+
+    :param arguments: The command line arguments (default is sys.argv[1:]).
+    :type arguments: Optional[List[str]]
+
+    :return: The exit code: 1 if compare found regressions, 0 otherwise.
+    :rtype: int
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark the public DateUtil operations.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser: argparse.ArgumentParser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--output", "-o", help="write the JSON results to this file")
+    run_parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated batch sizes (default: %(default)s)",
+    )
+    run_parser.add_argument("--repeats", type=int, default=5, help="timed repeats (default: 5)")
+    run_parser.add_argument("--filter", help="only run benchmarks containing this substring")
+    run_parser.add_argument("--baseline", help="compare against this baseline after running")
+    run_parser.add_argument("--threshold", type=float, default=0.10)
+
+    compare_parser: argparse.ArgumentParser = commands.add_parser(
+        "compare",
+        help="compare results against a baseline",
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown that counts as a regression (default: 0.10)",
+    )
+
+    options: argparse.Namespace = parser.parse_args(arguments)
+
+    if options.command == "run":
+        current: Dict[str, Any] = run(
+            sizes=[int(size) for size in options.sizes.split(",")],
+            repeats=options.repeats,
+            pattern=options.filter,
+        )
+
+        if options.output:
+            with open(options.output, "w", encoding="utf-8") as file:
+                json.dump(current, file, indent=2, sort_keys=True)
+
+        if not options.baseline:
+            return 0
+    else:
+        with open(options.current, encoding="utf-8") as file:
+            current = json.load(file)
+
+    with open(options.baseline, encoding="utf-8") as file:
+        baseline: Dict[str, Any] = json.load(file)
+
+    regressions: List[Tuple[str, float, float, float]] = compare(
+        baseline=baseline,
+        current=current,
+        threshold=options.threshold,
+    )
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {options.threshold:.0%}.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,7 @@ setup(
     packages=find_packages(where="src"),
     python_requires=">=3.8",
     install_requires=[],
+    entry_points={"console_scripts": ["dateutil=dateutil.main:main"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -3,10 +3,164 @@ Author: Louis Goodnews
 Date: 2025-08-19
 """
 
-from typing import Final, List, Literal
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Final, List, Literal, Optional
 
-from .core.core import DateFormat, DateUtil
+from .core.core import DateFormat, DateUtil, RelativeDay
 
-__all__: Final[List[str]] = ["DateFormat", "DateUtil"]
+if TYPE_CHECKING:
+    from .core.codec import TimestampCodec, TimestampDecoder, TimestampEncoder
+    from .core.column import TimestampColumn
+    from .core.compact import CompactDate, CompactDateTime
+    from .core.conflicts import Conflict, ConflictDetector, ConflictGroup
+    from .core.duration import Duration
+    from .core.formatting import clear_format_cache, compile_format, format_cache_info
+    from .core.gaps import GapDetector, SeriesEvent
+    from .core.ingest import NAT, IngestStats, ParallelIngest
+    from .core.instrumentation import Instrumentation
+    from .core.intervals import IntervalSet
+    from .core.merge import TimestampMerge
+    from .core.nanos import NanoDuration, NanoTimestamp
+    from .core.pipeline import Pipeline
+    from .core.profiling import PROFILER, LatencyHistogram, Profiler, Timer
+    from .core.reorder import ReorderBuffer
+    from .core.rfc import RFCDate
+    from .core.serialization import DateJSON, DateJSONEncoder
+    from .core.shared import SharedTimestamps
+    from .core.timers import TimerWheel, every, next_aligned, sleep_until
+    from .core.timezone import TimezoneUtil
+    from .core.windows import RateLimiter, WindowCounter, WindowStats
+
+__all__: Final[List[str]] = [
+    "CompactDate",
+    "CompactDateTime",
+    "Conflict",
+    "ConflictDetector",
+    "ConflictGroup",
+    "DateFormat",
+    "DateJSON",
+    "DateJSONEncoder",
+    "DateUtil",
+    "Duration",
+    "GapDetector",
+    "IngestStats",
+    "Instrumentation",
+    "IntervalSet",
+    "LatencyHistogram",
+    "NAT",
+    "NanoDuration",
+    "NanoTimestamp",
+    "PROFILER",
+    "ParallelIngest",
+    "Pipeline",
+    "Profiler",
+    "RFCDate",
+    "RateLimiter",
+    "RelativeDay",
+    "ReorderBuffer",
+    "SeriesEvent",
+    "SharedTimestamps",
+    "Timer",
+    "TimerWheel",
+    "TimestampCodec",
+    "TimestampColumn",
+    "TimestampDecoder",
+    "TimestampEncoder",
+    "TimestampMerge",
+    "TimezoneUtil",
+    "WindowCounter",
+    "WindowStats",
+    "clear_format_cache",
+    "compile_format",
+    "every",
+    "format_cache_info",
+    "next_aligned",
+    "sleep_until",
+]
 
 __version__: Final[Literal["0.1.0"]] = "0.1.0"
+
+# The submodule of every public name that is imported on first access. Some of
+# them pull in asyncio, multiprocessing or concurrent.futures, which would
+# otherwise be paid for by every "import dateutil".
+_LAZY: Final[Dict[str, str]] = {
+    "CompactDate": ".core.compact",
+    "CompactDateTime": ".core.compact",
+    "Conflict": ".core.conflicts",
+    "ConflictDetector": ".core.conflicts",
+    "ConflictGroup": ".core.conflicts",
+    "DateJSON": ".core.serialization",
+    "DateJSONEncoder": ".core.serialization",
+    "Duration": ".core.duration",
+    "GapDetector": ".core.gaps",
+    "IngestStats": ".core.ingest",
+    "Instrumentation": ".core.instrumentation",
+    "IntervalSet": ".core.intervals",
+    "LatencyHistogram": ".core.profiling",
+    "NAT": ".core.ingest",
+    "NanoDuration": ".core.nanos",
+    "NanoTimestamp": ".core.nanos",
+    "PROFILER": ".core.profiling",
+    "ParallelIngest": ".core.ingest",
+    "Pipeline": ".core.pipeline",
+    "Profiler": ".core.profiling",
+    "RFCDate": ".core.rfc",
+    "RateLimiter": ".core.windows",
+    "ReorderBuffer": ".core.reorder",
+    "SeriesEvent": ".core.gaps",
+    "SharedTimestamps": ".core.shared",
+    "Timer": ".core.profiling",
+    "TimerWheel": ".core.timers",
+    "TimestampCodec": ".core.codec",
+    "TimestampColumn": ".core.column",
+    "TimestampDecoder": ".core.codec",
+    "TimestampEncoder": ".core.codec",
+    "TimestampMerge": ".core.merge",
+    "TimezoneUtil": ".core.timezone",
+    "WindowCounter": ".core.windows",
+    "WindowStats": ".core.windows",
+    "clear_format_cache": ".core.formatting",
+    "compile_format": ".core.formatting",
+    "every": ".core.timers",
+    "format_cache_info": ".core.formatting",
+    "next_aligned": ".core.timers",
+    "sleep_until": ".core.timers",
+}
+
+
+def __dir__() -> List[str]:
+    """
+    Returns the names of the package, including the lazily imported ones.
+
+    :return: The sorted names.
+    :rtype: List[str]
+    """
+
+    return sorted(set(globals()) | set(__all__))
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a public name from its submodule on first access.
+
+    The value is stored in the package namespace, so later lookups do not
+    call this function again.
+
+    :param name: The attribute name.
+    :type name: str
+
+    :return: The public object.
+    :rtype: Any
+
+    :raises AttributeError: If the name is not a public name of the package.
+    """
+
+    module: Optional[str] = _LAZY.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value: Any = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
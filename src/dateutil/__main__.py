@@ -0,0 +1,12 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import sys
+
+from .main import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,730 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from struct import Struct
+from typing import (
+    BinaryIO,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import DateDeserializationError, DateSerializationError
+
+
+__all__: Final[List[str]] = [
+    "TimestampCodec",
+    "TimestampDecoder",
+    "TimestampEncoder",
+]
+
+
+# The stream header: a magic number followed by the format version.
+MAGIC: Final[bytes] = b"DUTS"
+VERSION: Final[int] = 1
+
+# The default number of values per block.
+DEFAULT_BLOCK_SIZE: Final[int] = 4096
+
+# The block header: value count, first value, last value, payload length.
+_BLOCK_HEADER: Final[Struct] = Struct("<IqqI")
+
+_INT64_MIN: Final[int] = -(2**63)
+_INT64_MAX: Final[int] = 2**63 - 1
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+# A timestamp is either epoch microseconds or a datetime (naive values are taken as UTC).
+Timestamp = Union[int, datetime]
+
+
+def _to_micros(value: Timestamp) -> int:
+    """
+    Converts a timestamp to epoch microseconds.
+
+    :param value: The timestamp as epoch microseconds or a datetime object.
+    :type value: Timestamp
+
+    :return: The epoch microseconds.
+    :rtype: int
+    """
+
+    if isinstance(value, datetime):
+        return (value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND
+
+    return value
+
+
+def _write_varint(
+    buffer: bytearray,
+    value: int,
+) -> None:
+    """
+    Appends an unsigned LEB128 varint to a buffer.
+
+    :param buffer: The buffer to append to.
+    :type buffer: bytearray
+    :param value: The non-negative value to encode.
+    :type value: int
+
+    :return: None
+    :rtype: None
+    """
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def _encode_block(values: List[int]) -> bytes:
+    """
+    Encodes one block of values, including its header.
+
+    The payload is a sequence of varint tokens. The low bit of a token tells
+    a run of zero delta-of-deltas (1) from a single zigzag-encoded
+    delta-of-delta (0), so regular series cost a few bytes per block.
+
+    :param values: The values of the block (at least one).
+    :type values: List[int]
+
+    :return: The encoded block.
+    :rtype: bytes
+
+    :raises DateSerializationError: If a value does not fit into a signed 64-bit integer.
+    """
+
+    if min(values) < _INT64_MIN or max(values) > _INT64_MAX:
+        raise DateSerializationError(
+            "Timestamps must fit into a signed 64-bit integer.",
+        )
+
+    payload: bytearray = bytearray()
+    previous: int = values[0]
+    delta: int = 0
+    zeros: int = 0
+
+    for value in values[1:]:
+        current: int = value - previous
+        dod: int = current - delta
+
+        previous = value
+        delta = current
+
+        if not dod:
+            zeros += 1
+            continue
+
+        if zeros:
+            _write_varint(payload, (zeros << 1) | 1)
+            zeros = 0
+
+        # Zigzag encoding maps small negative and positive values to small codes.
+        _write_varint(payload, (dod << 2) if dod >= 0 else ((-dod << 2) - 2))
+
+    if zeros:
+        _write_varint(payload, (zeros << 1) | 1)
+
+    return _BLOCK_HEADER.pack(len(values), values[0], values[-1], len(payload)) + payload
+
+
+def _decode_block(
+    count: int,
+    first: int,
+    payload: Union[bytes, memoryview],
+) -> array:
+    """
+    Decodes the payload of one block.
+
+    :param count: The number of values in the block.
+    :type count: int
+    :param first: The first value of the block.
+    :type first: int
+    :param payload: The encoded payload.
+    :type payload: Union[bytes, memoryview]
+
+    :return: The decoded values.
+    :rtype: array
+
+    :raises DateDeserializationError: If the payload is corrupt.
+    """
+
+    data: bytes = bytes(payload)
+    end: int = len(data)
+    result: array = array("q", (first,))
+    append = result.append
+    extend = result.extend
+
+    previous: int = first
+    delta: int = 0
+    position: int = 0
+
+    try:
+        while position < end:
+            token: int = data[position]
+            position += 1
+
+            # Multi-byte varints are rare for regular series.
+            if token > 0x7F:
+                token &= 0x7F
+                shift: int = 7
+
+                while True:
+                    byte: int = data[position]
+                    position += 1
+                    token |= (byte & 0x7F) << shift
+
+                    if byte < 0x80:
+                        break
+
+                    shift += 7
+
+            if token & 1:
+                # A run of values that continue the current delta.
+                run: int = token >> 1
+
+                if delta:
+                    extend(range(previous + delta, previous + delta * (run + 1), delta))
+                else:
+                    extend(array("q", (previous,)) * run)
+
+                previous += delta * run
+            else:
+                code: int = token >> 1
+                delta += (code >> 1) ^ -(code & 1)
+                previous += delta
+                append(previous)
+    except (IndexError, OverflowError) as e:
+        raise DateDeserializationError(
+            "Corrupt timestamp block payload.",
+        ) from e
+
+    if len(result) != count:
+        raise DateDeserializationError(
+            f"Corrupt timestamp block: expected {count} values, decoded {len(result)}.",
+        )
+
+    return result
+
+
+class TimestampEncoder:
+    """
+    A streaming encoder for timestamp sequences.
+
+    Values (epoch microseconds or datetime objects) are buffered into blocks,
+    and every full block is delta-of-delta encoded and written out, either to
+    a binary stream or to an internal buffer returned by close().
+    """
+
+    def __init__(
+        self,
+        stream: Optional[BinaryIO] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        """
+        Initializes the TimestampEncoder and writes the stream header.
+
+        :param stream: The binary stream to write to (default is an internal buffer).
+        :type stream: Optional[BinaryIO]
+        :param block_size: The number of values per block. Defaults to 4096.
+        :type block_size: int
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If the block size is not positive.
+        """
+
+        if block_size <= 0:
+            raise ValueError(
+                f"Invalid value for 'block_size': {block_size}. Must be positive.",
+            )
+
+        self.block_size: int = block_size
+        self.count: int = 0
+
+        self._stream: Optional[BinaryIO] = stream
+        self._buffer: bytearray = bytearray()
+        self._pending: List[int] = []
+        self._closed: bool = False
+
+        self._emit(MAGIC + bytes((VERSION,)))
+
+    def __enter__(self) -> "TimestampEncoder":
+        """
+        Returns the encoder for use in a with block.
+
+        :return: The encoder itself.
+        :rtype: TimestampEncoder
+        """
+
+        return self
+
+    def __exit__(
+        self,
+        *exc_info: object,
+    ) -> None:
+        """
+        Flushes the last block when leaving a with block.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.close()
+
+    def close(self) -> bytes:
+        """
+        Flushes the last (partial) block and closes the encoder.
+
+        :return: The encoded data if no stream was given, otherwise b"".
+        :rtype: bytes
+        """
+
+        if not self._closed:
+            self._flush()
+            self._closed = True
+
+        return bytes(self._buffer)
+
+    def write(
+        self,
+        value: Timestamp,
+    ) -> None:
+        """
+        Adds one timestamp.
+
+        :param value: The timestamp as epoch microseconds or a datetime object (naive values are UTC).
+        :type value: Timestamp
+
+        :return: None
+        :rtype: None
+
+        :raises DateSerializationError: If the encoder is closed or a block cannot be encoded.
+        """
+
+        self.write_many((value,))
+
+    def write_many(
+        self,
+        values: Iterable[Timestamp],
+    ) -> None:
+        """
+        Adds a sequence of timestamps.
+
+        :param values: The timestamps as epoch microseconds or datetime objects (naive values are UTC).
+        :type values: Iterable[Timestamp]
+
+        :return: None
+        :rtype: None
+
+        :raises DateSerializationError: If the encoder is closed or a block cannot be encoded.
+        """
+
+        if self._closed:
+            raise DateSerializationError(
+                "Cannot write to a closed TimestampEncoder.",
+            )
+
+        pending: List[int] = self._pending
+
+        for value in values:
+            pending.append(_to_micros(value))
+
+            if len(pending) >= self.block_size:
+                self._flush()
+                pending = self._pending
+
+    def _emit(
+        self,
+        data: bytes,
+    ) -> None:
+        """
+        Writes encoded data to the stream or the internal buffer.
+
+        :param data: The encoded data.
+        :type data: bytes
+
+        :return: None
+        :rtype: None
+        """
+
+        if self._stream is None:
+            self._buffer += data
+        else:
+            self._stream.write(data)
+
+    def _flush(self) -> None:
+        """
+        Encodes and writes the pending values as one block.
+
+        :return: None
+        :rtype: None
+        """
+
+        if not self._pending:
+            return
+
+        self._emit(_encode_block(self._pending))
+
+        self.count += len(self._pending)
+        self._pending = []
+
+
+class TimestampDecoder:
+    """
+    A random-access decoder for encoded timestamp sequences.
+
+    Only the block headers are read up front. Individual values, blocks or
+    value ranges are decoded on demand, and the most recently decoded block
+    is cached for sequential indexing.
+    """
+
+    def __init__(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+    ) -> None:
+        """
+        Initializes the TimestampDecoder by indexing the block headers.
+
+        :param data: The encoded data.
+        :type data: Union[bytes, bytearray, memoryview]
+
+        :return: None
+        :rtype: None
+
+        :raises DateDeserializationError: If the data is not a valid timestamp stream.
+        """
+
+        self._data: memoryview = memoryview(data).cast("B")
+
+        # (payload offset, payload length, count, first value, last value) per block.
+        self._blocks: List[Tuple[int, int, int, int, int]] = []
+
+        # The index of the first value of every block, plus the total count.
+        self._starts: List[int] = [0]
+
+        self._cached: Tuple[int, Optional[array]] = (-1, None)
+
+        if bytes(self._data[: len(MAGIC)]) != MAGIC:
+            raise DateDeserializationError(
+                "Not a timestamp stream (bad magic number).",
+            )
+
+        if len(self._data) <= len(MAGIC) or self._data[len(MAGIC)] != VERSION:
+            raise DateDeserializationError(
+                "Unsupported timestamp stream version.",
+            )
+
+        position: int = len(MAGIC) + 1
+
+        while position < len(self._data):
+            if position + _BLOCK_HEADER.size > len(self._data):
+                raise DateDeserializationError(
+                    "Truncated timestamp block header.",
+                )
+
+            count, first, last, length = _BLOCK_HEADER.unpack_from(self._data, position)
+            position += _BLOCK_HEADER.size
+
+            if position + length > len(self._data):
+                raise DateDeserializationError(
+                    "Truncated timestamp block payload.",
+                )
+
+            self._blocks.append((position, length, count, first, last))
+            self._starts.append(self._starts[-1] + count)
+
+            position += length
+
+    def __getitem__(
+        self,
+        index: int,
+    ) -> int:
+        """
+        Returns the value at an index.
+
+        :param index: The index (negative indices count from the end).
+        :type index: int
+
+        :return: The value in epoch microseconds.
+        :rtype: int
+
+        :raises IndexError: If the index is out of range.
+        """
+
+        total: int = len(self)
+
+        if index < 0:
+            index += total
+
+        if not 0 <= index < total:
+            raise IndexError("timestamp index out of range")
+
+        number: int = bisect_right(self._starts, index) - 1
+
+        return self.block(number)[index - self._starts[number]]
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterates over every value.
+
+        :return: An iterator over the values in epoch microseconds.
+        :rtype: Iterator[int]
+        """
+
+        for number in range(len(self._blocks)):
+            yield from self.block(number)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of values.
+
+        :return: The number of values.
+        :rtype: int
+        """
+
+        return self._starts[-1]
+
+    def block(
+        self,
+        number: int,
+    ) -> array:
+        """
+        Decodes one block.
+
+        :param number: The block number.
+        :type number: int
+
+        :return: The values of the block.
+        :rtype: array
+
+        :raises DateDeserializationError: If the block is corrupt.
+        """
+
+        if self._cached[0] == number:
+            return self._cached[1]
+
+        offset, length, count, first, _ = self._blocks[number]
+
+        values: array = _decode_block(
+            count=count,
+            first=first,
+            payload=self._data[offset : offset + length],
+        )
+
+        self._cached = (number, values)
+
+        return values
+
+    def block_count(self) -> int:
+        """
+        Returns the number of blocks.
+
+        :return: The number of blocks.
+        :rtype: int
+        """
+
+        return len(self._blocks)
+
+    def decode(self) -> array:
+        """
+        Decodes every value.
+
+        :return: All values in epoch microseconds.
+        :rtype: array
+
+        :raises DateDeserializationError: If a block is corrupt.
+        """
+
+        result: array = array("q")
+
+        for number in range(len(self._blocks)):
+            result.extend(self.block(number))
+
+        return result
+
+    def between(
+        self,
+        start: Timestamp,
+        end: Timestamp,
+    ) -> array:
+        """
+        Returns the values within [start, end] of a sorted sequence.
+
+        Blocks whose first/last values lie outside the range are skipped
+        without being decoded.
+
+        :param start: The lower bound (inclusive).
+        :type start: Timestamp
+        :param end: The upper bound (inclusive).
+        :type end: Timestamp
+
+        :return: The matching values in epoch microseconds.
+        :rtype: array
+        """
+
+        low: int = _to_micros(start)
+        high: int = _to_micros(end)
+        result: array = array("q")
+
+        for number, (_, _, _, first, last) in enumerate(self._blocks):
+            if last < low:
+                continue
+
+            if first > high:
+                break
+
+            values: array = self.block(number)
+            result.extend(
+                values[bisect_left(values, low) : bisect_right(values, high)]
+            )
+
+        return result
+
+
+class TimestampCodec:
+    """
+    Compact binary serialization of timestamp sequences.
+
+    Values are stored as epoch microseconds in blocks: a fixed header (count,
+    first value, last value, payload length) followed by delta-of-delta,
+    zigzag varint encoded payload with zero-run tokens. Regular sorted series
+    shrink to a few bytes per block and decode through C-level range extension.
+    """
+
+    @classmethod
+    def decode(
+        cls,
+        data: Union[bytes, bytearray, memoryview],
+    ) -> array:
+        """
+        Decodes a timestamp stream.
+
+        :param data: The encoded data.
+        :type data: Union[bytes, bytearray, memoryview]
+
+        :return: The values in epoch microseconds.
+        :rtype: array
+
+        :raises DateDeserializationError: If the data is not a valid timestamp stream.
+        """
+
+        return TimestampDecoder(data).decode()
+
+    @classmethod
+    def encode(
+        cls,
+        values: Iterable[Timestamp],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> bytes:
+        """
+        Encodes a sequence of timestamps.
+
+        :param values: The timestamps as epoch microseconds or datetime objects (naive values are UTC).
+        :type values: Iterable[Timestamp]
+        :param block_size: The number of values per block. Defaults to 4096.
+        :type block_size: int
+
+        :return: The encoded data.
+        :rtype: bytes
+
+        :raises DateSerializationError: If a value does not fit into a signed 64-bit integer.
+        """
+
+        encoder: TimestampEncoder = TimestampEncoder(block_size=block_size)
+        encoder.write_many(values)
+
+        return encoder.close()
+
+    @classmethod
+    def iter_decode(
+        cls,
+        stream: BinaryIO,
+    ) -> Iterator[array]:
+        """
+        Decodes a timestamp stream from a binary file block by block.
+
+        :param stream: The binary stream to read from.
+        :type stream: BinaryIO
+
+        :return: An iterator over the decoded blocks.
+        :rtype: Iterator[array]
+
+        :raises DateDeserializationError: If the stream is not a valid timestamp stream.
+        """
+
+        header: bytes = stream.read(len(MAGIC) + 1)
+
+        if header[: len(MAGIC)] != MAGIC:
+            raise DateDeserializationError(
+                "Not a timestamp stream (bad magic number).",
+            )
+
+        if header[len(MAGIC) :] != bytes((VERSION,)):
+            raise DateDeserializationError(
+                "Unsupported timestamp stream version.",
+            )
+
+        while True:
+            raw: bytes = stream.read(_BLOCK_HEADER.size)
+
+            if not raw:
+                return
+
+            if len(raw) != _BLOCK_HEADER.size:
+                raise DateDeserializationError(
+                    "Truncated timestamp block header.",
+                )
+
+            count, first, _, length = _BLOCK_HEADER.unpack(raw)
+            payload: bytes = stream.read(length)
+
+            if len(payload) != length:
+                raise DateDeserializationError(
+                    "Truncated timestamp block payload.",
+                )
+
+            yield _decode_block(
+                count=count,
+                first=first,
+                payload=payload,
+            )
+
+    @classmethod
+    def to_datetimes(
+        cls,
+        values: Iterable[int],
+        tz: Optional[timezone] = None,
+    ) -> List[datetime]:
+        """
+        Converts epoch microseconds back to datetime objects.
+
+        :param values: The epoch microseconds.
+        :type values: Iterable[int]
+        :param tz: The zone of the result (default is naive UTC).
+        :type tz: Optional[timezone]
+
+        :return: The datetime objects.
+        :rtype: List[datetime]
+        """
+
+        epoch: datetime = _EPOCH if tz is None else _EPOCH_UTC
+        result: List[datetime] = [epoch + timedelta(microseconds=value) for value in values]
+
+        if tz is not None and tz is not timezone.utc:
+            return [value.astimezone(tz) for value in result]
+
+        return result
@@ -0,0 +1,613 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from struct import Struct
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import DateDeserializationError, DateSerializationError
+
+
+__all__: Final[List[str]] = ["TimestampColumn"]
+
+
+# The file header: magic, version, flags, unit, value count, block size,
+# index offset, data offset, minimum, maximum (64 bytes, little-endian).
+MAGIC: Final[bytes] = b"DUTC"
+VERSION: Final[int] = 1
+
+_HEADER: Final[Struct] = Struct("<4sHH2s6xQQQQqq")
+
+# The header flags.
+FLAG_SORTED: Final[int] = 1
+
+# The default number of values per index block (512 KiB of data).
+DEFAULT_BLOCK_SIZE: Final[int] = 65536
+
+# The epoch units a column can hold.
+EpochUnit = Literal["s", "ms", "us", "ns"]
+
+_UNITS: Final[Dict[str, timedelta]] = {
+    "s": timedelta(seconds=1),
+    "ms": timedelta(milliseconds=1),
+    "us": timedelta(microseconds=1),
+    "ns": timedelta(microseconds=1),
+}
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# A bound is an epoch number in the column's unit or a datetime (naive values are taken as UTC).
+Bound = Union[int, datetime]
+
+
+def epoch_bound(
+    bound: Bound,
+    unit: str,
+) -> int:
+    """
+    Converts a range bound to an epoch value in a unit.
+
+    Datetime bounds between two units are rounded up to the next unit: a
+    value v lies in [start, end) exactly when ceil(start) <= v < ceil(end),
+    since the stored values are integers.
+
+    :param bound: The bound as an epoch value or a datetime object (naive values are taken as UTC).
+    :type bound: Union[int, datetime]
+    :param unit: The epoch unit ("s", "ms", "us" or "ns").
+    :type unit: str
+
+    :return: The epoch value.
+    :rtype: int
+    """
+
+    if not isinstance(bound, datetime):
+        return bound
+
+    value: int = -(((_EPOCH if bound.tzinfo is None else _EPOCH_UTC) - bound) // _UNITS[unit])
+
+    return value * 1000 if unit == "ns" else value
+
+
+class TimestampColumn:
+    """
+    A memory-mapped, read-only column of int64 epoch values.
+
+    The file holds a 64-byte header, the little-endian values, and an
+    index with the minimum and maximum of every block. Opening a column
+    maps the file instead of reading it, so load time does not depend on
+    its size and the operating system pages values in only when they are
+    touched. Range queries consult the in-memory block index first: on
+    sorted columns they binary-search a single block and return a
+    zero-copy slice, on unsorted ones they scan only the blocks whose
+    min/max range overlaps the query.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+    ) -> None:
+        """
+        Initializes the TimestampColumn by mapping a column file.
+
+        :param path: The column file.
+        :type path: Union[str, os.PathLike[str]]
+
+        :return: None
+        :rtype: None
+
+        :raises DateDeserializationError: If the file is not a valid column file.
+        """
+
+        self.path: str = os.fspath(path)
+
+        with open(self.path, "rb") as file:
+            header: bytes = file.read(_HEADER.size)
+
+            if len(header) < _HEADER.size:
+                raise DateDeserializationError(
+                    f"Invalid column file: {self.path}. The header is truncated.",
+                )
+
+            (
+                magic,
+                version,
+                flags,
+                unit,
+                self.count,
+                self.block_size,
+                index_offset,
+                data_offset,
+                minimum,
+                maximum,
+            ) = _HEADER.unpack(header)
+
+            if magic != MAGIC or version != VERSION:
+                raise DateDeserializationError(
+                    f"Invalid column file: {self.path}. Unknown magic or version.",
+                )
+
+            self.unit: str = unit.decode("ascii").strip()
+            self.sorted: bool = bool(flags & FLAG_SORTED)
+
+            # The smallest and largest value (None for an empty column).
+            self.minimum: Optional[int] = minimum if self.count else None
+            self.maximum: Optional[int] = maximum if self.count else None
+
+            blocks: int = -(-self.count // self.block_size)
+            expected: int = index_offset + blocks * 16
+
+            if self.unit not in _UNITS or os.fstat(file.fileno()).st_size < expected:
+                raise DateDeserializationError(
+                    f"Invalid column file: {self.path}. The unit or size is inconsistent.",
+                )
+
+            self._map: Optional[mmap.mmap] = None
+
+            if self.count:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # The block index, kept in memory: minimums and maximums per block.
+        self._minimums: array = array("q")
+        self._maximums: array = array("q")
+
+        if self._map is None:
+            self.values: memoryview = memoryview(b"").cast("q")
+            return
+
+        index: array = array("q", self._map[index_offset : index_offset + blocks * 16])
+        data: memoryview = memoryview(self._map)[data_offset : data_offset + self.count * 8]
+
+        if sys.byteorder == "big":
+            # The file is little-endian; big-endian hosts pay for one copy.
+            index.byteswap()
+            swapped: array = array("q", data.tobytes())
+            swapped.byteswap()
+            data.release()
+            self.values = memoryview(swapped)
+        else:
+            self.values = data.cast("q")
+
+        self._minimums = index[0::2]
+        self._maximums = index[1::2]
+
+    def __enter__(self) -> "TimestampColumn":
+        """
+        :return: The column itself.
+        :rtype: TimestampColumn
+        """
+
+        return self
+
+    def __exit__(
+        self,
+        *exc_info: Any,
+    ) -> None:
+        """
+        Closes the column when the context ends.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.close()
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[int, memoryview]:
+        """
+        :return: The value at an index, or a zero-copy view of a slice.
+        :rtype: Union[int, memoryview]
+        """
+
+        return self.values[index]
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        :return: An iterator over the values.
+        :rtype: Iterator[int]
+        """
+
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of values.
+        :rtype: int
+        """
+
+        return self.count
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the column.
+
+        :return: The representation, including the path, size and unit.
+        :rtype: str
+        """
+
+        return f"TimestampColumn({self.path!r}, count={self.count}, unit={self.unit!r}, sorted={self.sorted})"
+
+    def between(
+        self,
+        start: Bound,
+        end: Bound,
+    ) -> Union[memoryview, array]:
+        """
+        Returns the values in [start, end).
+
+        :param start: The inclusive lower bound.
+        :type start: Union[int, datetime]
+        :param end: The exclusive upper bound.
+        :type end: Union[int, datetime]
+
+        :return: A zero-copy view for sorted columns, or an array('q') of the matches in file order otherwise.
+        :rtype: Union[memoryview, array]
+        """
+
+        low: int = self._epoch(start)
+        high: int = self._epoch(end)
+
+        if self.sorted:
+            first, last = self._span(low, high)
+
+            return self.values[first:last]
+
+        matches: array = array("q")
+
+        for block in self._blocks(low, high):
+            offset: int = block * self.block_size
+            view: memoryview = self.values[offset : offset + self.block_size]
+
+            # Blocks that lie entirely inside the range are copied without comparisons.
+            if low <= self._minimums[block] and self._maximums[block] < high:
+                matches.frombytes(view.tobytes())
+            else:
+                matches.extend(value for value in view if low <= value < high)
+
+        return matches
+
+    def close(self) -> None:
+        """
+        Releases the values view and unmaps the file.
+
+        Views returned by between or slicing must be released (or dropped) first.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.values.release()
+
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def count_between(
+        self,
+        start: Bound,
+        end: Bound,
+    ) -> int:
+        """
+        Counts the values in [start, end) without materialising them.
+
+        :param start: The inclusive lower bound.
+        :type start: Union[int, datetime]
+        :param end: The exclusive upper bound.
+        :type end: Union[int, datetime]
+
+        :return: The number of values in the range.
+        :rtype: int
+        """
+
+        low: int = self._epoch(start)
+        high: int = self._epoch(end)
+
+        if self.sorted:
+            first, last = self._span(low, high)
+
+            return last - first
+
+        count: int = 0
+
+        for block in self._blocks(low, high):
+            if low <= self._minimums[block] and self._maximums[block] < high:
+                count += min(self.block_size, self.count - block * self.block_size)
+                continue
+
+            offset: int = block * self.block_size
+            count += sum(1 for value in self.values[offset : offset + self.block_size] if low <= value < high)
+
+        return count
+
+    def to_datetime(
+        self,
+        index: int,
+    ) -> datetime:
+        """
+        Converts one value to an aware UTC datetime object (nanoseconds are truncated).
+
+        :param index: The index of the value.
+        :type index: int
+
+        :return: The datetime object.
+        :rtype: datetime
+        """
+
+        value: int = self.values[index]
+
+        if self.unit == "ns":
+            value //= 1000
+
+        return _EPOCH_UTC + value * _UNITS[self.unit]
+
+    @classmethod
+    def write(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        values: Iterable[int],
+        unit: EpochUnit = "us",
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> int:
+        """
+        Writes a column file, streaming the values block by block.
+
+        Buffers of int64 values (array('q'), memoryview, or another column)
+        are written block by block without per-value conversion. Whether
+        the values are sorted is detected while writing.
+
+        :param path: The column file to create.
+        :type path: Union[str, os.PathLike[str]]
+        :param values: The epoch values in the given unit.
+        :type values: Iterable[int]
+        :param unit: The epoch unit of the values. Defaults to "us".
+        :type unit: Literal["s", "ms", "us", "ns"]
+        :param block_size: The number of values per index block. Defaults to 65536.
+        :type block_size: int
+
+        :return: The number of values written.
+        :rtype: int
+
+        :raises ValueError: If the unit or block size is invalid.
+        :raises DateSerializationError: If a value does not fit into an int64.
+        """
+
+        if unit not in _UNITS:
+            raise ValueError(
+                f"Invalid value for 'unit': {unit}. Must be one of: 's', 'ms', 'us', 'ns'.",
+            )
+
+        if block_size <= 0:
+            raise ValueError(
+                f"Invalid value for 'block_size': {block_size}. Must be positive.",
+            )
+
+        if isinstance(values, TimestampColumn):
+            values = values.values
+
+        index: array = array("q")
+        count: int = 0
+        is_sorted: bool = True
+        previous: Optional[int] = None
+
+        # The file is written under a temporary name and renamed into place
+        # once complete, so a failure never leaves a partial column behind.
+        path = os.fspath(path)
+        temporary: str = f"{path}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporary, "wb") as file:
+                # The header is rewritten with the final counts at the end.
+                file.write(bytes(_HEADER.size))
+
+                for block in cls._chunks(values, block_size):
+                    if sys.byteorder == "big":
+                        block.byteswap()
+                        file.write(block.tobytes())
+                        block.byteswap()
+                    else:
+                        file.write(block)
+
+                    if is_sorted:
+                        # Timsort runs in linear time over sorted input, which is the common case.
+                        ordered: List[int] = sorted(block)
+                        is_sorted = (previous is None or previous <= ordered[0]) and block.tolist() == ordered
+
+                        index.append(ordered[0])
+                        index.append(ordered[-1])
+                    else:
+                        index.append(min(block))
+                        index.append(max(block))
+
+                    previous = block[-1]
+                    count += len(block)
+
+                index_offset: int = _HEADER.size + count * 8
+
+                if sys.byteorder == "big":
+                    index.byteswap()
+
+                file.write(index.tobytes())
+
+                if sys.byteorder == "big":
+                    index.byteswap()
+
+                file.seek(0)
+                file.write(
+                    _HEADER.pack(
+                        MAGIC,
+                        VERSION,
+                        FLAG_SORTED if is_sorted else 0,
+                        unit.ljust(2).encode("ascii"),
+                        count,
+                        block_size,
+                        index_offset,
+                        _HEADER.size,
+                        min(index[0::2]) if count else 0,
+                        max(index[1::2]) if count else 0,
+                    )
+                )
+
+            os.replace(temporary, path)
+        except BaseException:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+            raise
+
+        return count
+
+    def _blocks(
+        self,
+        low: int,
+        high: int,
+    ) -> Iterator[int]:
+        """
+        Yields the numbers of the blocks whose min/max range overlaps [low, high).
+
+        :param low: The inclusive lower bound.
+        :type low: int
+        :param high: The exclusive upper bound.
+        :type high: int
+
+        :return: An iterator over the block numbers.
+        :rtype: Iterator[int]
+        """
+
+        for block, (minimum, maximum) in enumerate(zip(self._minimums, self._maximums)):
+            if minimum < high and maximum >= low:
+                yield block
+
+    @classmethod
+    def _chunks(
+        cls,
+        values: Iterable[int],
+        block_size: int,
+    ) -> Iterator[array]:
+        """
+        Splits the values into array('q') blocks.
+
+        :param values: The values, or a buffer of int64 values.
+        :type values: Iterable[int]
+        :param block_size: The number of values per block.
+        :type block_size: int
+
+        :return: An iterator over the blocks.
+        :rtype: Iterator[array]
+
+        :raises DateSerializationError: If a value does not fit into an int64.
+        """
+
+        try:
+            if isinstance(values, (array, memoryview)) and memoryview(values).format == "q":
+                view: memoryview = memoryview(values)
+
+                for offset in range(0, len(view), block_size):
+                    block: array = array("q")
+                    block.frombytes(view[offset : offset + block_size].tobytes())
+
+                    yield block
+
+                return
+
+            iterator: Iterator[int] = iter(values)
+
+            while True:
+                block = array("q", islice(iterator, block_size))
+
+                if not block:
+                    return
+
+                yield block
+        except OverflowError as e:
+            raise DateSerializationError(
+                "Invalid value: values must fit into a signed 64-bit integer.",
+            ) from e
+
+    def _epoch(
+        self,
+        bound: Bound,
+    ) -> int:
+        """
+        Converts a query bound to an epoch value in the column's unit.
+
+        Datetime bounds between two units are rounded up to the next unit.
+
+        :param bound: The bound as an epoch value or a datetime object.
+        :type bound: Union[int, datetime]
+
+        :return: The epoch value.
+        :rtype: int
+        """
+
+        return epoch_bound(bound, self.unit)
+
+    def _span(
+        self,
+        low: int,
+        high: int,
+    ) -> Tuple[int, int]:
+        """
+        Finds the index range of [low, high) in a sorted column.
+
+        The block index narrows each search to one block, so only the pages
+        of that block are touched.
+
+        :param low: The inclusive lower bound.
+        :type low: int
+        :param high: The exclusive upper bound.
+        :type high: int
+
+        :return: The (first, last) indices; last is exclusive.
+        :rtype: Tuple[int, int]
+        """
+
+        first: int = self._position(low)
+
+        return (first, max(first, self._position(high)))
+
+    def _position(
+        self,
+        value: int,
+    ) -> int:
+        """
+        Returns the index of the first value not less than a value, in a sorted column.
+
+        :param value: The value to search for.
+        :type value: int
+
+        :return: The insertion index.
+        :rtype: int
+        """
+
+        # The first block whose maximum reaches the value holds the position.
+        block: int = bisect_left(self._maximums, value)
+
+        if block >= len(self._maximums):
+            return self.count
+
+        offset: int = block * self.block_size
+
+        return offset + bisect_left(self.values[offset : offset + self.block_size], value)
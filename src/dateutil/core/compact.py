@@ -0,0 +1,1048 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Any, Callable, Final, List, Optional, Tuple, Union
+
+
+__all__: Final[List[str]] = ["CompactDate", "CompactDateTime"]
+
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# The proleptic Gregorian ordinal of 1970-01-01.
+_EPOCH_ORDINAL: Final[int] = _EPOCH.toordinal()
+
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY: Final[int] = 86_400_000_000
+
+
+class CompactDate(int):
+    """
+    An immutable date that is a proleptic Gregorian day ordinal.
+
+    The type is an int subclass without instance attributes, so a value is
+    a single object and hashing runs in C: large sets and dict keys of dates
+    stay small and fast. It mirrors the datetime interface (at midnight,
+    naive) closely enough to be passed to every DateUtil function; like
+    date, it ignores the sub-day part of added timedeltas. It does not
+    behave as a number: equality is only defined between CompactDate
+    objects (never with plain ints or CompactDateTime objects), ordering
+    and subtraction also accept date and datetime objects, and the int
+    operators raise TypeError.
+    """
+
+    __slots__ = ()
+
+    # Compact values are always naive.
+    tzinfo: Final[None] = None
+
+    hour: Final[int] = 0
+    minute: Final[int] = 0
+    second: Final[int] = 0
+    microsecond: Final[int] = 0
+
+    def __new__(
+        cls,
+        ordinal: int,
+    ) -> "CompactDate":
+        """
+        Creates the CompactDate.
+
+        :param ordinal: The proleptic Gregorian ordinal (1 is 0001-01-01).
+        :type ordinal: int
+
+        :return: The compact date.
+        :rtype: CompactDate
+
+        :raises ValueError: If the ordinal is outside the range of date.
+        """
+
+        if not 1 <= ordinal <= date.max.toordinal():
+            raise ValueError(
+                f"Invalid value for 'ordinal': {ordinal}. Must be between 1 and {date.max.toordinal()}.",
+            )
+
+        return int.__new__(cls, ordinal)
+
+    def __add__(
+        self,
+        other: Any,
+    ) -> "CompactDate":
+        """
+        Adds the whole days of a timedelta.
+
+        :param other: The timedelta to add.
+        :type other: timedelta
+
+        :return: The shifted date.
+        :rtype: CompactDate
+        """
+
+        if other.__class__ is timedelta:
+            return CompactDate(int(self) + other.days)
+
+        # Returning NotImplemented would let int.__add__ produce a plain int.
+        raise _unsupported("+", self, other)
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks whether two compact dates are equal.
+
+        :param other: The object to compare with.
+        :type other: object
+
+        :return: True if both are the same day, False otherwise (including for ints).
+        :rtype: bool
+        """
+
+        return other.__class__ is CompactDate and int.__eq__(self, other)
+
+    def __ge__(self, other: Any) -> bool:
+        """
+        :return: True if this date is on or after the other value.
+        :rtype: bool
+        """
+
+        return (int(self), 0) >= _date_key(self, other, ">=")
+
+    def __gt__(self, other: Any) -> bool:
+        """
+        :return: True if this date is after the other value.
+        :rtype: bool
+        """
+
+        return (int(self), 0) > _date_key(self, other, ">")
+
+    # The int hash is kept (in C); equal dates have equal ordinals.
+    __hash__ = int.__hash__
+
+    def __le__(self, other: Any) -> bool:
+        """
+        :return: True if this date is on or before the other value.
+        :rtype: bool
+        """
+
+        return (int(self), 0) <= _date_key(self, other, "<=")
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        :return: True if this date is before the other value.
+        :rtype: bool
+        """
+
+        return (int(self), 0) < _date_key(self, other, "<")
+
+    def __ne__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        :return: True unless the other object is the same CompactDate.
+        :rtype: bool
+        """
+
+        return not self.__eq__(other)
+
+    def __radd__(
+        self,
+        other: Any,
+    ) -> "CompactDate":
+        """
+        Adds the whole days of a timedelta (timedelta + CompactDate).
+
+        :param other: The timedelta to add.
+        :type other: timedelta
+
+        :return: The shifted date.
+        :rtype: CompactDate
+        """
+
+        if other.__class__ is timedelta:
+            return CompactDate(int(self) + other.days)
+
+        raise _unsupported("+", other, self)
+
+    def __format__(
+        self,
+        format_spec: str,
+    ) -> str:
+        """
+        :return: The date formatted with strftime, or as ISO 8601 for an empty format (like date).
+        :rtype: str
+        """
+
+        return self.strftime(format_spec) if format_spec else self.isoformat()
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """
+        Returns the pickling recipe of the date.
+
+        :return: The class and the constructor arguments.
+        :rtype: Tuple[type, Tuple[int]]
+        """
+
+        return (CompactDate, (int(self),))
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the date.
+
+        :return: The representation, including the ordinal.
+        :rtype: str
+        """
+
+        return f"CompactDate({int(self)})"
+
+    def __rsub__(
+        self,
+        other: Any,
+    ) -> timedelta:
+        """
+        Subtracts this date from a date or datetime object.
+
+        :param other: The date or datetime object.
+        :type other: Union[date, datetime]
+
+        :return: The difference.
+        :rtype: timedelta
+        """
+
+        if isinstance(other, datetime):
+            return other - self.to_datetime()
+
+        if isinstance(other, date):
+            return timedelta(days=other.toordinal() - int(self))
+
+        raise _unsupported("-", other, self)
+
+    def __str__(self) -> str:
+        """
+        Returns the ISO 8601 representation of the date.
+
+        :return: The date as YYYY-MM-DD.
+        :rtype: str
+        """
+
+        return self.isoformat()
+
+    def __sub__(
+        self,
+        other: Any,
+    ) -> Union["CompactDate", timedelta]:
+        """
+        Subtracts a timedelta, or computes the difference to another date.
+
+        :param other: The timedelta, CompactDate, date or datetime object to subtract.
+        :type other: Union[timedelta, CompactDate, date, datetime]
+
+        :return: The shifted date for a timedelta, otherwise the difference.
+        :rtype: Union[CompactDate, timedelta]
+        """
+
+        if other.__class__ is timedelta:
+            return CompactDate(int(self) - other.days)
+
+        if other.__class__ is CompactDate:
+            return timedelta(days=int(self) - int(other))
+
+        if isinstance(other, datetime):
+            return self.to_datetime() - other
+
+        if isinstance(other, date):
+            return timedelta(days=int(self) - other.toordinal())
+
+        raise _unsupported("-", self, other)
+
+    @property
+    def day(self) -> int:
+        """
+        :return: The day of the month.
+        :rtype: int
+        """
+
+        return self.to_date().day
+
+    @property
+    def month(self) -> int:
+        """
+        :return: The month.
+        :rtype: int
+        """
+
+        return self.to_date().month
+
+    @property
+    def ordinal(self) -> int:
+        """
+        :return: The proleptic Gregorian ordinal as a plain int.
+        :rtype: int
+        """
+
+        return int(self)
+
+    @property
+    def year(self) -> int:
+        """
+        :return: The year.
+        :rtype: int
+        """
+
+        return self.to_date().year
+
+    @classmethod
+    def from_date(
+        cls,
+        value: Union[date, datetime],
+    ) -> "CompactDate":
+        """
+        Creates a CompactDate from a date or datetime object (the time of day is dropped).
+
+        :param value: The date or datetime object.
+        :type value: Union[date, datetime]
+
+        :return: The compact date.
+        :rtype: CompactDate
+        """
+
+        return cls(value.toordinal())
+
+    @classmethod
+    def today(cls) -> "CompactDate":
+        """
+        Returns the current local date.
+
+        :return: The compact date of today.
+        :rtype: CompactDate
+        """
+
+        return cls(date.today().toordinal())
+
+    def date(self) -> date:
+        """
+        :return: The date object of the date.
+        :rtype: date
+        """
+
+        return self.to_date()
+
+    def isoformat(self) -> str:
+        """
+        :return: The date as YYYY-MM-DD.
+        :rtype: str
+        """
+
+        return self.to_date().isoformat()
+
+    def replace(
+        self,
+        **kwargs: Any,
+    ) -> "CompactDate":
+        """
+        Returns a copy with the given fields replaced (like date.replace).
+
+        :param kwargs: The fields to replace ("year", "month", "day").
+        :type kwargs: Any
+
+        :return: The new date.
+        :rtype: CompactDate
+
+        :raises ValueError: If the resulting date is invalid.
+        """
+
+        return CompactDate(self.to_date().replace(**kwargs).toordinal())
+
+    def strftime(
+        self,
+        format: str,
+    ) -> str:
+        """
+        Formats the date like date.strftime.
+
+        :param format: The strftime pattern.
+        :type format: str
+
+        :return: The formatted date.
+        :rtype: str
+        """
+
+        return self.to_date().strftime(format)
+
+    def to_date(self) -> "date":
+        """
+        Converts the compact date to a date object.
+
+        :return: The date object.
+        :rtype: date
+        """
+
+        return date.fromordinal(int(self))
+
+    def to_datetime(self) -> datetime:
+        """
+        Converts the compact date to a naive datetime object at midnight.
+
+        :return: The datetime object.
+        :rtype: datetime
+        """
+
+        return datetime.combine(date.fromordinal(int(self)), time())
+
+    def toordinal(self) -> int:
+        """
+        :return: The proleptic Gregorian ordinal.
+        :rtype: int
+        """
+
+        return int(self)
+
+    def utcoffset(self) -> None:
+        """
+        :return: None, because compact dates are naive.
+        :rtype: None
+        """
+
+        return None
+
+    def weekday(self) -> int:
+        """
+        :return: The day of the week (Monday is 0).
+        :rtype: int
+        """
+
+        return (int(self) + 6) % 7
+
+
+class CompactDateTime(int):
+    """
+    An immutable UTC timestamp that is a count of epoch microseconds.
+
+    The value converts losslessly to and from datetime objects (aware values
+    are converted to UTC, naive values are taken as UTC). The type is an int
+    subclass without instance attributes, so a value is a single object and
+    hashing runs in C, and it mirrors the naive datetime interface, so it
+    can be passed to every DateUtil function. It does not behave as a
+    number: equality is only defined between CompactDateTime objects,
+    ordering and subtraction also accept datetime objects, the int
+    operators raise TypeError, and every value is truthy, including the
+    epoch itself.
+    """
+
+    __slots__ = ()
+
+    # Compact values are always naive (UTC).
+    tzinfo: Final[None] = None
+
+    def __new__(
+        cls,
+        micros: int,
+    ) -> "CompactDateTime":
+        """
+        Creates the CompactDateTime.
+
+        :param micros: The microseconds since 1970-01-01T00:00:00 UTC.
+        :type micros: int
+
+        :return: The compact timestamp.
+        :rtype: CompactDateTime
+        """
+
+        return int.__new__(cls, micros)
+
+    def __add__(
+        self,
+        other: Any,
+    ) -> "CompactDateTime":
+        """
+        Adds a timedelta.
+
+        :param other: The timedelta to add.
+        :type other: timedelta
+
+        :return: The shifted timestamp.
+        :rtype: CompactDateTime
+        """
+
+        if other.__class__ is timedelta:
+            return CompactDateTime(int(self) + other // _MICROSECOND)
+
+        # Returning NotImplemented would let int.__add__ produce a plain int.
+        raise _unsupported("+", self, other)
+
+    def __bool__(self) -> bool:
+        """
+        :return: True, because a timestamp is never empty (not even the epoch, unlike the int 0).
+        :rtype: bool
+        """
+
+        return True
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks whether two compact timestamps are equal.
+
+        :param other: The object to compare with.
+        :type other: object
+
+        :return: True if both are the same instant, False otherwise (including for ints).
+        :rtype: bool
+        """
+
+        return other.__class__ is CompactDateTime and int.__eq__(self, other)
+
+    def __format__(
+        self,
+        format_spec: str,
+    ) -> str:
+        """
+        :return: The timestamp formatted with strftime, or like str for an empty format (like datetime).
+        :rtype: str
+        """
+
+        return self.strftime(format_spec) if format_spec else str(self)
+
+    def __ge__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is at or after the other value.
+        :rtype: bool
+        """
+
+        return int(self) >= _micros_key(self, other, ">=")
+
+    def __gt__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is after the other value.
+        :rtype: bool
+        """
+
+        return int(self) > _micros_key(self, other, ">")
+
+    # The int hash is kept (in C); equal timestamps have equal microseconds.
+    __hash__ = int.__hash__
+
+    def __le__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is at or before the other value.
+        :rtype: bool
+        """
+
+        return int(self) <= _micros_key(self, other, "<=")
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is before the other value.
+        :rtype: bool
+        """
+
+        return int(self) < _micros_key(self, other, "<")
+
+    def __ne__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        :return: True unless the other object is the same CompactDateTime.
+        :rtype: bool
+        """
+
+        return not self.__eq__(other)
+
+    def __radd__(
+        self,
+        other: Any,
+    ) -> "CompactDateTime":
+        """
+        Adds a timedelta (timedelta + CompactDateTime).
+
+        :param other: The timedelta to add.
+        :type other: timedelta
+
+        :return: The shifted timestamp.
+        :rtype: CompactDateTime
+        """
+
+        if other.__class__ is timedelta:
+            return CompactDateTime(int(self) + other // _MICROSECOND)
+
+        raise _unsupported("+", other, self)
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """
+        Returns the pickling recipe of the timestamp.
+
+        :return: The class and the constructor arguments.
+        :rtype: Tuple[type, Tuple[int]]
+        """
+
+        return (CompactDateTime, (int(self),))
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the timestamp.
+
+        :return: The representation, including the epoch microseconds.
+        :rtype: str
+        """
+
+        return f"CompactDateTime({int(self)})"
+
+    def __rsub__(
+        self,
+        other: Any,
+    ) -> timedelta:
+        """
+        Subtracts this timestamp from a datetime object.
+
+        :param other: The datetime object.
+        :type other: datetime
+
+        :return: The difference.
+        :rtype: timedelta
+        """
+
+        return timedelta(microseconds=_micros_key(self, other, "-", reflected=True) - int(self))
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the timestamp, like str(datetime).
+
+        :return: The timestamp as YYYY-MM-DD HH:MM:SS[.ffffff].
+        :rtype: str
+        """
+
+        return str(self.to_datetime())
+
+    def __sub__(
+        self,
+        other: Any,
+    ) -> Union["CompactDateTime", timedelta]:
+        """
+        Subtracts a timedelta, or computes the difference to another timestamp.
+
+        :param other: The timedelta, CompactDateTime or datetime object to subtract.
+        :type other: Union[timedelta, CompactDateTime, datetime]
+
+        :return: The shifted timestamp for a timedelta, otherwise the difference.
+        :rtype: Union[CompactDateTime, timedelta]
+        """
+
+        if other.__class__ is timedelta:
+            return CompactDateTime(int(self) - other // _MICROSECOND)
+
+        return timedelta(microseconds=int(self) - _micros_key(self, other, "-"))
+
+    @property
+    def day(self) -> int:
+        """
+        :return: The day of the month.
+        :rtype: int
+        """
+
+        return self.date().day
+
+    @property
+    def epoch_seconds(self) -> int:
+        """
+        :return: The whole seconds since the epoch (rounded down).
+        :rtype: int
+        """
+
+        return int(self) // 1_000_000
+
+    @property
+    def hour(self) -> int:
+        """
+        :return: The hour.
+        :rtype: int
+        """
+
+        return int(self) % _MICROSECONDS_PER_DAY // 3_600_000_000
+
+    @property
+    def microsecond(self) -> int:
+        """
+        :return: The microsecond.
+        :rtype: int
+        """
+
+        return int(self) % 1_000_000
+
+    @property
+    def micros(self) -> int:
+        """
+        :return: The microseconds since the epoch as a plain int.
+        :rtype: int
+        """
+
+        return int(self)
+
+    @property
+    def minute(self) -> int:
+        """
+        :return: The minute.
+        :rtype: int
+        """
+
+        return int(self) % 3_600_000_000 // 60_000_000
+
+    @property
+    def month(self) -> int:
+        """
+        :return: The month.
+        :rtype: int
+        """
+
+        return self.date().month
+
+    @property
+    def second(self) -> int:
+        """
+        :return: The second.
+        :rtype: int
+        """
+
+        return int(self) % 60_000_000 // 1_000_000
+
+    @property
+    def year(self) -> int:
+        """
+        :return: The year.
+        :rtype: int
+        """
+
+        return self.date().year
+
+    @classmethod
+    def from_datetime(
+        cls,
+        value: datetime,
+    ) -> "CompactDateTime":
+        """
+        Creates a CompactDateTime from a datetime object.
+
+        :param value: The datetime object (naive values are taken as UTC).
+        :type value: datetime
+
+        :return: The compact timestamp.
+        :rtype: CompactDateTime
+        """
+
+        return cls((value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND)
+
+    @classmethod
+    def from_timestamp(
+        cls,
+        seconds: Union[int, float],
+    ) -> "CompactDateTime":
+        """
+        Creates a CompactDateTime from epoch seconds.
+
+        :param seconds: The seconds since the epoch.
+        :type seconds: Union[int, float]
+
+        :return: The compact timestamp.
+        :rtype: CompactDateTime
+        """
+
+        if isinstance(seconds, int):
+            return cls(seconds * 1_000_000)
+
+        return cls(round(seconds * 1_000_000))
+
+    @classmethod
+    def now(cls) -> "CompactDateTime":
+        """
+        Returns the current instant.
+
+        :return: The compact timestamp of now.
+        :rtype: CompactDateTime
+        """
+
+        return cls.from_datetime(datetime.now(timezone.utc))
+
+    def date(self) -> date:
+        """
+        :return: The (UTC) date of the timestamp.
+        :rtype: date
+        """
+
+        return date.fromordinal(int(self) // _MICROSECONDS_PER_DAY + _EPOCH_ORDINAL)
+
+    def isoformat(
+        self,
+        sep: str = "T",
+    ) -> str:
+        """
+        :return: The timestamp in ISO 8601 format (without offset).
+        :rtype: str
+        """
+
+        return self.to_datetime().isoformat(sep)
+
+    def replace(
+        self,
+        **kwargs: Any,
+    ) -> "CompactDateTime":
+        """
+        Returns a copy with the given fields replaced (like datetime.replace).
+
+        :param kwargs: The fields to replace ("year", "month", "day", "hour", ...).
+        :type kwargs: Any
+
+        :return: The new timestamp.
+        :rtype: CompactDateTime
+
+        :raises ValueError: If the resulting timestamp is invalid.
+        """
+
+        return CompactDateTime.from_datetime(self.to_datetime().replace(**kwargs))
+
+    def strftime(
+        self,
+        format: str,
+    ) -> str:
+        """
+        Formats the timestamp like datetime.strftime (as a naive UTC time).
+
+        :param format: The strftime pattern.
+        :type format: str
+
+        :return: The formatted timestamp.
+        :rtype: str
+        """
+
+        return self.to_datetime().strftime(format)
+
+    def time(self) -> time:
+        """
+        :return: The (UTC) time of day of the timestamp.
+        :rtype: time
+        """
+
+        return self.to_datetime().time()
+
+    def timestamp(self) -> float:
+        """
+        :return: The seconds since the epoch.
+        :rtype: float
+        """
+
+        return int(self) / 1_000_000
+
+    def to_datetime(
+        self,
+        tz: Optional["tzinfo"] = None,
+    ) -> datetime:
+        """
+        Converts the compact timestamp to a datetime object.
+
+        :param tz: The zone of the result (default is a naive UTC datetime).
+        :type tz: Optional[tzinfo]
+
+        :return: The datetime object.
+        :rtype: datetime
+        """
+
+        if tz is None:
+            return _EPOCH + timedelta(microseconds=int(self))
+
+        return (_EPOCH_UTC + timedelta(microseconds=int(self))).astimezone(tz)
+
+    def toordinal(self) -> int:
+        """
+        :return: The proleptic Gregorian ordinal of the (UTC) date.
+        :rtype: int
+        """
+
+        return int(self) // _MICROSECONDS_PER_DAY + _EPOCH_ORDINAL
+
+    def utcoffset(self) -> None:
+        """
+        :return: None, because compact timestamps are naive (UTC).
+        :rtype: None
+        """
+
+        return None
+
+    def weekday(self) -> int:
+        """
+        :return: The day of the week (Monday is 0).
+        :rtype: int
+        """
+
+        return (self.toordinal() + 6) % 7
+
+
+def _blocked(
+    name: str,
+    symbol: str,
+) -> Callable[..., Any]:
+    """
+    Creates an int operator override that raises TypeError.
+
+    :param name: The operator method name, e.g. "__mul__".
+    :type name: str
+    :param symbol: The operator symbol used in the error message, e.g. "*".
+    :type symbol: str
+
+    :return: The operator method.
+    :rtype: Callable[..., Any]
+    """
+
+    def operator(self: Any, *args: Any) -> Any:
+        if not args:
+            raise TypeError(f"bad operand type for unary {symbol}: '{self.__class__.__name__}'")
+
+        # Reflected operators (e.g. __rmul__) have the compact value on the right.
+        if name.startswith("__r") and name != "__rshift__":
+            raise _unsupported(symbol, args[0], self)
+
+        raise _unsupported(symbol, self, args[0])
+
+    operator.__name__ = name
+
+    return operator
+
+
+def _date_key(
+    value: CompactDate,
+    other: Any,
+    symbol: str,
+) -> Tuple[int, int]:
+    """
+    Returns the ordering key of a value compared with a CompactDate.
+
+    :param value: The CompactDate being compared.
+    :type value: CompactDate
+    :param other: The CompactDate, date or datetime object.
+    :type other: Any
+    :param symbol: The comparison operator, for the error message.
+    :type symbol: str
+
+    :return: The (ordinal, microseconds into the day) key.
+    :rtype: Tuple[int, int]
+
+    :raises TypeError: For other types, including plain ints.
+    """
+
+    if other.__class__ is CompactDate:
+        return (int(other), 0)
+
+    if isinstance(other, datetime):
+        return (other.toordinal(), (other - datetime.combine(other.date(), time(), other.tzinfo)) // _MICROSECOND)
+
+    if isinstance(other, date):
+        return (other.toordinal(), 0)
+
+    # Returning NotImplemented would let the int comparison decide.
+    raise TypeError(
+        f"'{symbol}' not supported between instances of 'CompactDate' and '{other.__class__.__name__}'",
+    )
+
+
+def _micros_key(
+    value: CompactDateTime,
+    other: Any,
+    symbol: str,
+    reflected: bool = False,
+) -> int:
+    """
+    Returns the epoch microseconds of a value compared with or subtracted from a CompactDateTime.
+
+    :param value: The CompactDateTime of the operation.
+    :type value: CompactDateTime
+    :param other: The CompactDateTime or datetime object (naive values are taken as UTC).
+    :type other: Any
+    :param symbol: The operator, for the error message.
+    :type symbol: str
+    :param reflected: Whether the other value is the left operand. Defaults to False.
+    :type reflected: bool
+
+    :return: The epoch microseconds.
+    :rtype: int
+
+    :raises TypeError: For other types, including plain ints.
+    """
+
+    if other.__class__ is CompactDateTime:
+        return int(other)
+
+    if isinstance(other, datetime):
+        return (other - (_EPOCH if other.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND
+
+    if symbol == "-":
+        raise _unsupported(symbol, other, value) if reflected else _unsupported(symbol, value, other)
+
+    # Returning NotImplemented would let the int comparison decide.
+    raise TypeError(
+        f"'{symbol}' not supported between instances of 'CompactDateTime' and '{other.__class__.__name__}'",
+    )
+
+
+def _unsupported(
+    symbol: str,
+    left: Any,
+    right: Any,
+) -> TypeError:
+    """
+    Returns the TypeError of an operator that does not apply to its operands.
+
+    :param symbol: The operator symbol.
+    :type symbol: str
+    :param left: The left operand.
+    :type left: Any
+    :param right: The right operand.
+    :type right: Any
+
+    :return: The error to raise.
+    :rtype: TypeError
+    """
+
+    return TypeError(
+        f"unsupported operand type(s) for {symbol}: '{left.__class__.__name__}' and '{right.__class__.__name__}'",
+    )
+
+
+# The int operators that have no meaning for dates and times. Inherited, they
+# would silently turn a compact value into a plain int.
+_BLOCKED: Final[Tuple[Tuple[str, str], ...]] = (
+    ("__abs__", "abs()"),
+    ("__and__", "&"),
+    ("__divmod__", "divmod()"),
+    ("__floordiv__", "//"),
+    ("__invert__", "~"),
+    ("__lshift__", "<<"),
+    ("__mod__", "%"),
+    ("__mul__", "*"),
+    ("__neg__", "-"),
+    ("__or__", "|"),
+    ("__pos__", "+"),
+    ("__pow__", "**"),
+    ("__rand__", "&"),
+    ("__rdivmod__", "divmod()"),
+    ("__rfloordiv__", "//"),
+    ("__rlshift__", "<<"),
+    ("__rmod__", "%"),
+    ("__rmul__", "*"),
+    ("__ror__", "|"),
+    ("__rpow__", "**"),
+    ("__rrshift__", ">>"),
+    ("__rshift__", ">>"),
+    ("__rtruediv__", "/"),
+    ("__rxor__", "^"),
+    ("__truediv__", "/"),
+    ("__xor__", "^"),
+)
+
+for _name, _symbol in _BLOCKED:
+    setattr(CompactDate, _name, _blocked(_name, _symbol))
+    setattr(CompactDateTime, _name, _blocked(_name, _symbol))
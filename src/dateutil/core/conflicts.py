@@ -0,0 +1,243 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from heapq import heappop, heappush
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .core import DateComparisonError, DateRangeError
+
+
+__all__: Final[List[str]] = ["Conflict", "ConflictDetector", "ConflictGroup"]
+
+
+class Conflict(NamedTuple):
+    """
+    Two overlapping items of the same resource, in start order.
+    """
+
+    key: Hashable
+    first: Any
+    second: Any
+
+
+class ConflictGroup(NamedTuple):
+    """
+    A maximal chain of overlapping items of the same resource.
+    """
+
+    key: Hashable
+    start: Any
+    end: Any
+    members: List[Any]
+
+
+class ConflictDetector:
+    """
+    Sweep-line detection of overlapping intervals, e.g. double bookings.
+
+    Items are swept in start order. Every resource keeps a heap of its
+    active items ordered by end, so an item is compared only with the items
+    it actually overlaps: finding all k conflicting pairs costs
+    O(n log n + k) instead of comparing every pair. Intervals are half-open
+    by default, so back-to-back bookings (and empty intervals) do not
+    conflict; with closed endpoints, touching intervals do.
+    """
+
+    @classmethod
+    def groups(
+        cls,
+        items: Iterable[Any],
+        bounds: Optional[Callable[[Any], Tuple[Any, Any]]] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        closed: bool = False,
+        presorted: bool = False,
+    ) -> Iterator[ConflictGroup]:
+        """
+        Finds the groups of items that overlap directly or through a chain of overlaps.
+
+        :param items: The items, e.g. (start, end) pairs or reservation records.
+        :type items: Iterable[Any]
+        :param bounds: The function that returns the (start, end) pair of an item (default is the item itself).
+        :type bounds: Optional[Callable[[Any], Tuple[datetime, datetime]]]
+        :param key: The function that returns the resource of an item (default is one shared resource).
+        :type key: Optional[Callable[[Any], Hashable]]
+        :param closed: Whether intervals include their end, so touching intervals conflict. Defaults to False.
+        :type closed: bool
+        :param presorted: Whether the items already arrive sorted by start, which makes the detection streaming. Defaults to False.
+        :type presorted: bool
+
+        :return: An iterator over the groups with at least two members, each closed as soon as the sweep passes it.
+        :rtype: Iterator[ConflictGroup]
+
+        :raises DateRangeError: If an item ends before it starts.
+        :raises DateComparisonError: If presorted is set and the items are not sorted by start.
+        """
+
+        # The open group of every resource: [start, end, members].
+        open_groups: Dict[Hashable, List[Any]] = {}
+
+        for resource, start, end, item in cls._sweep(items, bounds, key, closed, presorted):
+            group: Optional[List[Any]] = open_groups.get(resource)
+
+            if group is not None and (start < group[1] or (closed and start == group[1])):
+                group[2].append(item)
+
+                if end > group[1]:
+                    group[1] = end
+
+                continue
+
+            if group is not None and len(group[2]) > 1:
+                yield ConflictGroup(resource, group[0], group[1], group[2])
+
+            open_groups[resource] = [start, end, [item]]
+
+        for resource, group in open_groups.items():
+            if len(group[2]) > 1:
+                yield ConflictGroup(resource, group[0], group[1], group[2])
+
+    @classmethod
+    def has_conflict(
+        cls,
+        items: Iterable[Any],
+        bounds: Optional[Callable[[Any], Tuple[Any, Any]]] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        closed: bool = False,
+        presorted: bool = False,
+    ) -> bool:
+        """
+        Checks whether any two items of the same resource overlap, stopping at the first conflict.
+
+        See pairs for the parameters.
+
+        :return: True if there is a conflict, False otherwise.
+        :rtype: bool
+        """
+
+        for _ in cls.pairs(items, bounds, key, closed, presorted):
+            return True
+
+        return False
+
+    @classmethod
+    def pairs(
+        cls,
+        items: Iterable[Any],
+        bounds: Optional[Callable[[Any], Tuple[Any, Any]]] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        closed: bool = False,
+        presorted: bool = False,
+    ) -> Iterator[Conflict]:
+        """
+        Finds every pair of overlapping items of the same resource.
+
+        :param items: The items, e.g. (start, end) pairs or reservation records.
+        :type items: Iterable[Any]
+        :param bounds: The function that returns the (start, end) pair of an item (default is the item itself).
+        :type bounds: Optional[Callable[[Any], Tuple[datetime, datetime]]]
+        :param key: The function that returns the resource of an item (default is one shared resource).
+        :type key: Optional[Callable[[Any], Hashable]]
+        :param closed: Whether intervals include their end, so touching intervals conflict. Defaults to False.
+        :type closed: bool
+        :param presorted: Whether the items already arrive sorted by start, which makes the detection streaming. Defaults to False.
+        :type presorted: bool
+
+        :return: An iterator over the conflicts, ordered by the start of their second item.
+        :rtype: Iterator[Conflict]
+
+        :raises DateRangeError: If an item ends before it starts.
+        :raises DateComparisonError: If presorted is set and the items are not sorted by start.
+        """
+
+        # The active items of every resource: a heap of (end, arrival number, item).
+        active: Dict[Hashable, List[Tuple[Any, int, Any]]] = {}
+
+        for sequence, (resource, start, end, item) in enumerate(cls._sweep(items, bounds, key, closed, presorted)):
+            heap: Optional[List[Tuple[Any, int, Any]]] = active.get(resource)
+
+            if heap is None:
+                heap = active[resource] = []
+
+            # Items that end before this one starts can no longer conflict with anything.
+            while heap and (heap[0][0] < start or (not closed and heap[0][0] == start)):
+                heappop(heap)
+
+            for _, _, other in heap:
+                yield Conflict(resource, other, item)
+
+            heappush(heap, (end, sequence, item))
+
+    @classmethod
+    def _sweep(
+        cls,
+        items: Iterable[Any],
+        bounds: Optional[Callable[[Any], Tuple[Any, Any]]],
+        key: Optional[Callable[[Any], Hashable]],
+        closed: bool,
+        presorted: bool,
+    ) -> Iterator[Tuple[Hashable, Any, Any, Any]]:
+        """
+        Yields (resource, start, end, item) in start order, validating every interval.
+
+        Empty half-open intervals cover no time and are skipped.
+
+        :param items: The items.
+        :type items: Iterable[Any]
+        :param bounds: The (start, end) extractor, if any.
+        :type bounds: Optional[Callable[[Any], Tuple[datetime, datetime]]]
+        :param key: The resource extractor, if any.
+        :type key: Optional[Callable[[Any], Hashable]]
+        :param closed: Whether intervals include their end.
+        :type closed: bool
+        :param presorted: Whether the items already arrive sorted by start.
+        :type presorted: bool
+
+        :return: An iterator over the sweep events.
+        :rtype: Iterator[Tuple[Hashable, datetime, datetime, Any]]
+
+        :raises DateRangeError: If an item ends before it starts.
+        :raises DateComparisonError: If presorted is set and the items are not sorted by start.
+        """
+
+        def events() -> Iterator[Tuple[Hashable, Any, Any, Any]]:
+            for item in items:
+                start, end = item if bounds is None else bounds(item)
+
+                if end < start:
+                    raise DateRangeError(
+                        f"Invalid interval: {start} to {end}. The end must not be before the start.",
+                    )
+
+                if closed or start < end:
+                    yield (None if key is None else key(item), start, end, item)
+
+        if not presorted:
+            # Sorting by start only keeps ties in input order and never compares items.
+            yield from sorted(events(), key=lambda event: event[1])
+            return
+
+        previous: Any = None
+
+        for event in events():
+            if previous is not None and event[1] < previous:
+                raise DateComparisonError(
+                    f"The items are not sorted by start: {event[1]} follows {previous}.",
+                )
+
+            previous = event[1]
+
+            yield event
@@ -3,12 +3,36 @@ Author: Louis Goodnews
 Date: 2025-07-08
 """
 
+from array import array
 from datetime import date, datetime, timedelta
-from enum import Enum
-from typing import Any, Callable, Dict, Final, List, Literal, Optional, Union
+from enum import Enum, IntEnum
+from time import perf_counter_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .formatting import compile_format
 
-__all__: Final[List[str]] = ["DateFormat", "DateUtil"]
+if TYPE_CHECKING:
+    # Imported at run time inside the methods: the duration module imports this one.
+    from .duration import Duration
+
+
+__all__: Final[List[str]] = ["DateFormat", "DateUtil", "RelativeDay"]
+
+
+# The units understood by increment and decrement.
+_UNITS: Final[frozenset] = frozenset(("days", "hours", "minutes", "seconds", "weeks", "years"))
 
 
 class DateUtilError(Exception):
@@ -526,6 +550,21 @@ class DateFormat(Enum):
         return self.value
 
 
+class RelativeDay(IntEnum):
+    """
+    The compact codes of DateUtil.classify_relative.
+
+    Each code is the day delta clamped to -3..2, so codes sort like the days they stand for.
+    """
+
+    OLDER = -3
+    DAY_BEFORE_YESTERDAY = -2
+    YESTERDAY = -1
+    TODAY = 0
+    TOMORROW = 1
+    LATER = 2
+
+
 class DateUtil:
     """
     A utility class for various date and time operations.
@@ -865,26 +904,64 @@ class DateUtil:
             as_="years",
         )
 
+    @classmethod
+    def classify_relative(
+        cls,
+        values: Iterable[Union[date, datetime]],
+        reference: Optional[Union[date, datetime]] = None,
+    ) -> Tuple[array, array]:
+        """
+        Classifies a batch of dates relative to one reference day.
+
+        The clock is read at most once, so the whole batch sees the same
+        "today" even if it runs across midnight. Day deltas are differences
+        of proleptic ordinals, i.e. integer arithmetic on the wall dates
+        (aware values use their own local date, like is_today).
+
+        :param values: The dates or datetime objects to classify.
+        :type values: Iterable[Union[date, datetime]]
+        :param reference: The day counted as today (default is a single read of now()).
+        :type reference: Optional[Union[date, datetime]]
+
+        :return: A tuple of (RelativeDay codes as array('b'), day deltas as array('q')), in input order.
+        :rtype: Tuple[array, array]
+        """
+
+        if reference is None:
+            reference = cls.now()
+
+        today: int = reference.toordinal()
+
+        deltas: array = array("q", [value.toordinal() - today for value in values])
+
+        # The delta itself is the code inside -2..1; everything else is older or later.
+        codes: array = array(
+            "b",
+            [delta if -3 < delta < 2 else (-3 if delta < 0 else 2) for delta in deltas],
+        )
+
+        return (codes, deltas)
+
     @classmethod
     def datetime_to_string(
         cls,
         date: datetime,
-        date_format: DateFormat = DateFormat.ISO_8601,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
     ) -> str:
         """
         Converts a datetime object to a string in the specified format.
 
         :param date: The datetime object to convert.
         :type date: datetime
-        :param date_format: The format to convert the datetime to (default is "%Y-%m-%d %H:%M:%S").
-        :type date_format: str
+        :param date_format: The format to convert the datetime to, as a DateFormat or any strftime pattern (default is "%Y-%m-%d %H:%M:%S").
+        :type date_format: Union[DateFormat, str]
 
         :return: The formatted date string.
         :rtype: str
         """
 
-        # This method converts a datetime object to a string in the specified format.
-        return date.strftime(date_format.value)
+        # The pattern is compiled once and reused for every call.
+        return compile_format(date_format).format(date)
 
     @classmethod
     def day(cls) -> int:
@@ -987,21 +1064,32 @@ class DateUtil:
     def decrement(
         cls,
         obj: datetime,
-        what: Literal["days", "hours", "minutes", "seconds", "weeks", "years"],
+        what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, "Duration"],
         amount: int,
+        mode: Literal["absolute", "wall"] = "wall",
+        ambiguous: Literal["earlier", "later", "raise"] = "earlier",
+        nonexistent: Literal["shift_backward", "shift_forward", "raise"] = "shift_forward",
     ) -> datetime:
         """
         Decrements a datetime object by a specified amount of time.
 
         :param obj: The datetime object to decrement.
         :type obj: datetime
-        :param what: The unit of time to decrement by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years").
-        :type what: Literal["days", "hours", "minutes", "seconds", "weeks", "years"]
-        :param amount: The amount to decrement the datetime object by.
+        :param what: The unit of time to decrement by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years"), or an ISO 8601 duration (a Duration or a string such as "P1DT2H").
+        :type what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Duration]
+        :param amount: The amount to decrement the datetime object by (the multiplier of a duration).
         :type amount: int
+        :param mode: Whether to shift the wall-clock time or the absolute instant of aware values. Defaults to "wall".
+        :type mode: Literal["absolute", "wall"]
+        :param ambiguous: How to resolve a resulting wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a resulting wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_backward", "shift_forward", "raise"]
 
         :return: The decremented datetime object.
         :rtype: datetime
+
+        :raises DateTimezoneError: If the resulting wall time cannot be resolved under the given policies.
         """
 
         # This method decrements a datetime object by a specified amount of time.
@@ -1009,6 +1097,51 @@ class DateUtil:
             obj=obj,
             what=what,
             amount=-amount,
+            mode=mode,
+            ambiguous=ambiguous,
+            nonexistent=nonexistent,
+        )
+
+    @classmethod
+    def decrement_many(
+        cls,
+        values: Iterable[datetime],
+        what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, "Duration"],
+        amount: int,
+        mode: Literal["absolute", "wall"] = "wall",
+        ambiguous: Literal["earlier", "later", "raise"] = "earlier",
+        nonexistent: Literal["shift_backward", "shift_forward", "raise"] = "shift_forward",
+    ) -> List[datetime]:
+        """
+        Decrements a batch of datetime objects by a specified amount of time.
+
+        :param values: The datetime objects to decrement.
+        :type values: Iterable[datetime]
+        :param what: The unit of time to decrement by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years"), or an ISO 8601 duration (a Duration or a string such as "P1DT2H").
+        :type what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Duration]
+        :param amount: The amount to decrement the datetime objects by (the multiplier of a duration).
+        :type amount: int
+        :param mode: Whether to shift the wall-clock time or the absolute instant of aware values. Defaults to "wall".
+        :type mode: Literal["absolute", "wall"]
+        :param ambiguous: How to resolve a resulting wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a resulting wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_backward", "shift_forward", "raise"]
+
+        :return: The decremented datetime objects, in input order.
+        :rtype: List[datetime]
+
+        :raises DateTimezoneError: If a resulting wall time cannot be resolved under the given policies.
+        """
+
+        # This method decrements a batch of datetime objects by a specified amount of time.
+        return cls.increment_many(
+            values=values,
+            what=what,
+            amount=-amount,
+            mode=mode,
+            ambiguous=ambiguous,
+            nonexistent=nonexistent,
         )
 
     @classmethod
@@ -1095,42 +1228,194 @@ class DateUtil:
     def increment(
         cls,
         obj: datetime,
-        what: Literal["days", "hours", "minutes", "seconds", "weeks", "years"],
+        what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, "Duration"],
         amount: int,
+        mode: Literal["absolute", "wall"] = "wall",
+        ambiguous: Literal["earlier", "later", "raise"] = "earlier",
+        nonexistent: Literal["shift_backward", "shift_forward", "raise"] = "shift_forward",
     ) -> datetime:
         """
         Increments a datetime object by a specified amount of time.
 
+        Naive datetime objects are shifted as they are. For aware datetime objects
+        the mode decides what is shifted: "wall" shifts the local clock time by
+        the calendar part (years, months, weeks and days, so "days" keeps the
+        time of day across DST transitions), resolves it in the original zone and
+        then adds the sub-day part as elapsed time, so adding hours, minutes or
+        seconds never moves an instant backwards. "absolute" shifts the elapsed
+        time only.
+
         :param obj: The datetime object to increment.
         :type obj: datetime
-        :param what: The unit of time to increment by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years").
-        :type what: Literal["days", "hours", "minutes", "seconds", "weeks", "years"]
-        :param amount: The amount to increment the datetime object by.
+        :param what: The unit of time to increment by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years"), or an ISO 8601 duration (a Duration or a string such as "P1DT2H").
+        :type what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Duration]
+        :param amount: The amount to increment the datetime object by (the multiplier of a duration).
         :type amount: int
+        :param mode: Whether to shift the wall-clock time or the absolute instant of aware values. Defaults to "wall".
+        :type mode: Literal["absolute", "wall"]
+        :param ambiguous: How to resolve a resulting wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a resulting wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_backward", "shift_forward", "raise"]
 
         :return: The incremented datetime object.
         :rtype: datetime
+
+        :raises ValueError: If mode, ambiguous or nonexistent is invalid.
+        :raises DateTimezoneError: If the resulting wall time cannot be resolved under the given policies.
         """
 
-        # This method increments a datetime object by a specified amount of time.
-        # The 'what' parameter specifies the unit of time to increment by.
-        if what == "days":
-            return obj + timedelta(days=amount)
-        elif what == "hours":
-            return obj + timedelta(hours=amount)
-        elif what == "minutes":
-            return obj + timedelta(minutes=amount)
-        elif what == "seconds":
-            return obj + timedelta(seconds=amount)
-        elif what == "weeks":
-            return obj + timedelta(weeks=amount)
-        elif what == "years":
-            return obj.replace(year=obj.year + amount)
-        else:
-            raise ValueError(
-                f"Invalid value for 'what': {what}. Must be one of: 'days', 'hours', 'minutes', 'seconds', 'weeks', 'years'."
+        cls._check_policies(
+            mode=mode,
+            ambiguous=ambiguous,
+            nonexistent=nonexistent,
+        )
+
+        # Naive values have no zone, so wall and absolute arithmetic coincide.
+        if obj.tzinfo is None:
+            return cls._shift(
+                obj=obj,
+                what=what,
+                amount=amount,
             )
 
+        return cls.increment_many(
+            values=(obj,),
+            what=what,
+            amount=amount,
+            mode=mode,
+            ambiguous=ambiguous,
+            nonexistent=nonexistent,
+        )[0]
+
+    @classmethod
+    def increment_many(
+        cls,
+        values: Iterable[datetime],
+        what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, "Duration"],
+        amount: int,
+        mode: Literal["absolute", "wall"] = "wall",
+        ambiguous: Literal["earlier", "later", "raise"] = "earlier",
+        nonexistent: Literal["shift_backward", "shift_forward", "raise"] = "shift_forward",
+    ) -> List[datetime]:
+        """
+        Increments a batch of datetime objects by a specified amount of time.
+
+        Aware values are grouped by zone and resolved against the zone's cached
+        transition table, so large series of local times are shifted without a
+        full tzinfo lookup per element. See increment for the meaning of mode.
+
+        :param values: The datetime objects to increment.
+        :type values: Iterable[datetime]
+        :param what: The unit of time to increment by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years"), or an ISO 8601 duration (a Duration or a string such as "P1DT2H").
+        :type what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Duration]
+        :param amount: The amount to increment the datetime objects by (the multiplier of a duration).
+        :type amount: int
+        :param mode: Whether to shift the wall-clock time or the absolute instant of aware values. Defaults to "wall".
+        :type mode: Literal["absolute", "wall"]
+        :param ambiguous: How to resolve a resulting wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a resulting wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_backward", "shift_forward", "raise"]
+
+        :return: The incremented datetime objects, in input order.
+        :rtype: List[datetime]
+
+        :raises ValueError: If mode, ambiguous or nonexistent is invalid.
+        :raises DateTimezoneError: If a resulting wall time cannot be resolved under the given policies.
+        """
+
+        # The timezone layer imports this module, so it is imported lazily here.
+        from .timezone import TimezoneUtil
+
+        cls._check_policies(
+            mode=mode,
+            ambiguous=ambiguous,
+            nonexistent=nonexistent,
+        )
+
+        # Resolve a duration once for the whole batch (parsing is cached per string).
+        if what.__class__ is not str or what not in _UNITS:
+            what = cls._duration(what) * amount
+            amount = 1
+
+        # Wall arithmetic only applies to the calendar part; the rest is elapsed time.
+        calendar: Optional[Tuple[Any, int]] = None
+        exact: timedelta = timedelta(0)
+
+        if mode == "wall":
+            calendar, exact = cls._wall_parts(
+                what=what,
+                amount=amount,
+            )
+
+        results: List[datetime] = []
+
+        # Indices of the aware values per zone: shifted in local time and resolved,
+        # or shifted in UTC and converted back.
+        local_groups: Dict[Any, List[int]] = {}
+        utc_groups: Dict[Any, List[int]] = {}
+
+        for index, value in enumerate(values):
+            if value.tzinfo is None:
+                results.append(
+                    cls._shift(
+                        obj=value,
+                        what=what,
+                        amount=amount,
+                    )
+                )
+            elif mode == "absolute":
+                utc_groups.setdefault(value.tzinfo, []).append(index)
+                results.append(
+                    cls._shift(
+                        obj=TimezoneUtil.to_utc(value),
+                        what=what,
+                        amount=amount,
+                    )
+                )
+            elif calendar is None:
+                # Without a calendar part the wall time is not touched, which keeps the fold.
+                utc_groups.setdefault(value.tzinfo, []).append(index)
+                results.append(TimezoneUtil.to_utc(value) + exact)
+            else:
+                local_groups.setdefault(value.tzinfo, []).append(index)
+                results.append(
+                    cls._shift(
+                        obj=value.replace(tzinfo=None),
+                        what=calendar[0],
+                        amount=calendar[1],
+                    )
+                )
+
+        for zone, indices in local_groups.items():
+            localized: List[datetime] = TimezoneUtil.localize_many(
+                values=[results[index] for index in indices],
+                tz=zone,
+                ambiguous=ambiguous,
+                nonexistent=nonexistent,
+            )
+
+            for index, value in zip(indices, localized):
+                if not exact:
+                    results[index] = value
+                    continue
+
+                utc_groups.setdefault(zone, []).append(index)
+                results[index] = TimezoneUtil.to_utc(value) + exact
+
+        for zone, indices in utc_groups.items():
+            shifted: List[datetime] = TimezoneUtil.convert_many(
+                values=[results[index] for index in indices],
+                from_tz=None,
+                to_tz=zone,
+            )
+
+            for index, value in zip(indices, shifted):
+                results[index] = value
+
+        return results
+
     @classmethod
     def is_date_in_range(
         cls,
@@ -1351,15 +1636,15 @@ class DateUtil:
     def parse_date_string(
         cls,
         date_str: str,
-        date_format: DateFormat = DateFormat.ISO_8601,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
     ) -> datetime:
         """
         Parses a date string into a datetime object.
 
         :param date_str: The date string to parse.
         :type date_str: str
-        :param date_format: The format of the date string (default is "%Y-%m-%d %H:%M:%S").
-        :type date_format: str
+        :param date_format: The format of the date string, as a DateFormat or any strptime pattern (default is "%Y-%m-%d %H:%M:%S").
+        :type date_format: Union[DateFormat, str]
 
         :return: The parsed datetime object.
         :rtype: datetime
@@ -1379,40 +1664,65 @@ class DateUtil:
                 f"Invalid date format: {date_str}. Expected format: {date_format}.",
             ) from e
 
+    @classmethod
+    def pipeline(
+        cls,
+        errors: Literal["raise", "skip"] = "raise",
+    ) -> "Pipeline":
+        """
+        Starts a lazy pipeline, e.g. DateUtil.pipeline().parse(fmt).shift("days", 1).floor("hours").format(fmt).
+
+        :param errors: Whether values that fail a stage raise or are dropped. Defaults to "raise".
+        :type errors: Literal["raise", "skip"]
+
+        :return: The empty pipeline.
+        :rtype: Pipeline
+        """
+
+        # The pipeline module imports this module, so it is imported lazily here.
+        from .pipeline import Pipeline
+
+        return Pipeline(errors=errors)
+
     @classmethod
     def record_runtime(
         cls,
         function: Callable[[Any], Any],
         *args: Any,
         **kwargs: Any,
-    ) -> Dict[str, Union[Any, Dict[str, float]]]:
+    ) -> Dict[str, Union[Any, Dict[str, Union[float, int]]]]:
         """
         Records the runtime of a function and returns the result along with the execution time.
 
+        The runtime is measured once with the monotonic perf_counter_ns clock, so all
+        reported units agree. Use dateutil.Profiler to aggregate repeated calls.
+
         :param function: The function to execute and record the runtime for.
         :type function: Callable[[Any], Any]
         :param args: Positional arguments to pass to the function.
         :param kwargs: Keyword arguments to pass to the function.
 
-        :return: A dictionary containing the result of the function and the execution time in seconds.
-        :rtype: Dict[str, Union[Any, float, int]]
+        :return: A dictionary containing the result of the function and the execution time
+            in seconds, milliseconds and nanoseconds.
+        :rtype: Dict[str, Union[Any, Dict[str, Union[float, int]]]]
         """
 
-        start: datetime = cls.now()
+        start: int = perf_counter_ns()
 
-        try:
-            result: Optional[Any] = function(
-                *args,
-                **kwargs,
-            )
-        except Exception as e:
-            raise e
+        result: Optional[Any] = function(
+            *args,
+            **kwargs,
+        )
+
+        # Take a single measurement and derive every unit from it.
+        elapsed: int = perf_counter_ns() - start
 
         return {
             "result": result,
             "execution_time": {
-                "seconds": cls.calculate_difference_in_seconds(start=start),
-                "milliseconds": cls.calculate_difference_in_milliseconds(start=start),
+                "seconds": elapsed / 1_000_000_000,
+                "milliseconds": elapsed / 1_000_000,
+                "nanoseconds": elapsed,
             },
         }
 
@@ -1491,26 +1801,23 @@ class DateUtil:
     def string_to_datetime(
         cls,
         date_str: str,
-        date_format: DateFormat = DateFormat.ISO_8601,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
     ) -> datetime:
         """
         Converts a string to a datetime object in the specified format.
 
         :param date_str: The date string to convert.
         :type date_str: str
-        :param date_format: The format of the date string (default is "%Y-%m-%d %H:%M:%S").
-        :type date_format: str
+        :param date_format: The format of the date string, as a DateFormat or any strptime pattern (default is "%Y-%m-%d %H:%M:%S").
+        :type date_format: Union[DateFormat, str]
 
         :return: The converted datetime object.
         :rtype: datetime
         """
 
         try:
-            # This method converts a string to a datetime object in the specified format.
-            return datetime.strptime(
-                date_str,
-                date_format.value,
-            )
+            # The pattern is compiled once and reused for every call.
+            return compile_format(date_format).parse(date_str)
         except ValueError as e:
             # If the string cannot be parsed, raise a DateParsingFormatError.
             raise DateParsingFormatError(
@@ -1564,3 +1871,150 @@ class DateUtil:
 
         # This method returns the date of yesterday with the time set to midnight.
         return cls.today() - timedelta(days=1)
+
+    @classmethod
+    def _check_policies(
+        cls,
+        mode: str,
+        ambiguous: str,
+        nonexistent: str,
+    ) -> None:
+        """
+        Checks the mode and the DST policies of a shift.
+
+        :param mode: The arithmetic mode.
+        :type mode: str
+        :param ambiguous: The policy for wall times that occur twice.
+        :type ambiguous: str
+        :param nonexistent: The policy for wall times that are skipped.
+        :type nonexistent: str
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If a value is invalid.
+        """
+
+        if mode not in ("absolute", "wall"):
+            raise ValueError(
+                f"Invalid value for 'mode': {mode}. Must be one of: 'absolute', 'wall'."
+            )
+
+        if ambiguous not in ("earlier", "later", "raise"):
+            raise ValueError(
+                f"Invalid value for 'ambiguous': {ambiguous}. Must be one of: 'earlier', 'later', 'raise'."
+            )
+
+        if nonexistent not in ("shift_backward", "shift_forward", "raise"):
+            raise ValueError(
+                f"Invalid value for 'nonexistent': {nonexistent}. Must be one of: 'shift_backward', 'shift_forward', 'raise'."
+            )
+
+    @classmethod
+    def _duration(
+        cls,
+        what: Any,
+    ) -> "Duration":
+        """
+        Resolves a Duration or an ISO 8601 duration string.
+
+        :param what: The Duration or duration string.
+        :type what: Union[str, Duration]
+
+        :return: The duration.
+        :rtype: Duration
+
+        :raises ValueError: If the value is neither a unit nor a valid duration.
+        """
+
+        # The duration module imports this module, so it is imported lazily here.
+        from .duration import Duration
+
+        if isinstance(what, Duration):
+            return what
+
+        if isinstance(what, str) and what.lstrip("+-").startswith("P"):
+            return Duration.parse(what)
+
+        raise ValueError(
+            f"Invalid value for 'what': {what}. Must be one of: 'days', 'hours', 'minutes', 'seconds', 'weeks', 'years', or an ISO 8601 duration."
+        )
+
+    @classmethod
+    def _shift(
+        cls,
+        obj: datetime,
+        what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, "Duration"],
+        amount: int,
+    ) -> datetime:
+        """
+        Shifts a datetime object by a specified amount of time without any timezone handling.
+
+        :param obj: The datetime object to shift.
+        :type obj: datetime
+        :param what: The unit of time to shift by (e.g., "days", "hours", "minutes", "seconds", "weeks", "years"), or an ISO 8601 duration.
+        :type what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Duration]
+        :param amount: The amount to shift the datetime object by (the multiplier of a duration).
+        :type amount: int
+
+        :return: The shifted datetime object.
+        :rtype: datetime
+        """
+
+        # Durations apply their calendar part first, then their exact part.
+        if what.__class__ is not str or what not in _UNITS:
+            return cls._duration(what).add_to(obj, amount)
+
+        # The 'what' parameter specifies the unit of time to shift by.
+        if what == "days":
+            return obj + timedelta(days=amount)
+        elif what == "hours":
+            return obj + timedelta(hours=amount)
+        elif what == "minutes":
+            return obj + timedelta(minutes=amount)
+        elif what == "seconds":
+            return obj + timedelta(seconds=amount)
+        elif what == "weeks":
+            return obj + timedelta(weeks=amount)
+        elif what == "years":
+            return obj.replace(year=obj.year + amount)
+        else:
+            raise ValueError(
+                f"Invalid value for 'what': {what}. Must be one of: 'days', 'hours', 'minutes', 'seconds', 'weeks', 'years'."
+            )
+
+    @classmethod
+    def _wall_parts(
+        cls,
+        what: Union[str, "Duration"],
+        amount: int,
+    ) -> Tuple[Optional[Tuple[Any, int]], timedelta]:
+        """
+        Splits a shift into its calendar part, applied to the wall time, and its exact sub-day part.
+
+        :param what: The unit of time or the (already multiplied) duration.
+        :type what: Union[str, Duration]
+        :param amount: The amount of the unit (1 for a duration).
+        :type amount: int
+
+        :return: The calendar part as a (what, amount) pair (None if it is empty) and the exact part.
+        :rtype: Tuple[Optional[Tuple[Union[str, Duration], int]], timedelta]
+        """
+
+        # The duration module imports this module, so it is imported lazily here.
+        from .duration import Duration
+
+        if what.__class__ is str:
+            if what in ("hours", "minutes", "seconds"):
+                return (None, timedelta(**{what: amount}))
+
+            return ((what, amount), timedelta(0))
+
+        # The whole days of the exact part, truncated towards zero, are calendar days.
+        days: int = what.delta // timedelta(days=1) if what.delta >= timedelta(0) else -(-what.delta // timedelta(days=1))
+        exact: timedelta = what.delta - timedelta(days=days)
+
+        if not (what.years or what.months or days):
+            return (None, exact)
+
+        return ((Duration(years=what.years, months=what.months, days=days), 1), exact)
@@ -0,0 +1,549 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import re
+from calendar import monthrange
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Final, List, Optional, Pattern, Tuple, Union
+
+from .core import DateArithmeticError, DateFormatError, DateParsingFormatError
+
+
+__all__: Final[List[str]] = ["Duration"]
+
+
+# The ISO 8601 duration grammar (PnYnMnWnDTnHnMnS), with an optional sign.
+# Only the exact components may carry a fraction.
+_DURATION: Final[Pattern[str]] = re.compile(
+    r"(?P<sign>[+-])?P"
+    r"(?:(?P<years>\d+)Y)?"
+    r"(?:(?P<months>\d+)M)?"
+    r"(?:(?P<weeks>\d+(?:[.,]\d+)?)W)?"
+    r"(?:(?P<days>\d+(?:[.,]\d+)?)D)?"
+    r"(?:T"
+    r"(?:(?P<hours>\d+(?:[.,]\d+)?)H)?"
+    r"(?:(?P<minutes>\d+(?:[.,]\d+)?)M)?"
+    r"(?:(?P<seconds>\d+(?:[.,]\d+)?)S)?"
+    r")?",
+)
+
+# The exact components and their length in microseconds.
+_EXACT: Final[Tuple[Tuple[str, int], ...]] = (
+    ("weeks", 604_800_000_000),
+    ("days", 86_400_000_000),
+    ("hours", 3_600_000_000),
+    ("minutes", 60_000_000),
+    ("seconds", 1_000_000),
+)
+
+# The maximum number of distinct duration strings whose parse result is cached.
+PARSE_CACHE_SIZE: Final[int] = 1024
+
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+
+class Duration:
+    """
+    An ISO 8601 duration with separate calendar and exact parts.
+
+    Years and months are calendar units whose length depends on the date
+    they are applied to (month ends are clamped, e.g. Jan 31 + P1M is the
+    last day of February). Weeks, days and the time components are exact
+    and kept as a single timedelta. Calendar parts are applied first.
+    """
+
+    __slots__ = ("years", "months", "delta")
+
+    years: int
+    months: int
+    delta: timedelta
+
+    def __init__(
+        self,
+        years: int = 0,
+        months: int = 0,
+        weeks: Union[int, float] = 0,
+        days: Union[int, float] = 0,
+        hours: Union[int, float] = 0,
+        minutes: Union[int, float] = 0,
+        seconds: Union[int, float] = 0,
+        microseconds: Union[int, float] = 0,
+    ) -> None:
+        """
+        Initializes the Duration.
+
+        :param years: The calendar years.
+        :type years: int
+        :param months: The calendar months.
+        :type months: int
+        :param weeks: The exact weeks (7 days).
+        :type weeks: Union[int, float]
+        :param days: The exact days (24 hours).
+        :type days: Union[int, float]
+        :param hours: The hours.
+        :type hours: Union[int, float]
+        :param minutes: The minutes.
+        :type minutes: Union[int, float]
+        :param seconds: The seconds.
+        :type seconds: Union[int, float]
+        :param microseconds: The microseconds.
+        :type microseconds: Union[int, float]
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If a calendar part is not an integer.
+        """
+
+        if not isinstance(years, int) or not isinstance(months, int):
+            raise ValueError(
+                f"Invalid value for 'years'/'months': {years!r}/{months!r}. Must be integers.",
+            )
+
+        # Durations are shared through the parse cache, so they are immutable.
+        object.__setattr__(self, "years", years)
+        object.__setattr__(self, "months", months)
+        object.__setattr__(
+            self,
+            "delta",
+            timedelta(
+                weeks=weeks,
+                days=days,
+                hours=hours,
+                minutes=minutes,
+                seconds=seconds,
+                microseconds=microseconds,
+            ),
+        )
+
+    def __add__(
+        self,
+        other: Any,
+    ) -> Any:
+        """
+        Adds another Duration, or a timedelta to the exact part.
+
+        :param other: The Duration or timedelta to add.
+        :type other: Union[Duration, timedelta]
+
+        :return: The sum.
+        :rtype: Duration
+        """
+
+        if isinstance(other, Duration):
+            return Duration._create(
+                self.years + other.years,
+                self.months + other.months,
+                self.delta + other.delta,
+            )
+
+        if isinstance(other, timedelta):
+            return Duration._create(self.years, self.months, self.delta + other)
+
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        """
+        :return: False for a zero duration, True otherwise.
+        :rtype: bool
+        """
+
+        return bool(self.years or self.months or self.delta)
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks whether two durations have the same calendar and exact parts.
+
+        :param other: The object to compare with.
+        :type other: object
+
+        :return: True if the durations are equal, False otherwise.
+        :rtype: bool
+        """
+
+        if isinstance(other, Duration):
+            return (self.years, self.months, self.delta) == (other.years, other.months, other.delta)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        :return: The hash of the calendar and exact parts.
+        :rtype: int
+        """
+
+        return hash((self.years, self.months, self.delta))
+
+    def __mul__(
+        self,
+        factor: int,
+    ) -> "Duration":
+        """
+        Multiplies every part by an integer.
+
+        :param factor: The factor.
+        :type factor: int
+
+        :return: The scaled duration.
+        :rtype: Duration
+        """
+
+        if isinstance(factor, int):
+            return Duration._create(self.years * factor, self.months * factor, self.delta * factor)
+
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Duration":
+        """
+        :return: The duration with every part negated.
+        :rtype: Duration
+        """
+
+        return Duration._create(-self.years, -self.months, -self.delta)
+
+    def __radd__(
+        self,
+        other: Any,
+    ) -> Any:
+        """
+        Applies the duration to a datetime-like object (datetime + duration).
+
+        :param other: The datetime-like object.
+        :type other: datetime
+
+        :return: The shifted object.
+        :rtype: datetime
+        """
+
+        if isinstance(other, timedelta):
+            return self + other
+
+        if hasattr(other, "replace"):
+            return self.add_to(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the duration.
+
+        :return: The representation, including the ISO 8601 form.
+        :rtype: str
+        """
+
+        try:
+            return f"Duration.parse({self.isoformat()!r})"
+        except DateFormatError:
+            return f"Duration(years={self.years}, months={self.months}, seconds={self.delta.total_seconds()!r})"
+
+    def __reduce__(self) -> Tuple[Any, Tuple[int, int, timedelta]]:
+        """
+        Returns the pickling recipe of the duration.
+
+        :return: The factory and its arguments.
+        :rtype: Tuple[Any, Tuple[int, int, timedelta]]
+        """
+
+        return (Duration._create, (self.years, self.months, self.delta))
+
+    def __rsub__(
+        self,
+        other: Any,
+    ) -> Any:
+        """
+        Applies the negated duration to a datetime-like object (datetime - duration).
+
+        :param other: The datetime-like object.
+        :type other: datetime
+
+        :return: The shifted object.
+        :rtype: datetime
+        """
+
+        if isinstance(other, timedelta):
+            return -self + other
+
+        if hasattr(other, "replace"):
+            return self.add_to(other, -1)
+
+        return NotImplemented
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Rejects attribute assignment, because durations are immutable.
+
+        :raises AttributeError: Always.
+        """
+
+        raise AttributeError("Duration objects are immutable.")
+
+    def __str__(self) -> str:
+        """
+        :return: The ISO 8601 form of the duration.
+        :rtype: str
+        """
+
+        return self.isoformat()
+
+    def __sub__(
+        self,
+        other: Any,
+    ) -> Any:
+        """
+        Subtracts another Duration or a timedelta.
+
+        :param other: The Duration or timedelta to subtract.
+        :type other: Union[Duration, timedelta]
+
+        :return: The difference.
+        :rtype: Duration
+        """
+
+        if isinstance(other, (Duration, timedelta)):
+            return self + -other
+
+        return NotImplemented
+
+    @property
+    def is_exact(self) -> bool:
+        """
+        :return: True if the duration has no calendar part, False otherwise.
+        :rtype: bool
+        """
+
+        return not (self.years or self.months)
+
+    @classmethod
+    def from_timedelta(
+        cls,
+        delta: timedelta,
+    ) -> "Duration":
+        """
+        Creates an exact Duration from a timedelta.
+
+        :param delta: The timedelta.
+        :type delta: timedelta
+
+        :return: The duration.
+        :rtype: Duration
+        """
+
+        return cls._create(0, 0, delta)
+
+    @classmethod
+    def parse(
+        cls,
+        text: str,
+    ) -> "Duration":
+        """
+        Parses an ISO 8601 duration (e.g. "P1DT2H30M", "PT15M", "-P1Y").
+
+        Results are cached per distinct string, so recurring configuration
+        values are parsed only once.
+
+        :param text: The duration string.
+        :type text: str
+
+        :return: The parsed duration.
+        :rtype: Duration
+
+        :raises DateParsingFormatError: If the string is not a valid ISO 8601 duration.
+        """
+
+        return _parse(text)
+
+    def add_to(
+        self,
+        value: Any,
+        factor: int = 1,
+    ) -> Any:
+        """
+        Applies the duration (times a factor) to a naive or aware datetime-like object.
+
+        The arithmetic is done on the value as it is; use DateUtil.increment
+        for wall or absolute semantics on aware values.
+
+        :param value: The datetime, date or compact value.
+        :type value: datetime
+        :param factor: The number of times to apply the duration. Defaults to 1.
+        :type factor: int
+
+        :return: The shifted value.
+        :rtype: datetime
+
+        :raises DateArithmeticError: If the result is out of range.
+        """
+
+        months: int = (self.years * 12 + self.months) * factor
+
+        try:
+            if months:
+                # Month arithmetic clamps the day to the end of the target month.
+                years, month = divmod(value.month - 1 + months, 12)
+                year: int = value.year + years
+
+                value = value.replace(
+                    year=year,
+                    month=month + 1,
+                    day=min(value.day, monthrange(year, month + 1)[1]),
+                )
+
+            if self.delta:
+                value = value + self.delta * factor
+        except (OverflowError, ValueError) as e:
+            raise DateArithmeticError(
+                f"Applying {self} to {value} is out of range.",
+            ) from e
+
+        return value
+
+    def isoformat(self) -> str:
+        """
+        Formats the duration as ISO 8601, e.g. "P1Y2M3DT4H5M6.5S" or "PT0S".
+
+        :return: The duration string.
+        :rtype: str
+
+        :raises DateFormatError: If the parts have mixed signs.
+        """
+
+        micros: int = self.delta // _MICROSECOND
+        parts: Tuple[int, int, int] = (self.years, self.months, micros)
+
+        negative: bool = any(part < 0 for part in parts)
+
+        if negative and any(part > 0 for part in parts):
+            raise DateFormatError(
+                "Cannot format a duration whose parts have mixed signs as ISO 8601.",
+            )
+
+        years, months, micros = (abs(part) for part in parts)
+
+        days, micros = divmod(micros, 86_400_000_000)
+        hours, micros = divmod(micros, 3_600_000_000)
+        minutes, micros = divmod(micros, 60_000_000)
+        seconds, micros = divmod(micros, 1_000_000)
+
+        date_part: str = "".join(
+            f"{amount}{designator}"
+            for amount, designator in ((years, "Y"), (months, "M"), (days, "D"))
+            if amount
+        )
+
+        time_part: str = "".join(
+            f"{amount}{designator}" for amount, designator in ((hours, "H"), (minutes, "M")) if amount
+        )
+
+        if micros:
+            time_part += f"{seconds}.{micros:06d}".rstrip("0") + "S"
+        elif seconds:
+            time_part += f"{seconds}S"
+
+        if not date_part and not time_part:
+            time_part = "0S"
+
+        return ("-" if negative else "") + "P" + date_part + ("T" + time_part if time_part else "")
+
+    def total_seconds(self) -> float:
+        """
+        Returns the length of an exact duration in seconds.
+
+        :return: The length in seconds.
+        :rtype: float
+
+        :raises DateArithmeticError: If the duration has a calendar part.
+        """
+
+        if not self.is_exact:
+            raise DateArithmeticError(
+                f"The duration {self} has calendar parts and no fixed length.",
+            )
+
+        return self.delta.total_seconds()
+
+    @classmethod
+    def _create(
+        cls,
+        years: int,
+        months: int,
+        delta: timedelta,
+    ) -> "Duration":
+        """
+        Creates a Duration from its stored parts.
+
+        :param years: The calendar years.
+        :type years: int
+        :param months: The calendar months.
+        :type months: int
+        :param delta: The exact part.
+        :type delta: timedelta
+
+        :return: The duration.
+        :rtype: Duration
+        """
+
+        duration: Duration = cls.__new__(cls)
+        object.__setattr__(duration, "years", years)
+        object.__setattr__(duration, "months", months)
+        object.__setattr__(duration, "delta", delta)
+
+        return duration
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse(text: str) -> Duration:
+    """
+    Parses an ISO 8601 duration string (cached per distinct string).
+
+    :param text: The duration string.
+    :type text: str
+
+    :return: The parsed duration.
+    :rtype: Duration
+
+    :raises DateParsingFormatError: If the string is not a valid ISO 8601 duration or exceeds the timedelta range.
+    """
+
+    found: Optional[re.Match] = _DURATION.fullmatch(text)
+
+    # A duration needs at least one component, and "T" at least one time component.
+    if found is None or text.endswith(("P", "T")):
+        raise DateParsingFormatError(
+            f"Invalid ISO 8601 duration: {text}.",
+        )
+
+    micros: int = 0
+
+    try:
+        for name, length in _EXACT:
+            amount: Optional[str] = found.group(name)
+
+            if amount is None:
+                continue
+
+            whole, _, fraction = amount.replace(",", ".").partition(".")
+            micros += int(whole) * length
+
+            if fraction:
+                micros += round(int(fraction) * length / 10 ** len(fraction))
+
+        sign: int = -1 if found.group("sign") == "-" else 1
+        delta: timedelta = timedelta(microseconds=sign * micros)
+    except OverflowError as e:
+        raise DateParsingFormatError(
+            f"ISO 8601 duration out of range: {text}.",
+        ) from e
+
+    return Duration._create(
+        sign * int(found.group("years") or 0),
+        sign * int(found.group("months") or 0),
+        delta,
+    )
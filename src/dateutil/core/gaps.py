@@ -0,0 +1,295 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+__all__: Final[List[str]] = ["GapDetector", "SeriesEvent"]
+
+
+# The kinds of irregularities a GapDetector reports.
+EventKind = Literal["gap", "duplicate", "out_of_order"]
+
+# The units of calculate_difference that have a fixed length, in microseconds.
+# "milisconds" is the spelling used by DateUtil.calculate_difference.
+_UNIT_MICROS: Final[Dict[str, int]] = {
+    "days": 86_400_000_000,
+    "hours": 3_600_000_000,
+    "milisconds": 1_000,
+    "milliseconds": 1_000,
+    "minutes": 60_000_000,
+    "seconds": 1_000_000,
+    "weeks": 604_800_000_000,
+}
+
+# The length of one epoch integer in microseconds (nanoseconds are handled separately).
+_EPOCH_UNITS: Final[Dict[str, int]] = {
+    "s": 1_000_000,
+    "ms": 1_000,
+    "us": 1,
+    "ns": 1,
+}
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+
+class SeriesEvent(NamedTuple):
+    """
+    An irregularity found in a timestamp series.
+    """
+
+    # The key of the stream (None for a single stream).
+    key: Hashable
+
+    # "gap", "duplicate" or "out_of_order".
+    kind: str
+
+    # The latest value seen before the current one, as it was passed in.
+    previous: Any
+
+    # The value that triggered the event, as it was passed in.
+    current: Any
+
+    # The number of expected values that are missing (gaps only, otherwise 0).
+    missing: int
+
+    # The signed distance from previous to current in the detector's unit.
+    difference: float
+
+
+class GapDetector:
+    """
+    A one-pass detector for gaps, duplicates and out-of-order values in sorted timestamp streams.
+
+    Every stream is tracked by its key with a constant amount of state (the
+    latest value), so arbitrarily long streams and many keyed streams can be
+    checked without holding them in memory. Values may be datetime objects
+    (naive values are taken as UTC) or epoch integers.
+    """
+
+    def __init__(
+        self,
+        cadence: Union[int, float, timedelta],
+        unit: Literal["days", "hours", "milisconds", "minutes", "seconds", "weeks"] = "seconds",
+        tolerance: float = 0.5,
+        epoch_unit: Literal["s", "ms", "us", "ns"] = "us",
+    ) -> None:
+        """
+        Initializes the GapDetector.
+
+        :param cadence: The expected distance between consecutive values, in the given unit or as a timedelta.
+        :type cadence: Union[int, float, timedelta]
+        :param unit: The unit of the cadence and of reported differences (the calculate_difference vocabulary). Defaults to "seconds".
+        :type unit: Literal["days", "hours", "milisconds", "minutes", "seconds", "weeks"]
+        :param tolerance: The fraction of the cadence a distance may exceed it by before it counts as a gap. Defaults to 0.5.
+        :type tolerance: float
+        :param epoch_unit: The unit of epoch integer values. Defaults to "us".
+        :type epoch_unit: Literal["s", "ms", "us", "ns"]
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If an option is invalid.
+        """
+
+        if unit not in _UNIT_MICROS:
+            raise ValueError(
+                f"Invalid value for 'unit': {unit}. "
+                "Must be one of: 'days', 'hours', 'milisconds', 'minutes', 'seconds', 'weeks'.",
+            )
+
+        if epoch_unit not in _EPOCH_UNITS:
+            raise ValueError(
+                f"Invalid value for 'epoch_unit': {epoch_unit}. Must be one of: 's', 'ms', 'us', 'ns'.",
+            )
+
+        # All values are compared as integers in the epoch unit.
+        scale: int = 1000 if epoch_unit == "ns" else 1
+        per_micro: int = _EPOCH_UNITS[epoch_unit]
+
+        if isinstance(cadence, timedelta):
+            cadence_micros: float = cadence / _MICROSECOND
+        else:
+            cadence_micros = cadence * _UNIT_MICROS[unit]
+
+        if cadence_micros <= 0:
+            raise ValueError(
+                f"Invalid value for 'cadence': {cadence}. Must be positive.",
+            )
+
+        if tolerance < 0:
+            raise ValueError(
+                f"Invalid value for 'tolerance': {tolerance}. Must not be negative.",
+            )
+
+        self.unit: str = unit
+        self.epoch_unit: str = epoch_unit
+
+        self._scale: int = scale
+        self._per_micro: int = per_micro
+        self._cadence: float = cadence_micros * scale / per_micro
+        self._limit: float = self._cadence * (1 + tolerance)
+        self._unit_length: float = _UNIT_MICROS[unit] * scale / per_micro
+
+        # The state per stream: key -> (latest integer value, latest original value).
+        self._latest: Dict[Hashable, Tuple[int, Any]] = {}
+
+        # The number of events per kind.
+        self.counts: Dict[str, int] = {
+            "gap": 0,
+            "duplicate": 0,
+            "out_of_order": 0,
+        }
+
+    def __len__(self) -> int:
+        """
+        Returns the number of tracked streams.
+
+        :return: The number of keys seen so far.
+        :rtype: int
+        """
+
+        return len(self._latest)
+
+    def forget(
+        self,
+        key: Hashable = None,
+    ) -> None:
+        """
+        Drops the state of a stream, e.g. when a sensor is decommissioned.
+
+        :param key: The key of the stream. Defaults to None (the single stream).
+        :type key: Hashable
+
+        :return: None
+        :rtype: None
+        """
+
+        self._latest.pop(key, None)
+
+    def observe(
+        self,
+        value: Union[datetime, int],
+        key: Hashable = None,
+    ) -> Optional[SeriesEvent]:
+        """
+        Checks one value against the latest value of its stream.
+
+        Out-of-order values are reported but do not move the stream back, so a
+        single late value does not cause a spurious gap afterwards.
+
+        :param value: The timestamp as a datetime object or an epoch integer.
+        :type value: Union[datetime, int]
+        :param key: The key of the stream. Defaults to None (a single stream).
+        :type key: Hashable
+
+        :return: The event the value triggered, if any.
+        :rtype: Optional[SeriesEvent]
+        """
+
+        if isinstance(value, datetime):
+            current: int = (
+                (value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND
+            ) * self._scale // self._per_micro
+        else:
+            current = value
+
+        state: Optional[Tuple[int, Any]] = self._latest.get(key)
+
+        if state is None:
+            self._latest[key] = (current, value)
+            return None
+
+        latest, original = state
+        distance: int = current - latest
+
+        if distance > 0:
+            self._latest[key] = (current, value)
+
+            if distance <= self._limit:
+                return None
+
+            kind: str = "gap"
+            missing: int = max(round(distance / self._cadence) - 1, 1)
+        elif distance == 0:
+            kind = "duplicate"
+            missing = 0
+        else:
+            kind = "out_of_order"
+            missing = 0
+
+        self.counts[kind] += 1
+
+        return SeriesEvent(
+            key=key,
+            kind=kind,
+            previous=original,
+            current=value,
+            missing=missing,
+            difference=distance / self._unit_length,
+        )
+
+    def scan(
+        self,
+        values: Iterable[Union[datetime, int]],
+        key: Hashable = None,
+    ) -> Iterator[SeriesEvent]:
+        """
+        Lazily checks a stream and yields its irregularities.
+
+        :param values: The timestamps as datetime objects or epoch integers.
+        :type values: Iterable[Union[datetime, int]]
+        :param key: The key of the stream. Defaults to None (a single stream).
+        :type key: Hashable
+
+        :return: An iterator over the events, in stream order.
+        :rtype: Iterator[SeriesEvent]
+        """
+
+        observe = self.observe
+
+        for value in values:
+            event: Optional[SeriesEvent] = observe(value, key)
+
+            if event is not None:
+                yield event
+
+    def scan_keyed(
+        self,
+        pairs: Iterable[Tuple[Hashable, Union[datetime, int]]],
+    ) -> Iterator[SeriesEvent]:
+        """
+        Lazily checks an interleaved sequence of (key, timestamp) pairs from many streams.
+
+        :param pairs: The (key, timestamp) pairs.
+        :type pairs: Iterable[Tuple[Hashable, Union[datetime, int]]]
+
+        :return: An iterator over the events, in input order.
+        :rtype: Iterator[SeriesEvent]
+        """
+
+        observe = self.observe
+
+        for key, value in pairs:
+            event: Optional[SeriesEvent] = observe(value, key)
+
+            if event is not None:
+                yield event
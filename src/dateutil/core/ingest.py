@@ -0,0 +1,407 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Deque, Dict, Final, Iterator, List, Literal, Optional, Tuple, Union
+
+from .core import DateFormat, DateParsingError, DateUtil, DateUtilError
+
+
+__all__: Final[List[str]] = ["IngestStats", "NAT", "ParallelIngest"]
+
+
+# The sentinel stored for unparseable values under the "sentinel" error policy.
+NAT: Final[int] = -(2**63)
+
+# The default size of a byte range handed to one worker.
+DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024 * 1024
+
+# The epoch units values can be returned in.
+EpochUnit = Literal["s", "ms", "us", "ns"]
+
+# What to do with values that cannot be parsed.
+ErrorPolicy = Literal["raise", "skip", "sentinel"]
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# The step of every epoch unit; nanoseconds are scaled up from microseconds.
+_UNITS: Final[Dict[str, timedelta]] = {
+    "s": timedelta(seconds=1),
+    "ms": timedelta(milliseconds=1),
+    "us": timedelta(microseconds=1),
+    "ns": timedelta(microseconds=1),
+}
+
+# A worker task: (path, start, end, date format, column, delimiter, errors, encoding, unit).
+_Task = Tuple[str, int, int, Union[DateFormat, str], Optional[int], str, str, str, str]
+
+
+def _parse_chunk(task: _Task) -> Tuple[bytes, int]:
+    """
+    Parses the timestamps of one byte range of a file.
+
+    This runs inside the worker processes, so it only takes and returns
+    picklable, compact values: the epoch values come back as the raw bytes
+    of an array('q') instead of a list of datetime objects.
+
+    :param task: The chunk description (see _Task).
+    :type task: _Task
+
+    :return: A tuple of (int64 epoch values as bytes, number of unparseable values).
+    :rtype: Tuple[bytes, int]
+
+    :raises DateParsingError: If a value cannot be parsed and the error policy is "raise".
+    """
+
+    path, start, end, date_format, column, delimiter, errors, encoding, unit = task
+
+    with open(path, "rb") as file:
+        file.seek(start)
+        data: bytes = file.read(end - start)
+
+    values: array = array("q")
+    append = values.append
+    parse = DateUtil.string_to_datetime
+    step: timedelta = _UNITS[unit]
+    scale: int = 1000 if unit == "ns" else 1
+    failures: int = 0
+    offset: int = start
+
+    for raw in data.split(b"\n"):
+        line_offset: int = offset
+        offset += len(raw) + 1
+
+        try:
+            line: str = raw.decode(encoding).rstrip("\r")
+
+            if not line:
+                continue
+
+            field: str = line if column is None else _field(line, column, delimiter)
+            parsed: datetime = parse(field, date_format)
+
+            # Naive values are taken as UTC, aware values carry their own offset.
+            # Values outside the int64 range (e.g. nanoseconds after 2262) overflow the array.
+            if parsed.tzinfo is None:
+                append((parsed - _EPOCH) // step * scale)
+            else:
+                append((parsed - _EPOCH_UTC) // step * scale)
+        except (DateUtilError, OverflowError, UnicodeDecodeError) as e:
+            failures += 1
+
+            if errors == "raise":
+                # The line itself may be the invalid part, so it is decoded leniently here.
+                text: str = raw.decode(encoding, "replace").rstrip("\r")
+
+                raise DateParsingError(
+                    f"Cannot parse {text!r} at byte offset {line_offset} of {path}.",
+                ) from e
+
+            if errors == "sentinel":
+                append(NAT)
+
+    return (values.tobytes(), failures)
+
+
+def _field(
+    line: str,
+    column: int,
+    delimiter: str,
+) -> str:
+    """
+    Returns one column of a delimited line.
+
+    :param line: The line.
+    :type line: str
+    :param column: The zero-based column index.
+    :type column: int
+    :param delimiter: The column delimiter.
+    :type delimiter: str
+
+    :return: The column value with surrounding whitespace removed (empty if the column is missing).
+    :rtype: str
+    """
+
+    fields: List[str] = line.split(delimiter, column + 1)
+
+    return fields[column].strip() if column < len(fields) else ""
+
+
+class IngestStats:
+    """
+    The counters of one ParallelIngest run, updated as the chunks are consumed.
+
+    Attributes:
+        chunks (int): The number of parsed byte ranges.
+        values (int): The number of returned epoch values (including NAT sentinels).
+        failures (int): The number of values that could not be parsed.
+    """
+
+    __slots__ = ("chunks", "values", "failures")
+
+    def __init__(self) -> None:
+        """
+        Initializes the IngestStats with zero counters.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.chunks: int = 0
+        self.values: int = 0
+        self.failures: int = 0
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the counters.
+
+        :return: The representation, including every counter.
+        :rtype: str
+        """
+
+        return f"IngestStats(chunks={self.chunks}, values={self.values}, failures={self.failures})"
+
+
+class ParallelIngest:
+    """
+    Parallel parsing of timestamp columns in large text files.
+
+    The file is split into byte ranges aligned to line boundaries, and each
+    range is parsed in a ProcessPoolExecutor worker with the DateFormat parsers.
+    Workers return compact int64 epoch arrays, which are reassembled in file order,
+    and the number of unparseable values, which is reported through IngestStats.
+    """
+
+    @classmethod
+    def iter_file(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+        column: Optional[int] = None,
+        delimiter: str = ",",
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        errors: ErrorPolicy = "raise",
+        skip_lines: int = 0,
+        encoding: str = "utf-8",
+        unit: EpochUnit = "us",
+        stats: Optional[IngestStats] = None,
+    ) -> Iterator[array]:
+        """
+        Parses a file in parallel and yields the epoch values chunk by chunk, in file order.
+
+        :param path: The file to parse.
+        :type path: Union[str, os.PathLike[str]]
+        :param date_format: The format of the timestamps. Defaults to ISO 8601.
+        :type date_format: Union[DateFormat, str]
+        :param column: The zero-based column holding the timestamp (default is the whole line).
+        :type column: Optional[int]
+        :param delimiter: The column delimiter. Defaults to ",".
+        :type delimiter: str
+        :param workers: The number of worker processes (default is the CPU count; 1 parses inline).
+        :type workers: Optional[int]
+        :param chunk_size: The approximate size of a byte range in bytes. Defaults to 64 MiB.
+        :type chunk_size: int
+        :param errors: What to do with unparseable values: "raise", "skip" or "sentinel" (store NAT). Defaults to "raise".
+        :type errors: Literal["raise", "skip", "sentinel"]
+        :param skip_lines: The number of leading lines (e.g. headers) to skip. Defaults to 0.
+        :type skip_lines: int
+        :param encoding: The text encoding of the file. Defaults to "utf-8".
+        :type encoding: str
+        :param unit: The epoch unit of the returned values. Defaults to "us".
+        :type unit: Literal["s", "ms", "us", "ns"]
+        :param stats: The counters to update with every chunk, e.g. to report the unparseable values under the "skip" and "sentinel" policies.
+        :type stats: Optional[IngestStats]
+
+        :return: An iterator over array('q') chunks of epoch values.
+        :rtype: Iterator[array]
+
+        :raises DateParsingError: If a value cannot be parsed and the error policy is "raise".
+        :raises ValueError: If an option is invalid.
+        """
+
+        if errors not in ("raise", "skip", "sentinel"):
+            raise ValueError(
+                f"Invalid value for 'errors': {errors}. Must be one of: 'raise', 'skip', 'sentinel'.",
+            )
+
+        if unit not in _UNITS:
+            raise ValueError(
+                f"Invalid value for 'unit': {unit}. Must be one of: 's', 'ms', 'us', 'ns'.",
+            )
+
+        path = os.fspath(path)
+
+        tasks: List[_Task] = [
+            (path, start, end, date_format, column, delimiter, errors, encoding, unit)
+            for start, end in cls.split(
+                path=path,
+                chunk_size=chunk_size,
+                skip_lines=skip_lines,
+            )
+        ]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # A single worker (or a single chunk) is not worth a process pool.
+        if workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                yield cls._to_array(*_parse_chunk(task), stats)
+
+            return
+
+        workers = min(workers, len(tasks))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep at most two chunks per worker in flight, so a slow consumer
+            # does not pile up the results of the whole file in memory.
+            pending: Deque["Future[Tuple[bytes, int]]"] = deque()
+            remaining: Iterator[_Task] = iter(tasks)
+
+            for task in islice(remaining, 2 * workers):
+                pending.append(executor.submit(_parse_chunk, task))
+
+            while pending:
+                data, failures = pending.popleft().result()
+
+                for task in islice(remaining, 1):
+                    pending.append(executor.submit(_parse_chunk, task))
+
+                # Results are taken in submission order, i.e. in file order.
+                yield cls._to_array(data, failures, stats)
+
+    @classmethod
+    def parse_file(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+        column: Optional[int] = None,
+        delimiter: str = ",",
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        errors: ErrorPolicy = "raise",
+        skip_lines: int = 0,
+        encoding: str = "utf-8",
+        unit: EpochUnit = "us",
+        stats: Optional[IngestStats] = None,
+    ) -> array:
+        """
+        Parses a file in parallel and returns all epoch values in file order.
+
+        See iter_file for the parameters.
+
+        :return: The epoch values as an array('q').
+        :rtype: array
+
+        :raises DateParsingError: If a value cannot be parsed and the error policy is "raise".
+        :raises ValueError: If an option is invalid.
+        """
+
+        result: array = array("q")
+
+        for chunk in cls.iter_file(
+            path=path,
+            date_format=date_format,
+            column=column,
+            delimiter=delimiter,
+            workers=workers,
+            chunk_size=chunk_size,
+            errors=errors,
+            skip_lines=skip_lines,
+            encoding=encoding,
+            unit=unit,
+            stats=stats,
+        ):
+            result.extend(chunk)
+
+        return result
+
+    @classmethod
+    def split(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        skip_lines: int = 0,
+    ) -> List[Tuple[int, int]]:
+        """
+        Splits a file into byte ranges that start and end on line boundaries.
+
+        :param path: The file to split.
+        :type path: Union[str, os.PathLike[str]]
+        :param chunk_size: The approximate size of a range in bytes. Defaults to 64 MiB.
+        :type chunk_size: int
+        :param skip_lines: The number of leading lines to leave out. Defaults to 0.
+        :type skip_lines: int
+
+        :return: The (start, end) byte offsets of every range, in file order.
+        :rtype: List[Tuple[int, int]]
+
+        :raises ValueError: If the chunk size is not positive.
+        """
+
+        if chunk_size <= 0:
+            raise ValueError(
+                f"Invalid value for 'chunk_size': {chunk_size}. Must be positive.",
+            )
+
+        size: int = os.path.getsize(path)
+        ranges: List[Tuple[int, int]] = []
+
+        with open(path, "rb") as file:
+            for _ in range(skip_lines):
+                file.readline()
+
+            start: int = file.tell()
+
+            while start < size:
+                # Move the tentative end forward to the next line boundary.
+                file.seek(min(start + chunk_size, size))
+                file.readline()
+
+                end: int = min(file.tell(), size)
+
+                ranges.append((start, end))
+
+                start = end
+
+        return ranges
+
+    @classmethod
+    def _to_array(
+        cls,
+        data: bytes,
+        failures: int,
+        stats: Optional[IngestStats],
+    ) -> array:
+        """
+        Rebuilds an array('q') from the bytes returned by a worker and updates the counters.
+
+        :param data: The raw int64 values.
+        :type data: bytes
+        :param failures: The number of unparseable values of the chunk.
+        :type failures: int
+        :param stats: The counters to update, if any.
+        :type stats: Optional[IngestStats]
+
+        :return: The epoch values.
+        :rtype: array
+        """
+
+        result: array = array("q")
+        result.frombytes(data)
+
+        if stats is not None:
+            stats.chunks += 1
+            stats.values += len(result)
+            stats.failures += failures
+
+        return result
@@ -0,0 +1,378 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from enum import Enum
+from functools import wraps
+from inspect import Parameter, signature
+from threading import Lock, local
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple, Type
+
+from .core import DateUtil
+
+
+__all__: Final[List[str]] = ["Instrumentation"]
+
+
+# The instrumented operations, mapped to the parameter that provides their
+# breakdown dimension (None for operations without a breakdown).
+_OPERATIONS: Final[Dict[str, Optional[Tuple[str, str]]]] = {
+    "calculate_difference": ("as_", "unit"),
+    "datetime_to_string": ("date_format", "format"),
+    "decrement": ("what", "unit"),
+    "decrement_many": ("what", "unit"),
+    "increment": ("what", "unit"),
+    "increment_many": ("what", "unit"),
+    "is_date_in_range": None,
+    "is_valid_date": None,
+    "is_valid_date_format": ("date_format", "format"),
+    "is_valid_iso_format": None,
+    "parse_date_string": ("date_format", "format"),
+    "string_to_datetime": ("date_format", "format"),
+}
+
+# A counter key: (operation, dimension name, dimension value).
+_Key = Tuple[str, str, str]
+
+
+# The unit names reported as their own label value; any other unit (a
+# Duration or an ISO 8601 duration string) is reported as "duration".
+_UNIT_LABELS: Final[frozenset] = frozenset(
+    (
+        "days",
+        "hours",
+        "milisconds",
+        "minutes",
+        "months",
+        "seconds",
+        "weeks",
+        "years",
+    )
+)
+
+# The call depth of the instrumented operations per thread, so that operations
+# calling other operations are only counted once.
+_STATE: Final[local] = local()
+
+
+def _label_value(
+    value: Any,
+    label: str,
+) -> str:
+    """
+    Returns the label value of a breakdown argument.
+
+    The label values are bounded: formats other than DateFormat members are
+    reported as "custom" and units other than the plain unit names as
+    "duration", so arbitrary patterns and durations cannot grow the number of
+    counters (and Prometheus series) without limit.
+
+    :param value: The argument value (e.g. a DateFormat member or a unit name).
+    :type value: Any
+    :param label: The dimension name ("format" or "unit").
+    :type label: str
+
+    :return: The label value.
+    :rtype: str
+    """
+
+    # Enum members are reported by name (e.g. "ISO_8601").
+    if isinstance(value, Enum):
+        return value.name
+
+    if label == "unit":
+        return value if value in _UNIT_LABELS else "duration"
+
+    return "custom"
+
+
+def _escape(value: str) -> str:
+    """
+    Escapes a label value for the Prometheus text format.
+
+    :param value: The label value.
+    :type value: str
+
+    :return: The escaped label value.
+    :rtype: str
+    """
+
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Instrumentation:
+    """
+    Opt-in call, failure and time counters for the public DateUtil operations.
+
+    Enabling the instrumentation replaces the operations on the DateUtil class
+    with counting wrappers; disabling it restores the original methods, so the
+    disabled state costs nothing. Counters are broken down by DateFormat for
+    the parsing and formatting operations and by unit for the arithmetic ones.
+    Only the outermost operation of a call is counted, so an operation that
+    calls another one (e.g. decrement via increment) is not
+    counted twice.
+    """
+
+    # The original class attributes of every wrapped operation.
+    _originals: Dict[str, Optional[Any]] = {}
+
+    # The counters per key: [calls, failures, nanoseconds].
+    _counters: Dict[_Key, List[int]] = {}
+
+    # The instrumented class.
+    _target: Type[DateUtil] = DateUtil
+
+    _lock: Final[Lock] = Lock()
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Restores the original DateUtil operations. Recorded counters are kept.
+
+        :return: None
+        :rtype: None
+        """
+
+        with cls._lock:
+            for name, original in cls._originals.items():
+                # Inherited operations are restored by removing the wrapper.
+                if original is None:
+                    delattr(cls._target, name)
+                else:
+                    setattr(cls._target, name, original)
+
+            cls._originals.clear()
+
+    @classmethod
+    def enable(
+        cls,
+        target: Type[DateUtil] = DateUtil,
+    ) -> None:
+        """
+        Replaces the DateUtil operations with counting wrappers.
+
+        :param target: The class to instrument (DateUtil or a subclass). Defaults to DateUtil.
+        :type target: Type[DateUtil]
+
+        :return: None
+        :rtype: None
+        """
+
+        # Switch targets cleanly if another class is currently instrumented.
+        if cls._originals and target is not cls._target:
+            cls.disable()
+
+        with cls._lock:
+            cls._target = target
+
+            for name, dimension in _OPERATIONS.items():
+                if name in cls._originals:
+                    continue
+
+                # Subclasses may inherit the operation (stored as None).
+                cls._originals[name] = target.__dict__.get(name)
+
+                setattr(
+                    target,
+                    name,
+                    classmethod(
+                        cls._wrap(
+                            name=name,
+                            function=getattr(target, name).__func__,
+                            dimension=dimension,
+                        )
+                    ),
+                )
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Returns whether the instrumentation is active.
+
+        :return: True if the DateUtil operations are currently wrapped, False otherwise.
+        :rtype: bool
+        """
+
+        return bool(cls._originals)
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Discards every recorded counter.
+
+        :return: None
+        :rtype: None
+        """
+
+        with cls._lock:
+            cls._counters.clear()
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the recorded counters as a plain dictionary.
+
+        Every operation reports its total calls, failures and seconds, plus a
+        "by_<dimension>" breakdown (e.g. "by_format", "by_unit") where applicable.
+
+        :return: A dictionary mapping each operation to its counters.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+
+        with cls._lock:
+            counters: List[Tuple[_Key, List[int]]] = sorted(
+                (key, list(values)) for key, values in cls._counters.items()
+            )
+
+        result: Dict[str, Dict[str, Any]] = {}
+
+        for (operation, dimension, value), (calls, failures, nanoseconds) in counters:
+            entry: Dict[str, Any] = result.setdefault(
+                operation,
+                {
+                    "calls": 0,
+                    "failures": 0,
+                    "seconds": 0.0,
+                },
+            )
+
+            entry["calls"] += calls
+            entry["failures"] += failures
+            entry["seconds"] += nanoseconds / 1_000_000_000
+
+            if dimension:
+                entry.setdefault(f"by_{dimension}", {})[value] = {
+                    "calls": calls,
+                    "failures": failures,
+                    "seconds": nanoseconds / 1_000_000_000,
+                }
+
+        return result
+
+    @classmethod
+    def to_prometheus(
+        cls,
+        prefix: str = "dateutil",
+    ) -> str:
+        """
+        Returns the recorded counters in the Prometheus text exposition format.
+
+        :param prefix: The metric name prefix. Defaults to "dateutil".
+        :type prefix: str
+
+        :return: The metrics text, terminated by a newline.
+        :rtype: str
+        """
+
+        with cls._lock:
+            counters: List[Tuple[_Key, List[int]]] = sorted(
+                (key, list(values)) for key, values in cls._counters.items()
+            )
+
+        metrics: List[Tuple[str, str, int, Callable[[int], str]]] = [
+            ("calls_total", "Number of DateUtil operation calls.", 0, str),
+            ("failures_total", "Number of DateUtil operation calls that raised.", 1, str),
+            (
+                "duration_seconds_total",
+                "Cumulative time spent in DateUtil operations.",
+                2,
+                lambda nanoseconds: repr(nanoseconds / 1_000_000_000),
+            ),
+        ]
+
+        lines: List[str] = []
+
+        for suffix, help_text, position, render in metrics:
+            name: str = f"{prefix}_{suffix}"
+
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+
+            for (operation, dimension, value), values in counters:
+                labels: str = f'operation="{_escape(operation)}"'
+
+                if dimension:
+                    labels += f',{dimension}="{_escape(value)}"'
+
+                lines.append(f"{name}{{{labels}}} {render(values[position])}")
+
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def _wrap(
+        cls,
+        name: str,
+        function: Callable[..., Any],
+        dimension: Optional[Tuple[str, str]],
+    ) -> Callable[..., Any]:
+        """
+        Creates the counting wrapper of an operation.
+
+        :param name: The operation name.
+        :type name: str
+        :param function: The underlying function of the classmethod.
+        :type function: Callable[..., Any]
+        :param dimension: The (parameter, dimension name) pair of the breakdown, if any.
+        :type dimension: Optional[Tuple[str, str]]
+
+        :return: The wrapper function (to be wrapped in a classmethod).
+        :rtype: Callable[..., Any]
+        """
+
+        counters: Dict[_Key, List[int]] = cls._counters
+        lock: Lock = cls._lock
+
+        parameter: Optional[str] = None
+        label: str = ""
+        position: int = -1
+        default: Any = None
+
+        if dimension is not None:
+            parameter, label = dimension
+
+            # Locate the parameter once, so calls only do an index or dict lookup.
+            parameters: List[Parameter] = list(signature(function).parameters.values())[1:]
+            names: List[str] = [item.name for item in parameters]
+            position = names.index(parameter)
+            default = parameters[position].default
+
+        @wraps(function)
+        def wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+            # Nested operations (e.g. increment_many calling increment) are
+            # part of the outermost call and are not counted on their own.
+            if getattr(_STATE, "depth", 0):
+                return function(owner, *args, **kwargs)
+
+            if parameter is None:
+                key: _Key = (name, "", "")
+            elif position < len(args):
+                key = (name, label, _label_value(args[position], label))
+            else:
+                key = (name, label, _label_value(kwargs.get(parameter, default), label))
+
+            failed: int = 0
+            start: int = perf_counter_ns()
+            _STATE.depth = 1
+
+            try:
+                return function(owner, *args, **kwargs)
+            except BaseException:
+                failed = 1
+                raise
+            finally:
+                elapsed: int = perf_counter_ns() - start
+                _STATE.depth = 0
+
+                with lock:
+                    values: Optional[List[int]] = counters.get(key)
+
+                    if values is None:
+                        counters[key] = [1, failed, elapsed]
+                    else:
+                        values[0] += 1
+                        values[1] += failed
+                        values[2] += elapsed
+
+        return wrapper
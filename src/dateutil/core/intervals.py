@@ -0,0 +1,444 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from typing import (
+    Any,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from .core import DateRangeError
+
+
+__all__: Final[List[str]] = ["IntervalSet"]
+
+
+# An interval as a (start, end) pair of datetime objects (or other comparable instants).
+Interval = Tuple[Any, Any]
+
+
+class IntervalSet:
+    """
+    An immutable set of half-open [start, end) intervals.
+
+    The intervals are kept normalised: sorted by start, non-empty, and
+    neither overlapping nor touching (adjacent intervals are merged).
+    Because both operands are normalised, union, intersection and
+    difference are single merge passes in O(n + m), and membership and
+    clipping use binary search. Instants can be datetime objects or any
+    other ordered values whose differences can be summed (e.g. epoch numbers).
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(
+        self,
+        intervals: Iterable[Interval] = (),
+    ) -> None:
+        """
+        Initializes the IntervalSet by normalising the intervals.
+
+        :param intervals: The (start, end) pairs, in any order; empty intervals are dropped.
+        :type intervals: Iterable[Tuple[datetime, datetime]]
+
+        :return: None
+        :rtype: None
+
+        :raises DateRangeError: If an interval ends before it starts.
+        """
+
+        pairs: List[Interval] = []
+
+        for start, end in intervals:
+            if end < start:
+                raise DateRangeError(
+                    f"Invalid interval: {start} to {end}. The end must not be before the start.",
+                )
+
+            if start < end:
+                pairs.append((start, end))
+
+        pairs.sort()
+
+        self._starts: List[Any] = []
+        self._ends: List[Any] = []
+
+        for start, end in pairs:
+            self._append(start, end)
+
+    def __and__(
+        self,
+        other: "IntervalSet",
+    ) -> "IntervalSet":
+        """
+        :return: The intersection of the sets.
+        :rtype: IntervalSet
+        """
+
+        return self.intersection(other)
+
+    def __bool__(self) -> bool:
+        """
+        :return: True if the set covers any time, False otherwise.
+        :rtype: bool
+        """
+
+        return bool(self._starts)
+
+    def __contains__(
+        self,
+        instant: Any,
+    ) -> bool:
+        """
+        :return: True if an interval contains the instant, False otherwise.
+        :rtype: bool
+        """
+
+        index: int = bisect_right(self._starts, instant) - 1
+
+        return index >= 0 and instant < self._ends[index]
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        :return: True if both sets cover exactly the same time, False otherwise.
+        :rtype: bool
+        """
+
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __iter__(self) -> Iterator[Interval]:
+        """
+        :return: An iterator over the (start, end) pairs in order.
+        :rtype: Iterator[Tuple[datetime, datetime]]
+        """
+
+        return zip(self._starts, self._ends)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of disjoint intervals.
+        :rtype: int
+        """
+
+        return len(self._starts)
+
+    def __or__(
+        self,
+        other: "IntervalSet",
+    ) -> "IntervalSet":
+        """
+        :return: The union of the sets.
+        :rtype: IntervalSet
+        """
+
+        return self.union(other)
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the interval set.
+
+        :return: The representation, listing the intervals.
+        :rtype: str
+        """
+
+        return f"IntervalSet({list(self)!r})"
+
+    def __sub__(
+        self,
+        other: "IntervalSet",
+    ) -> "IntervalSet":
+        """
+        :return: The difference of the sets.
+        :rtype: IntervalSet
+        """
+
+        return self.difference(other)
+
+    @property
+    def end(self) -> Any:
+        """
+        :return: The end of the last interval, or None if the set is empty.
+        :rtype: Optional[datetime]
+        """
+
+        return self._ends[-1] if self._ends else None
+
+    @property
+    def start(self) -> Any:
+        """
+        :return: The start of the first interval, or None if the set is empty.
+        :rtype: Optional[datetime]
+        """
+
+        return self._starts[0] if self._starts else None
+
+    def clip(
+        self,
+        start: Any,
+        end: Any,
+    ) -> "IntervalSet":
+        """
+        Returns the part of the set within [start, end), in O(log n + k).
+
+        :param start: The lower bound.
+        :type start: datetime
+        :param end: The upper bound.
+        :type end: datetime
+
+        :return: The clipped set.
+        :rtype: IntervalSet
+
+        :raises DateRangeError: If the bounds are reversed.
+        """
+
+        self._check_bounds(start, end)
+
+        # The intervals that end after the start and begin before the end.
+        first: int = bisect_right(self._ends, start)
+        last: int = bisect_left(self._starts, end)
+
+        result: IntervalSet = IntervalSet()
+
+        if first >= last or start == end:
+            return result
+
+        result._starts = self._starts[first:last]
+        result._ends = self._ends[first:last]
+
+        if result._starts[0] < start:
+            result._starts[0] = start
+
+        if result._ends[-1] > end:
+            result._ends[-1] = end
+
+        return result
+
+    def complement(
+        self,
+        start: Any,
+        end: Any,
+    ) -> "IntervalSet":
+        """
+        Returns the gaps of the set within [start, end), e.g. the outages of an availability set.
+
+        :param start: The lower bound.
+        :type start: datetime
+        :param end: The upper bound.
+        :type end: datetime
+
+        :return: The time within the bounds that the set does not cover.
+        :rtype: IntervalSet
+
+        :raises DateRangeError: If the bounds are reversed.
+        """
+
+        clipped: IntervalSet = self.clip(start, end)
+        result: IntervalSet = IntervalSet()
+
+        cursor: Any = start
+
+        for interval_start, interval_end in clipped:
+            if cursor < interval_start:
+                result._starts.append(cursor)
+                result._ends.append(interval_start)
+
+            cursor = interval_end
+
+        if cursor < end:
+            result._starts.append(cursor)
+            result._ends.append(end)
+
+        return result
+
+    def difference(
+        self,
+        other: "IntervalSet",
+    ) -> "IntervalSet":
+        """
+        Returns the time covered by this set but not by the other, in O(n + m).
+
+        :param other: The set to subtract.
+        :type other: IntervalSet
+
+        :return: The difference.
+        :rtype: IntervalSet
+        """
+
+        result: IntervalSet = IntervalSet()
+        other_starts: List[Any] = other._starts
+        other_ends: List[Any] = other._ends
+        count: int = len(other_starts)
+        index: int = 0
+
+        for start, end in zip(self._starts, self._ends):
+            # Skip the subtracted intervals that end before this one starts.
+            while index < count and other_ends[index] <= start:
+                index += 1
+
+            cursor: Any = start
+            position: int = index
+
+            while position < count and other_starts[position] < end:
+                if cursor < other_starts[position]:
+                    result._starts.append(cursor)
+                    result._ends.append(other_starts[position])
+
+                if other_ends[position] > cursor:
+                    cursor = other_ends[position]
+
+                if cursor >= end:
+                    break
+
+                position += 1
+
+            if cursor < end:
+                result._starts.append(cursor)
+                result._ends.append(end)
+
+        return result
+
+    def intersection(
+        self,
+        other: "IntervalSet",
+    ) -> "IntervalSet":
+        """
+        Returns the time covered by both sets, in O(n + m).
+
+        :param other: The other set.
+        :type other: IntervalSet
+
+        :return: The intersection.
+        :rtype: IntervalSet
+        """
+
+        result: IntervalSet = IntervalSet()
+        starts, ends = self._starts, self._ends
+        other_starts, other_ends = other._starts, other._ends
+        left: int = 0
+        right: int = 0
+
+        while left < len(starts) and right < len(other_starts):
+            start: Any = max(starts[left], other_starts[right])
+            end: Any = min(ends[left], other_ends[right])
+
+            if start < end:
+                result._starts.append(start)
+                result._ends.append(end)
+
+            # The interval that ends first cannot overlap anything else.
+            if ends[left] < other_ends[right]:
+                left += 1
+            else:
+                right += 1
+
+        return result
+
+    def total_duration(self) -> Any:
+        """
+        Returns the total time covered by the set.
+
+        :return: The sum of the interval lengths (timedelta(0) for an empty set).
+        :rtype: timedelta
+        """
+
+        if not self._starts:
+            return timedelta(0)
+
+        pairs: Iterator[Interval] = zip(self._starts, self._ends)
+        start, end = next(pairs)
+
+        return sum((end - start for start, end in pairs), end - start)
+
+    def union(
+        self,
+        other: "IntervalSet",
+    ) -> "IntervalSet":
+        """
+        Returns the time covered by either set, in O(n + m).
+
+        :param other: The other set.
+        :type other: IntervalSet
+
+        :return: The union.
+        :rtype: IntervalSet
+        """
+
+        result: IntervalSet = IntervalSet()
+        starts, ends = self._starts, self._ends
+        other_starts, other_ends = other._starts, other._ends
+        left: int = 0
+        right: int = 0
+
+        # Merge both start-ordered lists, coalescing as in normalisation.
+        while left < len(starts) or right < len(other_starts):
+            if right >= len(other_starts) or (left < len(starts) and starts[left] <= other_starts[right]):
+                result._append(starts[left], ends[left])
+                left += 1
+            else:
+                result._append(other_starts[right], other_ends[right])
+                right += 1
+
+        return result
+
+    def _append(
+        self,
+        start: Any,
+        end: Any,
+    ) -> None:
+        """
+        Appends an interval that starts no earlier than the last one, merging it if they overlap or touch.
+
+        :param start: The start of the interval.
+        :type start: datetime
+        :param end: The end of the interval.
+        :type end: datetime
+
+        :return: None
+        :rtype: None
+        """
+
+        if self._ends and start <= self._ends[-1]:
+            if end > self._ends[-1]:
+                self._ends[-1] = end
+
+            return
+
+        self._starts.append(start)
+        self._ends.append(end)
+
+    @staticmethod
+    def _check_bounds(
+        start: Any,
+        end: Any,
+    ) -> None:
+        """
+        Checks that a pair of bounds is not reversed.
+
+        :param start: The lower bound.
+        :type start: datetime
+        :param end: The upper bound.
+        :type end: datetime
+
+        :return: None
+        :rtype: None
+
+        :raises DateRangeError: If the end is before the start.
+        """
+
+        if end < start:
+            raise DateRangeError(
+                f"Invalid bounds: {start} to {end}. The end must not be before the start.",
+            )
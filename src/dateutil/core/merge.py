@@ -0,0 +1,187 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from heapq import heapify, heappop, heapreplace
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from .core import DateComparisonError, DateFormat, DateUtil
+
+
+__all__: Final[List[str]] = ["TimestampMerge"]
+
+
+class TimestampMerge:
+    """
+    Streaming k-way merge of streams that are each sorted by timestamp.
+
+    A heap holds one pending entry per stream, so memory is bounded by the
+    number of streams rather than the number of events, and every event costs
+    O(log k). Timestamps can be parsed on the fly from a DateFormat, and
+    ties are emitted in stream order, which keeps the merge stable.
+    """
+
+    @classmethod
+    def merge(
+        cls,
+        streams: Iterable[Iterable[Any]],
+        key: Optional[Callable[[Any], Any]] = None,
+        date_format: Optional[Union[DateFormat, str]] = None,
+        dedupe: bool = False,
+        strict: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Merges sorted streams into one stream ordered by timestamp.
+
+        Without a key every item is a timestamp itself; with a date format
+        string items are parsed, and the parsed timestamps are yielded.
+        With a key, the key extracts (and the date format parses) the
+        timestamp of each record, and the records are yielded.
+
+        :param streams: The streams, each sorted by timestamp.
+        :type streams: Iterable[Iterable[Any]]
+        :param key: The function that extracts the timestamp of a record (default is the item itself).
+        :type key: Optional[Callable[[Any], Any]]
+        :param date_format: The format of string timestamps to parse (default is no parsing).
+        :type date_format: Optional[Union[DateFormat, str]]
+        :param dedupe: Whether to drop items whose timestamp equals the previously emitted one. Defaults to False.
+        :type dedupe: bool
+        :param strict: Whether to raise if a stream is not sorted. Defaults to False.
+        :type strict: bool
+
+        :return: An iterator over the merged items.
+        :rtype: Iterator[Any]
+
+        :raises DateParsingFormatError: If a timestamp cannot be parsed.
+        :raises DateComparisonError: If strict is set and a stream goes backwards.
+        """
+
+        parse: Optional[Callable[..., Any]] = None
+
+        if date_format is not None:
+            parse = DateUtil.string_to_datetime
+
+        # Heap entries are [timestamp, stream index, item, iterator]; the
+        # stream index breaks ties, so items themselves are never compared.
+        heap: List[List[Any]] = []
+
+        for index, stream in enumerate(streams):
+            iterator: Iterator[Any] = iter(stream)
+
+            for item in iterator:
+                heap.append(cls._entry(item, index, iterator, key, parse, date_format))
+                break
+
+        heapify(heap)
+
+        emitted: bool = False
+        last: Any = None
+
+        while heap:
+            entry: List[Any] = heap[0]
+            timestamp, index, item, iterator = entry
+
+            if not (dedupe and emitted and timestamp == last):
+                yield item
+
+            emitted = True
+            last = timestamp
+
+            for following in iterator:
+                replacement: List[Any] = cls._entry(following, index, iterator, key, parse, date_format)
+
+                if strict and replacement[0] < timestamp:
+                    raise DateComparisonError(
+                        f"Stream {index} is not sorted: {replacement[0]} follows {timestamp}.",
+                    )
+
+                heapreplace(heap, replacement)
+                break
+            else:
+                heappop(heap)
+
+    @classmethod
+    def merge_strings(
+        cls,
+        streams: Iterable[Iterable[str]],
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+        dedupe: bool = False,
+        strict: bool = False,
+    ) -> Iterator[str]:
+        """
+        Merges sorted streams of timestamp strings, yielding the original strings.
+
+        :param streams: The streams of timestamp strings, each sorted by timestamp.
+        :type streams: Iterable[Iterable[str]]
+        :param date_format: The format of the strings. Defaults to ISO 8601.
+        :type date_format: Union[DateFormat, str]
+        :param dedupe: Whether to drop strings whose timestamp equals the previously emitted one. Defaults to False.
+        :type dedupe: bool
+        :param strict: Whether to raise if a stream is not sorted. Defaults to False.
+        :type strict: bool
+
+        :return: An iterator over the merged strings.
+        :rtype: Iterator[str]
+
+        :raises DateParsingFormatError: If a string cannot be parsed.
+        :raises DateComparisonError: If strict is set and a stream goes backwards.
+        """
+
+        return cls.merge(
+            streams=streams,
+            key=lambda item: item,
+            date_format=date_format,
+            dedupe=dedupe,
+            strict=strict,
+        )
+
+    @classmethod
+    def _entry(
+        cls,
+        item: Any,
+        index: int,
+        iterator: Iterator[Any],
+        key: Optional[Callable[[Any], Any]],
+        parse: Optional[Callable[..., Any]],
+        date_format: Optional[Union[DateFormat, str]],
+    ) -> List[Any]:
+        """
+        Creates the heap entry of an item.
+
+        :param item: The item.
+        :type item: Any
+        :param index: The index of the item's stream.
+        :type index: int
+        :param iterator: The iterator of the item's stream.
+        :type iterator: Iterator[Any]
+        :param key: The timestamp extractor, if any.
+        :type key: Optional[Callable[[Any], Any]]
+        :param parse: The string parser, if any.
+        :type parse: Optional[Callable[..., Any]]
+        :param date_format: The format passed to the parser.
+        :type date_format: Optional[Union[DateFormat, str]]
+
+        :return: The entry [timestamp, index, item, iterator].
+        :rtype: List[Any]
+        """
+
+        timestamp: Any = item if key is None else key(item)
+
+        if parse is not None:
+            timestamp = parse(timestamp, date_format)
+
+            # Without a key the parsed timestamp is the item to yield.
+            if key is None:
+                item = timestamp
+
+        return [timestamp, index, item, iterator]
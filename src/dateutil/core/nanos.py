@@ -0,0 +1,1070 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import re
+from array import array
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from time import perf_counter_ns, time_ns
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from .core import DateArithmeticError, DateParsingError, DateSerializationError
+
+
+__all__: Final[List[str]] = ["NanoDuration", "NanoTimestamp"]
+
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# The proleptic Gregorian ordinal of 1970-01-01.
+_EPOCH_ORDINAL: Final[int] = _EPOCH.toordinal()
+
+_MICROSECOND: Final[timedelta] = timedelta(microseconds=1)
+
+_NANOS_PER_SECOND: Final[int] = 1_000_000_000
+_NANOS_PER_DAY: Final[int] = 86_400 * _NANOS_PER_SECOND
+
+# The length of every unit in nanoseconds.
+_UNITS: Final[Dict[str, int]] = {
+    "ns": 1,
+    "nanoseconds": 1,
+    "us": 1_000,
+    "microseconds": 1_000,
+    "ms": 1_000_000,
+    "milliseconds": 1_000_000,
+    "s": _NANOS_PER_SECOND,
+    "seconds": _NANOS_PER_SECOND,
+    "minutes": 60 * _NANOS_PER_SECOND,
+    "hours": 3_600 * _NANOS_PER_SECOND,
+    "days": _NANOS_PER_DAY,
+    "weeks": 7 * _NANOS_PER_DAY,
+}
+
+# An ISO 8601 timestamp with up to 9 fractional digits and an optional offset (naive values are UTC).
+_ISO: Final[Pattern[str]] = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})"
+    r"(?:[.,](\d{1,9}))?"
+    r"(Z|[+-]\d{2}:?\d{2})?",
+)
+
+
+class NanoDuration:
+    """
+    An immutable, exact duration backed by a single count of nanoseconds.
+
+    timedelta stops at microseconds and float seconds lose nanoseconds
+    beyond about 104 days, so durations measured with perf_counter_ns or
+    taken from nanosecond epoch data are kept as an int. Arithmetic,
+    comparison and hashing work on that int, and total returns exact
+    (floored) integers in every unit. Equality is only defined between
+    NanoDuration objects, while ordering and arithmetic also accept
+    timedelta objects.
+    """
+
+    __slots__ = ("nanos",)
+
+    def __init__(
+        self,
+        nanos: int,
+    ) -> None:
+        """
+        Initializes the NanoDuration.
+
+        :param nanos: The length in nanoseconds.
+        :type nanos: int
+
+        :return: None
+        :rtype: None
+        """
+
+        object.__setattr__(self, "nanos", nanos)
+
+    def __abs__(self) -> "NanoDuration":
+        """
+        :return: The absolute duration.
+        :rtype: NanoDuration
+        """
+
+        return NanoDuration(abs(self.nanos))
+
+    def __add__(
+        self,
+        other: Any,
+    ) -> "NanoDuration":
+        """
+        Adds another duration or a timedelta.
+
+        :param other: The NanoDuration or timedelta to add.
+        :type other: Union[NanoDuration, timedelta]
+
+        :return: The sum.
+        :rtype: NanoDuration
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else NanoDuration(self.nanos + nanos)
+
+    __radd__ = __add__
+
+    def __bool__(self) -> bool:
+        """
+        :return: True if the duration is not zero, False otherwise.
+        :rtype: bool
+        """
+
+        return self.nanos != 0
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks whether two durations are equal.
+
+        :param other: The object to compare with.
+        :type other: object
+
+        :return: True if both have the same length, False otherwise.
+        :rtype: bool
+        """
+
+        if other.__class__ is NanoDuration:
+            return self.nanos == other.nanos
+
+        return NotImplemented
+
+    def __floordiv__(
+        self,
+        other: Any,
+    ) -> Union["NanoDuration", int]:
+        """
+        Divides by an int, or counts how often another duration fits.
+
+        :param other: The int or duration to divide by.
+        :type other: Union[int, NanoDuration, timedelta]
+
+        :return: The floored duration for an int, otherwise the floored quotient.
+        :rtype: Union[NanoDuration, int]
+        """
+
+        if isinstance(other, int):
+            return NanoDuration(self.nanos // other)
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else self.nanos // nanos
+
+    def __ge__(self, other: Any) -> bool:
+        """
+        :return: True if this duration is at least as long as the other.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else self.nanos >= nanos
+
+    def __gt__(self, other: Any) -> bool:
+        """
+        :return: True if this duration is longer than the other.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else self.nanos > nanos
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the duration.
+
+        :return: The hash of the nanoseconds.
+        :rtype: int
+        """
+
+        return hash(self.nanos)
+
+    def __le__(self, other: Any) -> bool:
+        """
+        :return: True if this duration is at most as long as the other.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else self.nanos <= nanos
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        :return: True if this duration is shorter than the other.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else self.nanos < nanos
+
+    def __mod__(
+        self,
+        other: Any,
+    ) -> "NanoDuration":
+        """
+        :return: The remainder of dividing by another duration.
+        :rtype: NanoDuration
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else NanoDuration(self.nanos % nanos)
+
+    def __mul__(
+        self,
+        other: Any,
+    ) -> "NanoDuration":
+        """
+        :return: The duration multiplied by an int.
+        :rtype: NanoDuration
+        """
+
+        if isinstance(other, int):
+            return NanoDuration(self.nanos * other)
+
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "NanoDuration":
+        """
+        :return: The negated duration.
+        :rtype: NanoDuration
+        """
+
+        return NanoDuration(-self.nanos)
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """
+        Returns the pickling recipe of the duration.
+
+        :return: The class and the constructor arguments.
+        :rtype: Tuple[type, Tuple[int]]
+        """
+
+        return (NanoDuration, (self.nanos,))
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the duration.
+
+        :return: The representation, including the nanoseconds.
+        :rtype: str
+        """
+
+        return f"NanoDuration({self.nanos})"
+
+    def __rsub__(
+        self,
+        other: Any,
+    ) -> "NanoDuration":
+        """
+        :return: The timedelta minus this duration.
+        :rtype: NanoDuration
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else NanoDuration(nanos - self.nanos)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Rejects attribute assignment, because durations are immutable.
+
+        :raises AttributeError: Always.
+        """
+
+        raise AttributeError("NanoDuration objects are immutable.")
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the duration, like str(timedelta) with 9 fractional digits.
+
+        :return: The duration as [-][D day[s], ]H:MM:SS[.fffffffff].
+        :rtype: str
+        """
+
+        sign: str = "-" if self.nanos < 0 else ""
+        days, rest = divmod(abs(self.nanos), _NANOS_PER_DAY)
+        seconds, fraction = divmod(rest, _NANOS_PER_SECOND)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+
+        text: str = f"{hours}:{minutes:02d}:{seconds:02d}"
+
+        if fraction:
+            text += f".{fraction:09d}"
+
+        if days:
+            text = f"{days} day{'s' if days != 1 else ''}, {text}"
+
+        return sign + text
+
+    def __sub__(
+        self,
+        other: Any,
+    ) -> "NanoDuration":
+        """
+        Subtracts another duration or a timedelta.
+
+        :param other: The NanoDuration or timedelta to subtract.
+        :type other: Union[NanoDuration, timedelta]
+
+        :return: The difference.
+        :rtype: NanoDuration
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else NanoDuration(self.nanos - nanos)
+
+    @classmethod
+    def from_timedelta(
+        cls,
+        value: timedelta,
+    ) -> "NanoDuration":
+        """
+        Creates a NanoDuration from a timedelta (exactly).
+
+        :param value: The timedelta.
+        :type value: timedelta
+
+        :return: The duration.
+        :rtype: NanoDuration
+        """
+
+        return cls(value // _MICROSECOND * 1_000)
+
+    @classmethod
+    def of(
+        cls,
+        amount: int,
+        unit: str = "ns",
+    ) -> "NanoDuration":
+        """
+        Creates a NanoDuration from an amount of a unit, e.g. NanoDuration.of(250, "us").
+
+        :param amount: The number of units.
+        :type amount: int
+        :param unit: The unit ("ns", "us", "ms", "s", "minutes", "hours", "days", "weeks"
+            or the long names of the sub-second units). Defaults to "ns".
+        :type unit: str
+
+        :return: The duration.
+        :rtype: NanoDuration
+
+        :raises ValueError: If the unit is invalid.
+        """
+
+        return cls(amount * _unit(unit))
+
+    @classmethod
+    def since(
+        cls,
+        start: int,
+    ) -> "NanoDuration":
+        """
+        Returns the time elapsed since a perf_counter_ns reading.
+
+        :param start: The earlier time.perf_counter_ns() value.
+        :type start: int
+
+        :return: The elapsed time.
+        :rtype: NanoDuration
+        """
+
+        return cls(perf_counter_ns() - start)
+
+    def to_timedelta(self) -> timedelta:
+        """
+        Converts the duration to a timedelta, dropping the sub-microsecond part (rounding down).
+
+        :return: The timedelta.
+        :rtype: timedelta
+        """
+
+        return timedelta(microseconds=self.nanos // 1_000)
+
+    def total(
+        self,
+        unit: str = "ns",
+    ) -> int:
+        """
+        Returns the duration as a whole number of a unit, exactly (rounded down).
+
+        :param unit: The unit (see of). Defaults to "ns".
+        :type unit: str
+
+        :return: The number of whole units.
+        :rtype: int
+
+        :raises ValueError: If the unit is invalid.
+        """
+
+        return self.nanos // _unit(unit)
+
+    @classmethod
+    def total_many(
+        cls,
+        values: Iterable[int],
+        unit: str,
+    ) -> array:
+        """
+        Converts nanosecond durations to whole numbers of a unit (rounded down).
+
+        :param values: The durations in nanoseconds, e.g. an array('q').
+        :type values: Iterable[int]
+        :param unit: The unit (see of).
+        :type unit: str
+
+        :return: The converted values as an array('q').
+        :rtype: array
+
+        :raises ValueError: If the unit is invalid.
+        """
+
+        step: int = _unit(unit)
+
+        return array("q", [value // step for value in values])
+
+    def total_seconds(self) -> float:
+        """
+        :return: The duration in seconds as a float (like timedelta.total_seconds).
+        :rtype: float
+        """
+
+        return self.nanos / _NANOS_PER_SECOND
+
+
+class NanoTimestamp:
+    """
+    An immutable UTC timestamp backed by a single count of epoch nanoseconds.
+
+    datetime stops at microseconds, so nanosecond epoch data (trading and
+    tracing feeds) loses digits whenever it passes through one. This type
+    keeps the int: it parses and formats ISO 8601 with up to 9 fractional
+    digits, subtracts to an exact NanoDuration, hashes and compares as an
+    int (ordering also accepts datetime objects) and converts to and from
+    datetime. The *_many classmethods work on array('q') columns, as used
+    by TimestampColumn and SharedTimestamps with unit "ns".
+    """
+
+    __slots__ = ("nanos",)
+
+    # Nanosecond timestamps are always UTC.
+    tzinfo: Final[None] = None
+
+    def __init__(
+        self,
+        nanos: int,
+    ) -> None:
+        """
+        Initializes the NanoTimestamp.
+
+        :param nanos: The nanoseconds since 1970-01-01T00:00:00 UTC.
+        :type nanos: int
+
+        :return: None
+        :rtype: None
+        """
+
+        object.__setattr__(self, "nanos", nanos)
+
+    def __add__(
+        self,
+        other: Any,
+    ) -> "NanoTimestamp":
+        """
+        Adds a duration.
+
+        :param other: The NanoDuration or timedelta to add.
+        :type other: Union[NanoDuration, timedelta]
+
+        :return: The shifted timestamp.
+        :rtype: NanoTimestamp
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        return NotImplemented if nanos is None else NanoTimestamp(self.nanos + nanos)
+
+    __radd__ = __add__
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        """
+        Checks whether two nanosecond timestamps are equal.
+
+        :param other: The object to compare with.
+        :type other: object
+
+        :return: True if both are the same instant, False otherwise.
+        :rtype: bool
+        """
+
+        if other.__class__ is NanoTimestamp:
+            return self.nanos == other.nanos
+
+        return NotImplemented
+
+    def __ge__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is at or after the other value.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _timestamp_key(other)
+
+        return NotImplemented if nanos is None else self.nanos >= nanos
+
+    def __gt__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is after the other value.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _timestamp_key(other)
+
+        return NotImplemented if nanos is None else self.nanos > nanos
+
+    def __hash__(self) -> int:
+        """
+        Returns the hash of the timestamp.
+
+        :return: The hash of the epoch nanoseconds.
+        :rtype: int
+        """
+
+        return hash(self.nanos)
+
+    def __le__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is at or before the other value.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _timestamp_key(other)
+
+        return NotImplemented if nanos is None else self.nanos <= nanos
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        :return: True if this timestamp is before the other value.
+        :rtype: bool
+        """
+
+        nanos: Optional[int] = _timestamp_key(other)
+
+        return NotImplemented if nanos is None else self.nanos < nanos
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """
+        Returns the pickling recipe of the timestamp.
+
+        :return: The class and the constructor arguments.
+        :rtype: Tuple[type, Tuple[int]]
+        """
+
+        return (NanoTimestamp, (self.nanos,))
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the timestamp.
+
+        :return: The representation, including the epoch nanoseconds.
+        :rtype: str
+        """
+
+        return f"NanoTimestamp({self.nanos})"
+
+    def __rsub__(
+        self,
+        other: Any,
+    ) -> NanoDuration:
+        """
+        Subtracts this timestamp from a datetime object.
+
+        :param other: The datetime object.
+        :type other: datetime
+
+        :return: The exact difference.
+        :rtype: NanoDuration
+        """
+
+        nanos: Optional[int] = _timestamp_key(other)
+
+        return NotImplemented if nanos is None else NanoDuration(nanos - self.nanos)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Rejects attribute assignment, because nanosecond timestamps are immutable.
+
+        :raises AttributeError: Always.
+        """
+
+        raise AttributeError("NanoTimestamp objects are immutable.")
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the timestamp, like str(datetime) with 9 fractional digits.
+
+        :return: The timestamp as YYYY-MM-DD HH:MM:SS[.fffffffff].
+        :rtype: str
+        """
+
+        return _format(self.nanos, " ", 9, "", True)
+
+    def __sub__(
+        self,
+        other: Any,
+    ) -> Union["NanoTimestamp", NanoDuration]:
+        """
+        Subtracts a duration, or computes the exact difference to another timestamp.
+
+        :param other: The NanoDuration, timedelta, NanoTimestamp or datetime object to subtract.
+        :type other: Union[NanoDuration, timedelta, NanoTimestamp, datetime]
+
+        :return: The shifted timestamp for a duration, otherwise the difference.
+        :rtype: Union[NanoTimestamp, NanoDuration]
+        """
+
+        nanos: Optional[int] = _duration_key(other)
+
+        if nanos is not None:
+            return NanoTimestamp(self.nanos - nanos)
+
+        nanos = _timestamp_key(other)
+
+        return NotImplemented if nanos is None else NanoDuration(self.nanos - nanos)
+
+    @property
+    def nanosecond(self) -> int:
+        """
+        :return: The nanoseconds within the second (0 to 999999999).
+        :rtype: int
+        """
+
+        return self.nanos % _NANOS_PER_SECOND
+
+    def difference(
+        self,
+        other: Union["NanoTimestamp", datetime],
+        unit: str = "ns",
+    ) -> int:
+        """
+        Returns the exact difference other - self as a whole number of a unit (rounded down).
+
+        Unlike DateUtil.calculate_difference, no unit goes through float seconds.
+
+        :param other: The later timestamp (a datetime is taken as UTC when naive).
+        :type other: Union[NanoTimestamp, datetime]
+        :param unit: The unit ("ns", "us", "ms", "s", "minutes", "hours", "days", "weeks"). Defaults to "ns".
+        :type unit: str
+
+        :return: The number of whole units.
+        :rtype: int
+
+        :raises ValueError: If the unit is invalid.
+        :raises DateArithmeticError: If the other value is neither a NanoTimestamp nor a datetime.
+        """
+
+        nanos: Optional[int] = _timestamp_key(other)
+
+        if nanos is None:
+            raise DateArithmeticError(
+                f"Cannot compute the difference between a NanoTimestamp and {type(other).__name__}.",
+            )
+
+        return (nanos - self.nanos) // _unit(unit)
+
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[int],
+        sep: str = "T",
+        digits: int = 9,
+    ) -> List[str]:
+        """
+        Formats epoch nanoseconds as ISO 8601 UTC strings.
+
+        :param values: The epoch nanoseconds, e.g. an array('q').
+        :type values: Iterable[int]
+        :param sep: The separator between date and time. Defaults to "T".
+        :type sep: str
+        :param digits: The number of fractional digits (0 to 9, truncated). Defaults to 9.
+        :type digits: int
+
+        :return: The strings, each ending in "Z".
+        :rtype: List[str]
+
+        :raises ValueError: If digits is not between 0 and 9.
+        :raises DateSerializationError: If a value is outside the years 1-9999.
+        """
+
+        _check_digits(digits)
+
+        return [_format(value, sep, digits, "Z", False) for value in values]
+
+    @classmethod
+    def from_datetime(
+        cls,
+        value: datetime,
+    ) -> "NanoTimestamp":
+        """
+        Creates a NanoTimestamp from a datetime object.
+
+        :param value: The datetime object (naive values are taken as UTC).
+        :type value: datetime
+
+        :return: The nanosecond timestamp.
+        :rtype: NanoTimestamp
+        """
+
+        return cls((value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND * 1_000)
+
+    @classmethod
+    def from_datetime_many(
+        cls,
+        values: Iterable[datetime],
+    ) -> array:
+        """
+        Converts datetime objects to epoch nanoseconds.
+
+        :param values: The datetime objects (naive values are taken as UTC).
+        :type values: Iterable[datetime]
+
+        :return: The epoch nanoseconds as an array('q').
+        :rtype: array
+
+        :raises DateSerializationError: If a value is outside the int64 nanosecond range (1677 to 2262).
+        """
+
+        try:
+            return array(
+                "q",
+                [(value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND * 1_000 for value in values],
+            )
+        except OverflowError as e:
+            raise DateSerializationError(
+                "Invalid value: epoch nanoseconds must fit into a signed 64-bit integer (years 1677 to 2262).",
+            ) from e
+
+    @classmethod
+    def now(cls) -> "NanoTimestamp":
+        """
+        Returns the current instant from time.time_ns().
+
+        :return: The nanosecond timestamp of now.
+        :rtype: NanoTimestamp
+        """
+
+        return cls(time_ns())
+
+    @classmethod
+    def parse(
+        cls,
+        text: str,
+    ) -> "NanoTimestamp":
+        """
+        Parses an ISO 8601 timestamp with up to 9 fractional digits.
+
+        Accepts YYYY-MM-DD[T ]HH:MM:SS[.fffffffff][Z|+HH:MM|+HHMM]; values
+        without an offset are taken as UTC.
+
+        :param text: The timestamp string.
+        :type text: str
+
+        :return: The nanosecond timestamp.
+        :rtype: NanoTimestamp
+
+        :raises DateParsingError: If the string is not a valid timestamp.
+        """
+
+        return cls(_parse(text))
+
+    @classmethod
+    def parse_many(
+        cls,
+        texts: Iterable[str],
+    ) -> array:
+        """
+        Parses ISO 8601 timestamps (see parse) into epoch nanoseconds.
+
+        :param texts: The timestamp strings.
+        :type texts: Iterable[str]
+
+        :return: The epoch nanoseconds as an array('q').
+        :rtype: array
+
+        :raises DateParsingError: If a string is not a valid timestamp.
+        :raises DateSerializationError: If a value is outside the int64 nanosecond range (1677 to 2262).
+        """
+
+        try:
+            return array("q", [_parse(text) for text in texts])
+        except OverflowError as e:
+            raise DateSerializationError(
+                "Invalid value: epoch nanoseconds must fit into a signed 64-bit integer (years 1677 to 2262).",
+            ) from e
+
+    def isoformat(
+        self,
+        sep: str = "T",
+        digits: int = 9,
+    ) -> str:
+        """
+        Formats the timestamp as ISO 8601 in UTC.
+
+        :param sep: The separator between date and time. Defaults to "T".
+        :type sep: str
+        :param digits: The number of fractional digits (0 to 9, truncated). Defaults to 9.
+        :type digits: int
+
+        :return: The timestamp, ending in "Z".
+        :rtype: str
+
+        :raises ValueError: If digits is not between 0 and 9.
+        :raises DateSerializationError: If the value is outside the years 1-9999.
+        """
+
+        _check_digits(digits)
+
+        return _format(self.nanos, sep, digits, "Z", False)
+
+    def to_datetime(
+        self,
+        tz: Optional["tzinfo"] = None,
+    ) -> datetime:
+        """
+        Converts the timestamp to a datetime object, dropping the sub-microsecond part (rounding down).
+
+        :param tz: The zone of the result (default is a naive UTC datetime).
+        :type tz: Optional[tzinfo]
+
+        :return: The datetime object.
+        :rtype: datetime
+        """
+
+        micros: int = self.nanos // 1_000
+
+        if tz is None:
+            return _EPOCH + timedelta(microseconds=micros)
+
+        return (_EPOCH_UTC + timedelta(microseconds=micros)).astimezone(tz)
+
+    @classmethod
+    def to_datetime_many(
+        cls,
+        values: Iterable[int],
+    ) -> List[datetime]:
+        """
+        Converts epoch nanoseconds to naive UTC datetime objects (rounding down to microseconds).
+
+        :param values: The epoch nanoseconds, e.g. an array('q').
+        :type values: Iterable[int]
+
+        :return: The datetime objects.
+        :rtype: List[datetime]
+        """
+
+        return [_EPOCH + timedelta(microseconds=value // 1_000) for value in values]
+
+
+def _check_digits(digits: int) -> None:
+    """
+    Checks the number of fractional digits.
+
+    :param digits: The number of digits.
+    :type digits: int
+
+    :return: None
+    :rtype: None
+
+    :raises ValueError: If digits is not between 0 and 9.
+    """
+
+    if not 0 <= digits <= 9:
+        raise ValueError(
+            f"Invalid value for 'digits': {digits}. Must be between 0 and 9.",
+        )
+
+
+def _duration_key(value: Any) -> Optional[int]:
+    """
+    Returns the nanoseconds of a duration operand.
+
+    :param value: The NanoDuration or timedelta.
+    :type value: Any
+
+    :return: The nanoseconds, or None for other types.
+    :rtype: Optional[int]
+    """
+
+    if value.__class__ is NanoDuration:
+        return value.nanos
+
+    if isinstance(value, timedelta):
+        return value // _MICROSECOND * 1_000
+
+    return None
+
+
+def _format(
+    nanos: int,
+    sep: str,
+    digits: int,
+    suffix: str,
+    trim: bool,
+) -> str:
+    """
+    Formats epoch nanoseconds as YYYY-MM-DD<sep>HH:MM:SS[.f...]<suffix>.
+
+    :param nanos: The epoch nanoseconds.
+    :type nanos: int
+    :param sep: The separator between date and time.
+    :type sep: str
+    :param digits: The number of fractional digits (truncated).
+    :type digits: int
+    :param suffix: The text appended to the result, e.g. "Z".
+    :type suffix: str
+    :param trim: Whether a zero fraction is omitted.
+    :type trim: bool
+
+    :return: The formatted string.
+    :rtype: str
+
+    :raises DateSerializationError: If the value is outside the years 1-9999.
+    """
+
+    days, rest = divmod(nanos, _NANOS_PER_DAY)
+    seconds, fraction = divmod(rest, _NANOS_PER_SECOND)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    try:
+        day: date = date.fromordinal(days + _EPOCH_ORDINAL)
+    except (OverflowError, ValueError) as e:
+        raise DateSerializationError(
+            f"Invalid value: {nanos} nanoseconds is outside the range of ISO 8601 timestamps.",
+        ) from e
+
+    text: str = f"{day.isoformat()}{sep}{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    if digits and not (trim and not fraction):
+        text += "." + f"{fraction:09d}"[:digits]
+
+    return text + suffix
+
+
+def _parse(text: str) -> int:
+    """
+    Parses an ISO 8601 timestamp into epoch nanoseconds.
+
+    :param text: The timestamp string.
+    :type text: str
+
+    :return: The epoch nanoseconds.
+    :rtype: int
+
+    :raises DateParsingError: If the string is not a valid timestamp.
+    """
+
+    match: Optional[Match[str]] = _ISO.fullmatch(text.strip())
+
+    if match is None:
+        raise DateParsingError(
+            f"Invalid ISO 8601 timestamp: {text!r}.",
+        )
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+    try:
+        days: int = date(int(year), int(month), int(day)).toordinal() - _EPOCH_ORDINAL
+    except ValueError as e:
+        raise DateParsingError(
+            f"Invalid ISO 8601 timestamp: {text!r}. {e}.",
+        ) from e
+
+    if int(hour) > 23 or int(minute) > 59 or int(second) > 59:
+        raise DateParsingError(
+            f"Invalid ISO 8601 timestamp: {text!r}. The time is out of range.",
+        )
+
+    seconds: int = days * 86_400 + int(hour) * 3_600 + int(minute) * 60 + int(second)
+
+    if offset and offset != "Z":
+        digits: str = offset[1:].replace(":", "")
+
+        if int(digits[:2]) > 23 or int(digits[2:]) > 59:
+            raise DateParsingError(
+                f"Invalid ISO 8601 timestamp: {text!r}. The offset is out of range.",
+            )
+
+        shift: int = int(digits[:2]) * 3_600 + int(digits[2:]) * 60
+        seconds -= shift if offset[0] == "+" else -shift
+
+    return seconds * _NANOS_PER_SECOND + (int(fraction.ljust(9, "0")) if fraction else 0)
+
+
+def _timestamp_key(value: Any) -> Optional[int]:
+    """
+    Returns the epoch nanoseconds of a value compared with a NanoTimestamp.
+
+    :param value: The NanoTimestamp or datetime object (naive values are taken as UTC).
+    :type value: Any
+
+    :return: The epoch nanoseconds, or None for other types.
+    :rtype: Optional[int]
+    """
+
+    if value.__class__ is NanoTimestamp:
+        return value.nanos
+
+    if isinstance(value, datetime):
+        return (value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND * 1_000
+
+    return None
+
+
+def _unit(unit: str) -> int:
+    """
+    Returns the length of a unit in nanoseconds.
+
+    :param unit: The unit name.
+    :type unit: str
+
+    :return: The nanoseconds per unit.
+    :rtype: int
+
+    :raises ValueError: If the unit is invalid.
+    """
+
+    try:
+        return _UNITS[unit]
+    except KeyError:
+        raise ValueError(
+            f"Invalid value for 'unit': {unit}. Must be one of: {', '.join(repr(name) for name in _UNITS)}.",
+        ) from None
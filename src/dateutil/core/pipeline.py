@@ -0,0 +1,625 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import DateFormat, DateParsingFormatError, DateUtil, DateUtilError
+from .formatting import CompiledFormat, compile_format
+from .timezone import TimezoneUtil, TzLike
+
+
+__all__: Final[List[str]] = ["Pipeline"]
+
+
+# The default number of values processed together by the batch and process engines.
+DEFAULT_CHUNK_SIZE: Final[int] = 10_000
+
+# The execution engines: per element, per chunk with the *_many methods, or per chunk in worker processes.
+Engine = Literal["stream", "batch", "process"]
+
+# A declarative stage: (operation, arguments). Stages are plain data, so a
+# pipeline can be sent to worker processes and compiled there.
+_Stage = Tuple[str, Tuple[Any, ...]]
+
+# The units floor() truncates to, mapped to the fields that are reset.
+_FLOOR_FIELDS: Final[dict] = {
+    "seconds": {"microsecond": 0},
+    "minutes": {"second": 0, "microsecond": 0},
+    "hours": {"minute": 0, "second": 0, "microsecond": 0},
+    "days": {"hour": 0, "minute": 0, "second": 0, "microsecond": 0},
+    "weeks": {"hour": 0, "minute": 0, "second": 0, "microsecond": 0},
+    "months": {"day": 1, "hour": 0, "minute": 0, "second": 0, "microsecond": 0},
+    "years": {"month": 1, "day": 1, "hour": 0, "minute": 0, "second": 0, "microsecond": 0},
+}
+
+# The fixed-length units of shift(), which naive values can add as one timedelta.
+_SHIFT_UNITS: Final[dict] = {
+    "days": timedelta(days=1),
+    "hours": timedelta(hours=1),
+    "minutes": timedelta(minutes=1),
+    "seconds": timedelta(seconds=1),
+    "weeks": timedelta(weeks=1),
+}
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Marks values dropped under the "skip" error policy.
+_SKIPPED: Final[object] = object()
+
+
+def _run_chunk(task: Tuple[List[_Stage], str, List[Any]]) -> List[Any]:
+    """
+    Runs a pipeline over one chunk with the batch engine (inside a worker process).
+
+    :param task: The (stages, error policy, chunk) triple.
+    :type task: Tuple[List[_Stage], str, List[Any]]
+
+    :return: The processed chunk.
+    :rtype: List[Any]
+    """
+
+    stages, errors, chunk = task
+
+    return Pipeline(errors=errors, stages=stages)._run_batch(chunk)
+
+
+class Pipeline:
+    """
+    A lazy chain of parse, shift, floor, convert and format steps.
+
+    Building a pipeline only records its stages. Running it compiles the
+    chain once into a single per-element function and streams the input
+    through it, so no intermediate list is built per stage. The batch
+    engine instead processes chunks with the vectorised *_many methods,
+    reusing one buffer per chunk, and the process engine distributes those
+    chunks over worker processes.
+    """
+
+    def __init__(
+        self,
+        errors: Literal["raise", "skip"] = "raise",
+        stages: Optional[List[_Stage]] = None,
+    ) -> None:
+        """
+        Initializes the Pipeline.
+
+        :param errors: Whether values that fail a stage raise or are dropped. Defaults to "raise".
+        :type errors: Literal["raise", "skip"]
+        :param stages: The stages (used when copying a pipeline).
+        :type stages: Optional[List[_Stage]]
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If the error policy is invalid.
+        """
+
+        if errors not in ("raise", "skip"):
+            raise ValueError(
+                f"Invalid value for 'errors': {errors}. Must be one of: 'raise', 'skip'.",
+            )
+
+        self.errors: str = errors
+        self.stages: Tuple[_Stage, ...] = tuple(stages or ())
+
+        self._compiled: Optional[Callable[[Any], Any]] = None
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the pipeline.
+
+        :return: The representation, listing the stage names.
+        :rtype: str
+        """
+
+        return f"Pipeline({' -> '.join(name for name, _ in self.stages) or 'identity'})"
+
+    def compile(self) -> Callable[[Any], Any]:
+        """
+        Compiles the stages into a single per-element function.
+
+        :return: The function applying every stage to one value.
+        :rtype: Callable[[Any], Any]
+        """
+
+        if self._compiled is None:
+            functions: List[Callable[[Any], Any]] = [self._element(stage) for stage in self.stages]
+
+            if not functions:
+                self._compiled = lambda value: value
+            elif len(functions) == 1:
+                self._compiled = functions[0]
+            else:
+                chain: Tuple[Callable[[Any], Any], ...] = tuple(functions)
+
+                def compiled(value: Any) -> Any:
+                    for function in chain:
+                        value = function(value)
+
+                    return value
+
+                self._compiled = compiled
+
+        return self._compiled
+
+    def convert(
+        self,
+        to_tz: TzLike,
+        from_tz: Optional[TzLike] = "UTC",
+    ) -> "Pipeline":
+        """
+        Adds a timezone conversion.
+
+        :param to_tz: The zone to convert to.
+        :type to_tz: TzLike
+        :param from_tz: The zone of naive values. Defaults to "UTC".
+        :type from_tz: Optional[TzLike]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+        """
+
+        return self._extend("convert", (to_tz, from_tz))
+
+    def floor(
+        self,
+        unit: Union[
+            Literal["seconds", "minutes", "hours", "days", "weeks", "months", "years"],
+            timedelta,
+        ],
+    ) -> "Pipeline":
+        """
+        Adds a truncation to the start of a unit (weeks start on Monday) or of a fixed-size bucket.
+
+        Timedelta buckets are aligned to the Unix epoch; aware values are bucketed by their UTC instant.
+
+        :param unit: The unit or the bucket size.
+        :type unit: Union[Literal["seconds", "minutes", "hours", "days", "weeks", "months", "years"], timedelta]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+
+        :raises ValueError: If the unit is invalid.
+        """
+
+        if not isinstance(unit, timedelta) and unit not in _FLOOR_FIELDS:
+            raise ValueError(
+                f"Invalid value for 'unit': {unit}. "
+                "Must be one of: 'seconds', 'minutes', 'hours', 'days', 'weeks', 'months', 'years', or a timedelta.",
+            )
+
+        if isinstance(unit, timedelta) and unit <= timedelta(0):
+            raise ValueError(
+                f"Invalid value for 'unit': {unit}. Must be positive.",
+            )
+
+        return self._extend("floor", (unit,))
+
+    def format(
+        self,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+    ) -> "Pipeline":
+        """
+        Adds formatting to strings (like DateUtil.datetime_to_string).
+
+        :param date_format: The format, as a DateFormat or any strftime pattern. Defaults to ISO 8601.
+        :type date_format: Union[DateFormat, str]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+        """
+
+        return self._extend("format", (date_format,))
+
+    def map(
+        self,
+        function: Callable[[Any], Any],
+    ) -> "Pipeline":
+        """
+        Adds an arbitrary per-element function (it must be picklable for the process engine).
+
+        :param function: The function.
+        :type function: Callable[[Any], Any]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+        """
+
+        return self._extend("map", (function,))
+
+    def parse(
+        self,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+    ) -> "Pipeline":
+        """
+        Adds parsing of strings (like DateUtil.string_to_datetime).
+
+        :param date_format: The format, as a DateFormat or any strftime pattern. Defaults to ISO 8601.
+        :type date_format: Union[DateFormat, str]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+        """
+
+        return self._extend("parse", (date_format,))
+
+    def run(
+        self,
+        values: Iterable[Any],
+        engine: Engine = "stream",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily runs the pipeline over an iterable, preserving the input order.
+
+        :param values: The input values.
+        :type values: Iterable[Any]
+        :param engine: "stream" (one fused function per element), "batch" (chunks through the *_many methods) or "process" (batch chunks in worker processes). Defaults to "stream".
+        :type engine: Literal["stream", "batch", "process"]
+        :param chunk_size: The number of values per chunk of the batch and process engines. Defaults to 10000.
+        :type chunk_size: int
+        :param workers: The number of worker processes of the process engine (default is the CPU count).
+        :type workers: Optional[int]
+
+        :return: An iterator over the results.
+        :rtype: Iterator[Any]
+
+        :raises DateUtilError: If a value fails a stage and the error policy is "raise".
+        :raises ValueError: If an option is invalid.
+        """
+
+        if engine not in ("stream", "batch", "process"):
+            raise ValueError(
+                f"Invalid value for 'engine': {engine}. Must be one of: 'stream', 'batch', 'process'.",
+            )
+
+        if chunk_size <= 0:
+            raise ValueError(
+                f"Invalid value for 'chunk_size': {chunk_size}. Must be positive.",
+            )
+
+        if engine == "stream":
+            return self._run_stream(values)
+
+        if engine == "batch":
+            return self._iter_batches(values, chunk_size)
+
+        return self._iter_processes(values, chunk_size, workers)
+
+    def shift(
+        self,
+        what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Any],
+        amount: int,
+        mode: Literal["absolute", "wall"] = "wall",
+        ambiguous: Literal["earlier", "later", "raise"] = "earlier",
+        nonexistent: Literal["shift_backward", "shift_forward", "raise"] = "shift_forward",
+    ) -> "Pipeline":
+        """
+        Adds a shift (like DateUtil.increment; use a negative amount to go back).
+
+        :param what: The unit, or an ISO 8601 duration (a Duration or a string).
+        :type what: Union[Literal["days", "hours", "minutes", "seconds", "weeks", "years"], str, Duration]
+        :param amount: The amount (the multiplier of a duration).
+        :type amount: int
+        :param mode: Whether to shift the wall-clock time or the absolute instant of aware values. Defaults to "wall".
+        :type mode: Literal["absolute", "wall"]
+        :param ambiguous: How to resolve a resulting wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a resulting wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_backward", "shift_forward", "raise"]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+        """
+
+        return self._extend("shift", (what, amount, mode, ambiguous, nonexistent))
+
+    def _element(
+        self,
+        stage: _Stage,
+    ) -> Callable[[Any], Any]:
+        """
+        Compiles one stage into a per-element function.
+
+        :param stage: The stage.
+        :type stage: _Stage
+
+        :return: The function.
+        :rtype: Callable[[Any], Any]
+        """
+
+        name, arguments = stage
+
+        if name == "parse":
+            date_format: Union[DateFormat, str] = arguments[0]
+            parser: Callable[[str], datetime] = compile_format(date_format).parse
+
+            def parse(value: str) -> datetime:
+                try:
+                    return parser(value)
+                except ValueError as e:
+                    raise DateParsingFormatError(
+                        f"Invalid date format: {value}. Expected format: {date_format}.",
+                    ) from e
+
+            return parse
+
+        if name == "format":
+            formatter: CompiledFormat = compile_format(arguments[0])
+
+            return formatter.format
+
+        if name == "shift":
+            what, amount, mode, ambiguous, nonexistent = arguments
+            step: Optional[timedelta] = _SHIFT_UNITS.get(what) if isinstance(what, str) else None
+
+            def shift(value: datetime) -> datetime:
+                return DateUtil.increment(
+                    obj=value,
+                    what=what,
+                    amount=amount,
+                    mode=mode,
+                    ambiguous=ambiguous,
+                    nonexistent=nonexistent,
+                )
+
+            if step is None:
+                return shift
+
+            # Naive values shift by one precomputed timedelta.
+            delta: timedelta = step * amount
+
+            return lambda value: value + delta if value.tzinfo is None else shift(value)
+
+        if name == "floor":
+            unit: Union[str, timedelta] = arguments[0]
+
+            if isinstance(unit, timedelta):
+                return lambda value: value - (value - (_EPOCH if value.tzinfo is None else _EPOCH_UTC)) % unit
+
+            fields: dict = _FLOOR_FIELDS[unit]
+
+            if unit == "weeks":
+                return lambda value: value.replace(**fields) - timedelta(days=value.weekday())
+
+            return lambda value: value.replace(**fields)
+
+        if name == "convert":
+            to_tz, from_tz = arguments
+            target: Any = TimezoneUtil.get_zone(to_tz)
+
+            return lambda value: TimezoneUtil.convert(value, from_tz, target)
+
+        return arguments[0]
+
+    def _extend(
+        self,
+        name: str,
+        arguments: Tuple[Any, ...],
+    ) -> "Pipeline":
+        """
+        Returns a copy of the pipeline with one more stage.
+
+        :param name: The stage operation.
+        :type name: str
+        :param arguments: The stage arguments.
+        :type arguments: Tuple[Any, ...]
+
+        :return: The extended pipeline.
+        :rtype: Pipeline
+        """
+
+        return Pipeline(errors=self.errors, stages=list(self.stages) + [(name, arguments)])
+
+    def _iter_batches(
+        self,
+        values: Iterable[Any],
+        chunk_size: int,
+    ) -> Iterator[Any]:
+        """
+        Runs the batch engine chunk by chunk.
+
+        :param values: The input values.
+        :type values: Iterable[Any]
+        :param chunk_size: The number of values per chunk.
+        :type chunk_size: int
+
+        :return: An iterator over the results.
+        :rtype: Iterator[Any]
+        """
+
+        iterator: Iterator[Any] = iter(values)
+
+        while True:
+            chunk: List[Any] = list(islice(iterator, chunk_size))
+
+            if not chunk:
+                return
+
+            yield from self._run_batch(chunk)
+
+    def _iter_processes(
+        self,
+        values: Iterable[Any],
+        chunk_size: int,
+        workers: Optional[int],
+    ) -> Iterator[Any]:
+        """
+        Runs the batch engine in worker processes, yielding chunks in input order.
+
+        :param values: The input values.
+        :type values: Iterable[Any]
+        :param chunk_size: The number of values per chunk.
+        :type chunk_size: int
+        :param workers: The number of worker processes (default is the CPU count).
+        :type workers: Optional[int]
+
+        :return: An iterator over the results.
+        :rtype: Iterator[Any]
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # A single worker is not worth a process pool.
+        if workers <= 1:
+            yield from self._iter_batches(values, chunk_size)
+            return
+
+        iterator: Iterator[Any] = iter(values)
+        stages: List[_Stage] = list(self.stages)
+
+        def tasks() -> Iterator[Tuple[List[_Stage], str, List[Any]]]:
+            while True:
+                chunk: List[Any] = list(islice(iterator, chunk_size))
+
+                if not chunk:
+                    return
+
+                yield (stages, self.errors, chunk)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep at most two chunks per worker in flight, so the input is
+            # consumed lazily and results do not pile up in memory.
+            pending: Deque["Future[List[Any]]"] = deque()
+            remaining: Iterator[Tuple[List[_Stage], str, List[Any]]] = tasks()
+
+            for task in islice(remaining, 2 * workers):
+                pending.append(executor.submit(_run_chunk, task))
+
+            while pending:
+                results: List[Any] = pending.popleft().result()
+
+                for task in islice(remaining, 1):
+                    pending.append(executor.submit(_run_chunk, task))
+
+                yield from results
+
+    def _run_batch(
+        self,
+        buffer: List[Any],
+    ) -> List[Any]:
+        """
+        Runs every stage over one chunk, overwriting the chunk's buffer stage by stage.
+
+        :param buffer: The chunk (modified in place).
+        :type buffer: List[Any]
+
+        :return: The processed chunk.
+        :rtype: List[Any]
+
+        :raises DateUtilError: If a value fails a stage and the error policy is "raise".
+        """
+
+        for stage in self.stages:
+            name, arguments = stage
+
+            try:
+                if name == "shift":
+                    what, amount, mode, ambiguous, nonexistent = arguments
+
+                    buffer[:] = DateUtil.increment_many(
+                        values=buffer,
+                        what=what,
+                        amount=amount,
+                        mode=mode,
+                        ambiguous=ambiguous,
+                        nonexistent=nonexistent,
+                    )
+                    continue
+
+                if name == "convert":
+                    to_tz, from_tz = arguments
+
+                    buffer[:] = TimezoneUtil.convert_many(
+                        values=buffer,
+                        from_tz=from_tz,
+                        to_tz=to_tz,
+                    )
+                    continue
+            except (DateUtilError, ValueError, OverflowError):
+                # A failing value fails the whole vectorised call; retry per element.
+                if self.errors == "raise":
+                    raise
+
+            function: Callable[[Any], Any] = self._element(stage)
+
+            if self.errors == "raise":
+                buffer[:] = [function(value) for value in buffer]
+            else:
+                buffer[:] = [
+                    result
+                    for result in (self._guarded(function, value) for value in buffer)
+                    if result is not _SKIPPED
+                ]
+
+        return buffer
+
+    def _run_stream(
+        self,
+        values: Iterable[Any],
+    ) -> Iterator[Any]:
+        """
+        Runs the compiled per-element function over a stream.
+
+        :param values: The input values.
+        :type values: Iterable[Any]
+
+        :return: An iterator over the results.
+        :rtype: Iterator[Any]
+        """
+
+        function: Callable[[Any], Any] = self.compile()
+
+        if self.errors == "raise":
+            yield from map(function, values)
+            return
+
+        for value in values:
+            result: Any = self._guarded(function, value)
+
+            if result is not _SKIPPED:
+                yield result
+
+    @staticmethod
+    def _guarded(
+        function: Callable[[Any], Any],
+        value: Any,
+    ) -> Any:
+        """
+        Applies a function, returning a marker instead of raising for invalid values.
+
+        :param function: The function.
+        :type function: Callable[[Any], Any]
+        :param value: The value.
+        :type value: Any
+
+        :return: The result, or the skip marker.
+        :rtype: Any
+        """
+
+        try:
+            return function(value)
+        except (DateUtilError, ValueError, OverflowError):
+            return _SKIPPED
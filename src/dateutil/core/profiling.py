@@ -0,0 +1,526 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from functools import wraps
+from threading import Lock
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple, TypeVar, Union
+
+
+__all__: Final[List[str]] = [
+    "LatencyHistogram",
+    "PROFILER",
+    "Profiler",
+    "Timer",
+]
+
+
+# The type of a profiled callable, preserved by the decorator.
+F = TypeVar("F", bound=Callable[..., Any])
+
+# The number of sub-buckets per power of two is 2 ** _SUB_BITS. With 3 bits
+# each bucket spans at most 12.5% of its lower bound.
+_SUB_BITS: Final[int] = 3
+_SUB_COUNT: Final[int] = 1 << _SUB_BITS
+
+# Values below this limit get one exact bucket each.
+_LINEAR_LIMIT: Final[int] = _SUB_COUNT << 1
+
+
+def _bucket_index(value: int) -> int:
+    """
+    Returns the histogram bucket of a non-negative value.
+
+    :param value: The value to bucket (e.g. nanoseconds).
+    :type value: int
+
+    :return: The bucket index.
+    :rtype: int
+    """
+
+    # Small values are counted exactly.
+    if value < _LINEAR_LIMIT:
+        return value
+
+    # Larger values keep their top _SUB_BITS + 1 bits.
+    shift: int = value.bit_length() - _SUB_BITS - 1
+
+    return (shift << _SUB_BITS) + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """
+    Returns the inclusive value range covered by a histogram bucket.
+
+    :param index: The bucket index.
+    :type index: int
+
+    :return: A tuple of (lowest, highest) value in the bucket.
+    :rtype: Tuple[int, int]
+    """
+
+    if index < _LINEAR_LIMIT:
+        return (index, index)
+
+    shift: int = (index >> _SUB_BITS) - 1
+    mantissa: int = (index & (_SUB_COUNT - 1)) + _SUB_COUNT
+
+    return (mantissa << shift, ((mantissa + 1) << shift) - 1)
+
+
+class LatencyHistogram:
+    """
+    A log-bucketed histogram of latencies in nanoseconds.
+
+    Buckets grow geometrically (eight per power of two), so the histogram
+    stays small for any range of latencies while percentile queries are
+    accurate to within 12.5%.
+
+    Attributes:
+        count (int): The number of recorded values.
+        total (int): The sum of all recorded values.
+        minimum (Optional[int]): The smallest recorded value.
+        maximum (Optional[int]): The largest recorded value.
+    """
+
+    __slots__ = ("count", "total", "minimum", "maximum", "_buckets")
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty LatencyHistogram.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.count: int = 0
+        self.total: int = 0
+        self.minimum: Optional[int] = None
+        self.maximum: Optional[int] = None
+        self._buckets: List[int] = []
+
+    def mean(self) -> float:
+        """
+        Returns the mean of the recorded values.
+
+        :return: The mean in nanoseconds (0.0 if nothing was recorded).
+        :rtype: float
+        """
+
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(
+        self,
+        q: float,
+    ) -> int:
+        """
+        Returns an estimate of a percentile of the recorded values.
+
+        :param q: The percentile to query (0-100).
+        :type q: float
+
+        :return: The estimated percentile in nanoseconds (0 if nothing was recorded).
+        :rtype: int
+
+        :raises ValueError: If q is outside 0-100.
+        """
+
+        if not 0 <= q <= 100:
+            raise ValueError(
+                f"Invalid value for 'q': {q}. Must be between 0 and 100.",
+            )
+
+        if not self.count:
+            return 0
+
+        # The rank of the requested value among all recorded values (1-based).
+        rank: int = max(1, -int(-q * self.count // 100))
+        seen: int = 0
+
+        for index, amount in enumerate(self._buckets):
+            seen += amount
+
+            if seen >= rank:
+                lowest, highest = _bucket_bounds(index)
+
+                # Report the bucket midpoint, clamped to the observed range.
+                return min(max((lowest + highest) // 2, self.minimum), self.maximum)
+
+        return self.maximum
+
+    def record(
+        self,
+        value: int,
+    ) -> None:
+        """
+        Records a value.
+
+        :param value: The value to record in nanoseconds. Negative values are clamped to 0.
+        :type value: int
+
+        :return: None
+        :rtype: None
+        """
+
+        if value < 0:
+            value = 0
+
+        index: int = _bucket_index(value)
+        buckets: List[int] = self._buckets
+
+        # Grow the bucket list on demand.
+        if index >= len(buckets):
+            buckets.extend([0] * (index + 1 - len(buckets)))
+
+        buckets[index] += 1
+
+        self.count += 1
+        self.total += value
+
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def to_dict(self) -> Dict[str, Union[float, int]]:
+        """
+        Returns the summary statistics of the histogram.
+
+        :return: A dictionary with count, total, min, max, mean and the p50/p90/p99/p999 percentiles (all in nanoseconds).
+        :rtype: Dict[str, Union[float, int]]
+        """
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.minimum or 0,
+            "max": self.maximum or 0,
+            "mean": self.mean(),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+        }
+
+
+class Timer:
+    """
+    An explicit timer that records its elapsed time into a Profiler.
+
+    It can be used directly (start/stop) or as a context manager.
+
+    Attributes:
+        label (str): The label the elapsed time is recorded under.
+        elapsed (Optional[int]): The elapsed time in nanoseconds once stopped.
+    """
+
+    __slots__ = ("label", "elapsed", "_profiler", "_start")
+
+    def __init__(
+        self,
+        profiler: "Profiler",
+        label: str,
+    ) -> None:
+        """
+        Initializes the Timer.
+
+        :param profiler: The profiler to record into.
+        :type profiler: Profiler
+        :param label: The label to record under.
+        :type label: str
+
+        :return: None
+        :rtype: None
+        """
+
+        self.label: str = label
+        self.elapsed: Optional[int] = None
+        self._profiler: Profiler = profiler
+        self._start: Optional[int] = None
+
+    def __enter__(self) -> "Timer":
+        """
+        Starts the timer when entering a with block.
+
+        :return: The timer itself.
+        :rtype: Timer
+        """
+
+        return self.start()
+
+    def __exit__(
+        self,
+        *exc_info: Any,
+    ) -> None:
+        """
+        Stops the timer when leaving a with block, including on exceptions.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.stop()
+
+    def start(self) -> "Timer":
+        """
+        Starts (or restarts) the timer.
+
+        :return: The timer itself.
+        :rtype: Timer
+        """
+
+        self.elapsed = None
+        self._start = perf_counter_ns()
+
+        return self
+
+    def stop(self) -> int:
+        """
+        Stops the timer and records the elapsed time.
+
+        :return: The elapsed time in nanoseconds.
+        :rtype: int
+
+        :raises RuntimeError: If the timer was not started.
+        """
+
+        end: int = perf_counter_ns()
+
+        if self._start is None:
+            raise RuntimeError(
+                f"Timer {self.label!r} was stopped without being started.",
+            )
+
+        self.elapsed = end - self._start
+        self._start = None
+
+        self._profiler.record(
+            label=self.label,
+            nanoseconds=self.elapsed,
+        )
+
+        return self.elapsed
+
+
+class Profiler:
+    """
+    An aggregating profiler based on the monotonic perf_counter_ns clock.
+
+    Every label keeps a LatencyHistogram with its count, total, min and max,
+    so repeated calls are aggregated instead of stored. Timings can be taken
+    with the profile decorator, the timer context manager or explicit
+    start/stop timers. A disabled profiler reduces the decorator to a flag
+    check and skips recording.
+
+    Attributes:
+        enabled (bool): Whether timings are recorded.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Initializes the Profiler.
+
+        :param enabled: Whether timings are recorded. Defaults to True.
+        :type enabled: bool
+
+        :return: None
+        :rtype: None
+        """
+
+        self.enabled: bool = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock: Lock = Lock()
+
+    def histogram(
+        self,
+        label: str,
+    ) -> Optional[LatencyHistogram]:
+        """
+        Returns the histogram recorded under a label.
+
+        :param label: The label to look up.
+        :type label: str
+
+        :return: The histogram, or None if nothing was recorded under the label.
+        :rtype: Optional[LatencyHistogram]
+        """
+
+        return self._histograms.get(label)
+
+    def labels(self) -> List[str]:
+        """
+        Returns the labels that have recorded timings.
+
+        :return: The labels in sorted order.
+        :rtype: List[str]
+        """
+
+        return sorted(self._histograms)
+
+    def percentile(
+        self,
+        label: str,
+        q: float,
+    ) -> int:
+        """
+        Returns an estimate of a latency percentile for a label.
+
+        :param label: The label to query.
+        :type label: str
+        :param q: The percentile to query (0-100).
+        :type q: float
+
+        :return: The estimated percentile in nanoseconds (0 if nothing was recorded).
+        :rtype: int
+        """
+
+        histogram: Optional[LatencyHistogram] = self._histograms.get(label)
+
+        return histogram.percentile(q) if histogram is not None else 0
+
+    def profile(
+        self,
+        label: Optional[str] = None,
+    ) -> Callable[[F], F]:
+        """
+        Returns a decorator that records the runtime of every call of a function.
+
+        :param label: The label to record under (default is the function's qualified name).
+        :type label: Optional[str]
+
+        :return: The decorator.
+        :rtype: Callable[[F], F]
+        """
+
+        def decorator(function: F) -> F:
+            name: str = label or function.__qualname__
+
+            @wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                # A disabled profiler only costs this flag check.
+                if not self.enabled:
+                    return function(*args, **kwargs)
+
+                start: int = perf_counter_ns()
+
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(
+                        label=name,
+                        nanoseconds=perf_counter_ns() - start,
+                    )
+
+            return wrapper
+
+        return decorator
+
+    def record(
+        self,
+        label: str,
+        nanoseconds: int,
+    ) -> None:
+        """
+        Records a timing under a label.
+
+        :param label: The label to record under.
+        :type label: str
+        :param nanoseconds: The timing in nanoseconds.
+        :type nanoseconds: int
+
+        :return: None
+        :rtype: None
+        """
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            histogram: Optional[LatencyHistogram] = self._histograms.get(label)
+
+            if histogram is None:
+                histogram = self._histograms[label] = LatencyHistogram()
+
+            histogram.record(nanoseconds)
+
+    def reset(
+        self,
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        Discards recorded timings.
+
+        :param label: The label to discard (default is every label).
+        :type label: Optional[str]
+
+        :return: None
+        :rtype: None
+        """
+
+        with self._lock:
+            if label is None:
+                self._histograms.clear()
+            else:
+                self._histograms.pop(label, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Union[float, int]]]:
+        """
+        Returns the summary statistics of every label.
+
+        :return: A dictionary mapping each label to its statistics (see LatencyHistogram.to_dict).
+        :rtype: Dict[str, Dict[str, Union[float, int]]]
+        """
+
+        with self._lock:
+            return {
+                label: histogram.to_dict()
+                for label, histogram in sorted(self._histograms.items())
+            }
+
+    def start(
+        self,
+        label: str,
+    ) -> Timer:
+        """
+        Creates and starts an explicit timer.
+
+        :param label: The label to record under.
+        :type label: str
+
+        :return: The running timer; call stop() to record it.
+        :rtype: Timer
+        """
+
+        return Timer(
+            profiler=self,
+            label=label,
+        ).start()
+
+    def timer(
+        self,
+        label: str,
+    ) -> Timer:
+        """
+        Creates a timer to be used as a context manager.
+
+        :param label: The label to record under.
+        :type label: str
+
+        :return: The (not yet started) timer.
+        :rtype: Timer
+        """
+
+        return Timer(
+            profiler=self,
+            label=label,
+        )
+
+
+# The process-wide default profiler.
+PROFILER: Final[Profiler] = Profiler()
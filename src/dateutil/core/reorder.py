@@ -0,0 +1,242 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import timedelta
+from heapq import heappop, heappush
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+
+__all__: Final[List[str]] = ["ReorderBuffer"]
+
+
+class ReorderBuffer:
+    """
+    A buffer that puts slightly out-of-order events back into timestamp order.
+
+    The watermark trails the newest event time by the allowed lateness.
+    Buffered events at or before the watermark are released in timestamp
+    order (ties keep their arrival order), and events that arrive behind
+    the watermark are late: they are counted and passed to an optional
+    handler instead of being emitted out of order. Event times can be
+    datetime objects or numbers (e.g. epoch seconds) with a matching lateness.
+    """
+
+    def __init__(
+        self,
+        allowed_lateness: Union[timedelta, float, int],
+        key: Optional[Callable[[Any], Any]] = None,
+        on_late: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Initializes the ReorderBuffer.
+
+        :param allowed_lateness: How far behind the newest event time an event may arrive.
+        :type allowed_lateness: Union[timedelta, float, int]
+        :param key: The function that extracts the event time of an event (default is the event itself).
+        :type key: Optional[Callable[[Any], Any]]
+        :param on_late: The function late events are routed to (default is dropping them).
+        :type on_late: Optional[Callable[[Any], None]]
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If the allowed lateness is negative.
+        """
+
+        if allowed_lateness < allowed_lateness * 0:
+            raise ValueError(
+                f"Invalid value for 'allowed_lateness': {allowed_lateness}. Must not be negative.",
+            )
+
+        self.allowed_lateness: Union[timedelta, float, int] = allowed_lateness
+        self.key: Optional[Callable[[Any], Any]] = key
+        self.on_late: Optional[Callable[[Any], None]] = on_late
+
+        # The number of events accepted, released and rejected as late.
+        self.received: int = 0
+        self.emitted: int = 0
+        self.late: int = 0
+
+        # The newest event time seen and the current watermark.
+        self.max_event_time: Any = None
+        self.watermark: Any = None
+
+        # Heap entries are (event time, arrival number, event).
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._sequence: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of buffered events.
+
+        :return: The number of events waiting for the watermark.
+        :rtype: int
+        """
+
+        return len(self._heap)
+
+    def advance(
+        self,
+        watermark: Any,
+    ) -> List[Any]:
+        """
+        Moves the watermark forward explicitly, e.g. when a source is idle.
+
+        :param watermark: The new watermark (ignored if it is not ahead of the current one).
+        :type watermark: Any
+
+        :return: The released events, in timestamp order.
+        :rtype: List[Any]
+        """
+
+        if self.watermark is None or watermark > self.watermark:
+            self.watermark = watermark
+
+        return self._release()
+
+    def flush(self) -> List[Any]:
+        """
+        Releases every buffered event, e.g. at the end of the input.
+
+        The watermark moves forward to the newest buffered event time.
+
+        :return: The released events, in timestamp order.
+        :rtype: List[Any]
+        """
+
+        heap: List[Tuple[Any, int, Any]] = self._heap
+        released: List[Any] = []
+
+        while heap:
+            event_time, _, event = heappop(heap)
+            released.append(event)
+
+            if self.watermark is None or event_time > self.watermark:
+                self.watermark = event_time
+
+        self.emitted += len(released)
+
+        return released
+
+    def process(
+        self,
+        events: Iterable[Any],
+        flush: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Lazily reorders a stream of events.
+
+        :param events: The events.
+        :type events: Iterable[Any]
+        :param flush: Whether to release the remaining events when the input ends. Defaults to True.
+        :type flush: bool
+
+        :return: An iterator over the events in timestamp order (late events excluded).
+        :rtype: Iterator[Any]
+        """
+
+        push = self.push
+
+        for event in events:
+            yield from push(event)
+
+        if flush:
+            yield from self.flush()
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        Returns the watermark progress and counters.
+
+        :return: A dictionary with the watermark, the newest event time, the lag between them and the event counters.
+        :rtype: Dict[str, Any]
+        """
+
+        return {
+            "watermark": self.watermark,
+            "max_event_time": self.max_event_time,
+            "lag": (
+                None
+                if self.watermark is None or self.max_event_time is None
+                else self.max_event_time - self.watermark
+            ),
+            "buffered": len(self._heap),
+            "received": self.received,
+            "emitted": self.emitted,
+            "late": self.late,
+        }
+
+    def push(
+        self,
+        event: Any,
+    ) -> List[Any]:
+        """
+        Adds one event and releases the events the advanced watermark allows.
+
+        :param event: The event.
+        :type event: Any
+
+        :return: The released events, in timestamp order (often empty).
+        :rtype: List[Any]
+        """
+
+        event_time: Any = event if self.key is None else self.key(event)
+
+        # Events behind the watermark can no longer be emitted in order.
+        if self.watermark is not None and event_time < self.watermark:
+            self.late += 1
+
+            if self.on_late is not None:
+                self.on_late(event)
+
+            return []
+
+        self.received += 1
+
+        heappush(self._heap, (event_time, self._sequence, event))
+        self._sequence += 1
+
+        if self.max_event_time is None or event_time > self.max_event_time:
+            self.max_event_time = event_time
+
+            watermark: Any = event_time - self.allowed_lateness
+
+            if self.watermark is None or watermark > self.watermark:
+                self.watermark = watermark
+
+        # Nothing can be released before the oldest buffered event passes the watermark.
+        if self._heap[0][0] > self.watermark:
+            return []
+
+        return self._release()
+
+    def _release(self) -> List[Any]:
+        """
+        Pops every buffered event at or before the watermark.
+
+        :return: The released events, in timestamp order.
+        :rtype: List[Any]
+        """
+
+        heap: List[Tuple[Any, int, Any]] = self._heap
+        watermark: Any = self.watermark
+        released: List[Any] = []
+
+        while heap and heap[0][0] <= watermark:
+            released.append(heappop(heap)[2])
+
+        self.emitted += len(released)
+
+        return released
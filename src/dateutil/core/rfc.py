@@ -0,0 +1,405 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from time import time
+from typing import Callable, Dict, Final, List, Optional, Pattern, Tuple
+
+from .core import DateParsingFormatError
+
+
+__all__: Final[List[str]] = ["RFCDate"]
+
+
+# The name tables of RFC 2822 and RFC 7231; they never depend on the locale.
+DAY_NAMES: Final[Tuple[str, ...]] = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_NAMES: Final[Tuple[str, ...]] = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+# Zero-padded two-digit numbers, so formatting needs no per-field formatting calls.
+_TWO_DIGITS: Final[Tuple[str, ...]] = tuple(f"{number:02d}" for number in range(100))
+
+_MONTH_NUMBERS: Final[Dict[str, int]] = {
+    name.lower(): number for number, name in enumerate(MONTH_NAMES, start=1)
+}
+
+# The obsolete zone names of RFC 2822, in minutes east of UTC.
+_ZONES: Final[Dict[str, int]] = {
+    "ut": 0,
+    "gmt": 0,
+    "z": 0,
+    "edt": -4 * 60,
+    "est": -5 * 60,
+    "cdt": -5 * 60,
+    "cst": -6 * 60,
+    "mdt": -6 * 60,
+    "mst": -7 * 60,
+    "pdt": -7 * 60,
+    "pst": -8 * 60,
+}
+
+_DAYS: Final[str] = "|".join(DAY_NAMES)
+_MONTHS: Final[str] = "|".join(MONTH_NAMES)
+
+# RFC 2822 date-time, including the obsolete forms (2/3-digit years, zone names, no seconds).
+_RFC_2822: Final[Pattern[str]] = re.compile(
+    rf"\s*(?:(?:{_DAYS})\s*,\s*)?"
+    rf"(\d{{1,2}})\s+({_MONTHS})\s+(\d{{2,4}})\s+"
+    r"(\d\d):(\d\d)(?::(\d\d))?"
+    r"(?:\s+([+-]\d{4}|[A-Za-z]{1,3}))?\s*",
+    re.IGNORECASE,
+)
+
+# The obsolete HTTP date formats that RFC 7231 recipients must accept.
+_RFC_850: Final[Pattern[str]] = re.compile(
+    r"(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday), "
+    rf"(\d\d)-({_MONTHS})-(\d\d) (\d\d):(\d\d):(\d\d) GMT",
+)
+_ASCTIME: Final[Pattern[str]] = re.compile(
+    rf"(?:{_DAYS}) ({_MONTHS}) ([ \d]\d) (\d\d):(\d\d):(\d\d) (\d{{4}})",
+)
+
+_UTC: Final[timezone] = timezone.utc
+
+# The fixed offset zones by minutes, created once.
+_OFFSETS: Final[Dict[int, timezone]] = {0: _UTC}
+
+
+def _offset(minutes: int) -> timezone:
+    """
+    Returns the (cached) fixed-offset zone for an offset in minutes.
+
+    :param minutes: The offset in minutes east of UTC.
+    :type minutes: int
+
+    :return: The zone.
+    :rtype: timezone
+    """
+
+    zone: Optional[timezone] = _OFFSETS.get(minutes)
+
+    if zone is None:
+        zone = _OFFSETS[minutes] = timezone(timedelta(minutes=minutes))
+
+    return zone
+
+
+def _build(
+    text: str,
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    zone: timezone,
+) -> datetime:
+    """
+    Builds the parsed datetime object, rejecting invalid fields.
+
+    A leap second (60) is clamped to 59, because datetime cannot represent it.
+
+    :param text: The parsed text (for the error message).
+    :type text: str
+    :param year: The year.
+    :type year: int
+    :param month: The month.
+    :type month: int
+    :param day: The day.
+    :type day: int
+    :param hour: The hour.
+    :type hour: int
+    :param minute: The minute.
+    :type minute: int
+    :param second: The second.
+    :type second: int
+    :param zone: The zone of the result.
+    :type zone: timezone
+
+    :return: The aware datetime object.
+    :rtype: datetime
+
+    :raises DateParsingFormatError: If a field is out of range.
+    """
+
+    try:
+        return datetime(year, month, day, hour, minute, min(second, 59), tzinfo=zone)
+    except ValueError as e:
+        raise DateParsingFormatError(
+            f"Invalid date: {text}.",
+        ) from e
+
+
+class RFCDate:
+    """
+    Locale-independent RFC 2822 (mail) and RFC 7231 (HTTP) date codecs.
+
+    Names come from fixed tables instead of the C library, so the output is
+    valid whatever locale the process runs under. Naive datetime objects are
+    taken as UTC. The *_now methods cache their output per second for the
+    "current date" header, which is rendered once per second at most.
+    """
+
+    # The last (second, rendered header) pairs of the *_now methods.
+    _http_now: Tuple[int, str] = (-1, "")
+    _rfc_2822_now: Tuple[int, str] = (-1, "")
+
+    @classmethod
+    def format_http(
+        cls,
+        value: datetime,
+    ) -> str:
+        """
+        Formats a datetime object as an RFC 7231 IMF-fixdate (e.g. "Sun, 06 Nov 1994 08:49:37 GMT").
+
+        :param value: The datetime object (naive values are taken as UTC).
+        :type value: datetime
+
+        :return: The HTTP date.
+        :rtype: str
+        """
+
+        if value.tzinfo is not None:
+            value = value.astimezone(_UTC)
+
+        two: Tuple[str, ...] = _TWO_DIGITS
+
+        return (
+            f"{DAY_NAMES[value.weekday()]}, {two[value.day]} {MONTH_NAMES[value.month - 1]} "
+            f"{value.year:04d} {two[value.hour]}:{two[value.minute]}:{two[value.second]} GMT"
+        )
+
+    @classmethod
+    def format_rfc_2822(
+        cls,
+        value: datetime,
+    ) -> str:
+        """
+        Formats a datetime object as an RFC 2822 date (e.g. "Tue, 01 Jul 2003 10:52:37 +0200").
+
+        :param value: The datetime object (naive values are taken as UTC, rendered as +0000).
+        :type value: datetime
+
+        :return: The RFC 2822 date.
+        :rtype: str
+        """
+
+        two: Tuple[str, ...] = _TWO_DIGITS
+        offset: Optional[timedelta] = value.utcoffset()
+        minutes: int = 0 if offset is None else offset // timedelta(minutes=1)
+        sign: str = "-" if minutes < 0 else "+"
+        hours, minutes = divmod(abs(minutes), 60)
+
+        return (
+            f"{DAY_NAMES[value.weekday()]}, {two[value.day]} {MONTH_NAMES[value.month - 1]} "
+            f"{value.year:04d} {two[value.hour]}:{two[value.minute]}:{two[value.second]} "
+            f"{sign}{two[hours]}{two[minutes]}"
+        )
+
+    @classmethod
+    def http_now(
+        cls,
+        clock: Callable[[], float] = time,
+    ) -> str:
+        """
+        Returns the current time as an HTTP date, rendered at most once per second.
+
+        :param clock: The clock returning epoch seconds. Defaults to time.time.
+        :type clock: Callable[[], float]
+
+        :return: The HTTP date of the current second.
+        :rtype: str
+        """
+
+        second: int = int(clock())
+        cached: Tuple[int, str] = cls._http_now
+
+        if cached[0] == second:
+            return cached[1]
+
+        text: str = cls.format_http(datetime.fromtimestamp(second, _UTC))
+        cls._http_now = (second, text)
+
+        return text
+
+    @classmethod
+    def parse_http(
+        cls,
+        text: str,
+    ) -> datetime:
+        """
+        Parses an HTTP date: IMF-fixdate, or the obsolete RFC 850 and asctime formats.
+
+        :param text: The HTTP date.
+        :type text: str
+
+        :return: The aware UTC datetime object.
+        :rtype: datetime
+
+        :raises DateParsingFormatError: If the text is not a valid HTTP date.
+        """
+
+        # Fast path: IMF-fixdate has fixed field positions.
+        if (
+            len(text) == 29
+            and text.endswith(" GMT")
+            and text[:3] in DAY_NAMES
+            and text[3:5] == ", "
+            and text[16] == " "
+            and text[19] == ":"
+            and text[22] == ":"
+        ):
+            month: Optional[int] = _MONTH_NUMBERS.get(text[8:11].lower())
+            digits: str = text[5:7] + text[12:16] + text[17:19] + text[20:22] + text[23:25]
+
+            if month is not None and text[7] == " " and text[11] == " " and digits.isascii() and digits.isdigit():
+                return _build(
+                    text,
+                    int(digits[2:6]),
+                    month,
+                    int(digits[0:2]),
+                    int(digits[6:8]),
+                    int(digits[8:10]),
+                    int(digits[10:12]),
+                    _UTC,
+                )
+
+        found = _RFC_850.fullmatch(text)
+
+        if found is not None:
+            day, name, short_year, hour, minute, second = found.groups()
+
+            # Two-digit years more than 50 years in the future are in the past (RFC 7231).
+            current: int = datetime.now(_UTC).year
+            year = current - current % 100 + int(short_year)
+
+            if year > current + 50:
+                year -= 100
+
+            return _build(
+                text, year, _MONTH_NUMBERS[name.lower()], int(day), int(hour), int(minute), int(second), _UTC
+            )
+
+        found = _ASCTIME.fullmatch(text)
+
+        if found is not None:
+            name, day, hour, minute, second, year_text = found.groups()
+
+            return _build(
+                text,
+                int(year_text),
+                _MONTH_NUMBERS[name.lower()],
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                _UTC,
+            )
+
+        raise DateParsingFormatError(
+            f"Invalid HTTP date: {text}.",
+        )
+
+    @classmethod
+    def parse_rfc_2822(
+        cls,
+        text: str,
+    ) -> datetime:
+        """
+        Parses an RFC 2822 date, including its obsolete forms.
+
+        Two-digit years are 1950-2049, three-digit years are offsets from
+        1900, and unknown (e.g. military) zone names are taken as UTC.
+
+        :param text: The RFC 2822 date.
+        :type text: str
+
+        :return: The aware datetime object with the date's own offset.
+        :rtype: datetime
+
+        :raises DateParsingFormatError: If the text is not a valid RFC 2822 date or its offset is out of range.
+        """
+
+        found = _RFC_2822.fullmatch(text)
+
+        if found is None:
+            raise DateParsingFormatError(
+                f"Invalid RFC 2822 date: {text}.",
+            )
+
+        day, name, year_text, hour, minute, second, zone = found.groups()
+
+        year: int = int(year_text)
+
+        if len(year_text) == 2:
+            year += 2000 if year < 50 else 1900
+        elif len(year_text) == 3:
+            year += 1900
+
+        minutes: int = 0
+
+        if zone is not None and zone[0] in "+-":
+            # An offset must stay below a day, with at most 59 minutes.
+            if int(zone[1:3]) > 23 or int(zone[3:5]) > 59:
+                raise DateParsingFormatError(
+                    f"Invalid UTC offset in RFC 2822 date: {text}.",
+                )
+
+            minutes = int(zone[1:3]) * 60 + int(zone[3:5])
+
+            if zone[0] == "-":
+                minutes = -minutes
+        elif zone is not None:
+            minutes = _ZONES.get(zone.lower(), 0)
+
+        return _build(
+            text,
+            year,
+            _MONTH_NUMBERS[name.lower()],
+            int(day),
+            int(hour),
+            int(minute),
+            int(second or 0),
+            _offset(minutes),
+        )
+
+    @classmethod
+    def rfc_2822_now(
+        cls,
+        clock: Callable[[], float] = time,
+    ) -> str:
+        """
+        Returns the current time as an RFC 2822 date in UTC, rendered at most once per second.
+
+        :param clock: The clock returning epoch seconds. Defaults to time.time.
+        :type clock: Callable[[], float]
+
+        :return: The RFC 2822 date of the current second.
+        :rtype: str
+        """
+
+        second: int = int(clock())
+        cached: Tuple[int, str] = cls._rfc_2822_now
+
+        if cached[0] == second:
+            return cached[1]
+
+        text: str = cls.format_rfc_2822(datetime.fromtimestamp(second, _UTC))
+        cls._rfc_2822_now = (second, text)
+
+        return text
@@ -0,0 +1,317 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import json
+from datetime import date, datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .core import DateFormat
+from .formatting import CompiledFormat, compile_format
+
+
+__all__: Final[List[str]] = ["DateJSON", "DateJSONEncoder"]
+
+
+# A decoded JSON value.
+_Value = Any
+
+# The positions that must hold digits for patterns starting with a numeric directive.
+# %d is left out, because strptime also accepts a space-padded day.
+_LEADING_DIGITS: Final[Dict[str, Tuple[int, ...]]] = {
+    "%Y": (0, 1, 2, 3),
+    "%m": (0,),
+    "%H": (0,),
+    "%M": (0,),
+    "%S": (0,),
+    "%y": (0, 1),
+}
+
+
+def _digits_at(
+    text: str,
+    positions: Tuple[int, ...],
+) -> bool:
+    """
+    Checks whether a string holds digits at the given positions.
+
+    :param text: The string to check.
+    :type text: str
+    :param positions: The positions that must hold digits.
+    :type positions: Tuple[int, ...]
+
+    :return: True if every position holds a digit, False otherwise.
+    :rtype: bool
+    """
+
+    for position in positions:
+        if not "0" <= text[position] <= "9":
+            return False
+
+    return True
+
+
+class DateJSONEncoder(json.JSONEncoder):
+    """
+    A JSONEncoder that serializes datetime and date objects.
+
+    Datetime objects are rendered through the compiled formatter of a
+    DateFormat. Aware values are converted to UTC for ISO 8601, whose pattern
+    carries a literal "Z". Plain date objects are rendered as YYYY-MM-DD.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initializes the DateJSONEncoder.
+
+        :param args: The positional arguments of json.JSONEncoder.
+        :type args: Any
+        :param date_format: The format of datetime values. Defaults to ISO 8601.
+        :type date_format: Union[DateFormat, str]
+        :param kwargs: The keyword arguments of json.JSONEncoder.
+        :type kwargs: Any
+
+        :return: None
+        :rtype: None
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.date_format: Union[DateFormat, str] = date_format
+
+        self._formatter: CompiledFormat = compile_format(date_format)
+        self._to_utc: bool = self._formatter.pattern == DateFormat.ISO_8601.value
+
+    def default(
+        self,
+        o: Any,
+    ) -> Any:
+        """
+        Serializes datetime and date objects, and defers everything else.
+
+        :param o: The object that the standard encoder cannot serialize.
+        :type o: Any
+
+        :return: The serializable representation of the object.
+        :rtype: Any
+
+        :raises TypeError: If the object is not serializable.
+        """
+
+        if isinstance(o, datetime):
+            if self._to_utc and o.tzinfo is not None:
+                o = o.astimezone(timezone.utc)
+
+            return self._formatter.format(o)
+
+        if isinstance(o, date):
+            return o.isoformat()
+
+        return super().default(o)
+
+
+class DateJSON:
+    """
+    JSON encoding and decoding of payloads that contain datetimes.
+
+    The decoding hooks only parse strings that pass a cheap structural check
+    (length bounds and leading digits) for one of the
+    configured DateFormats, so ordinary strings never cost a parse attempt or
+    an exception. An optional key allowlist restricts the conversion to
+    known timestamp fields and skips the check for all other keys.
+    """
+
+    @classmethod
+    def dumps(
+        cls,
+        obj: Any,
+        date_format: Union[DateFormat, str] = DateFormat.ISO_8601,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Serializes an object to JSON, converting datetime and date objects.
+
+        :param obj: The object to serialize.
+        :type obj: Any
+        :param date_format: The format of datetime values. Defaults to ISO 8601.
+        :type date_format: Union[DateFormat, str]
+        :param kwargs: Further keyword arguments of json.dumps.
+        :type kwargs: Any
+
+        :return: The JSON document.
+        :rtype: str
+        """
+
+        return json.dumps(
+            obj,
+            cls=DateJSONEncoder,
+            date_format=date_format,
+            **kwargs,
+        )
+
+    @classmethod
+    def loads(
+        cls,
+        text: Union[str, bytes],
+        date_formats: Sequence[Union[DateFormat, str]] = (DateFormat.ISO_8601,),
+        keys: Optional[Collection[str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Deserializes a JSON document, converting timestamp strings inside objects.
+
+        :param text: The JSON document.
+        :type text: Union[str, bytes]
+        :param date_formats: The formats to recognise, in order of preference. Defaults to ISO 8601.
+        :type date_formats: Sequence[Union[DateFormat, str]]
+        :param keys: The only keys whose values are converted (default is every key).
+        :type keys: Optional[Collection[str]]
+        :param kwargs: Further keyword arguments of json.loads.
+        :type kwargs: Any
+
+        :return: The decoded object.
+        :rtype: Any
+        """
+
+        return json.loads(
+            text,
+            object_pairs_hook=cls.object_pairs_hook(
+                date_formats=date_formats,
+                keys=keys,
+            ),
+            **kwargs,
+        )
+
+    @classmethod
+    def object_hook(
+        cls,
+        date_formats: Sequence[Union[DateFormat, str]] = (DateFormat.ISO_8601,),
+        keys: Optional[Collection[str]] = None,
+    ) -> Callable[[Dict[str, _Value]], Dict[str, _Value]]:
+        """
+        Creates an object_hook for json.loads that converts timestamp strings.
+
+        :param date_formats: The formats to recognise, in order of preference. Defaults to ISO 8601.
+        :type date_formats: Sequence[Union[DateFormat, str]]
+        :param keys: The only keys whose values are converted (default is every key).
+        :type keys: Optional[Collection[str]]
+
+        :return: The object hook.
+        :rtype: Callable[[Dict[str, Any]], Dict[str, Any]]
+        """
+
+        convert: Callable[[_Value], _Value] = cls._converter(date_formats)
+        allowed: Optional[frozenset] = None if keys is None else frozenset(keys)
+
+        def hook(obj: Dict[str, _Value]) -> Dict[str, _Value]:
+            for key, value in obj.items():
+                if allowed is not None and key not in allowed:
+                    continue
+
+                if value.__class__ is str or value.__class__ is list:
+                    obj[key] = convert(value)
+
+            return obj
+
+        return hook
+
+    @classmethod
+    def object_pairs_hook(
+        cls,
+        date_formats: Sequence[Union[DateFormat, str]] = (DateFormat.ISO_8601,),
+        keys: Optional[Collection[str]] = None,
+    ) -> Callable[[List[Tuple[str, _Value]]], Dict[str, _Value]]:
+        """
+        Creates an object_pairs_hook for json.loads that converts timestamp strings.
+
+        :param date_formats: The formats to recognise, in order of preference. Defaults to ISO 8601.
+        :type date_formats: Sequence[Union[DateFormat, str]]
+        :param keys: The only keys whose values are converted (default is every key).
+        :type keys: Optional[Collection[str]]
+
+        :return: The object pairs hook.
+        :rtype: Callable[[List[Tuple[str, Any]]], Dict[str, Any]]
+        """
+
+        convert: Callable[[_Value], _Value] = cls._converter(date_formats)
+        allowed: Optional[frozenset] = None if keys is None else frozenset(keys)
+
+        def hook(pairs: List[Tuple[str, _Value]]) -> Dict[str, _Value]:
+            return {
+                key: (
+                    convert(value)
+                    if (value.__class__ is str or value.__class__ is list)
+                    and (allowed is None or key in allowed)
+                    else value
+                )
+                for key, value in pairs
+            }
+
+        return hook
+
+    @classmethod
+    def _converter(
+        cls,
+        date_formats: Sequence[Union[DateFormat, str]],
+    ) -> Callable[[_Value], _Value]:
+        """
+        Creates the function that converts a decoded string (or list) value.
+
+        Every format contributes its length bounds and the digits its pattern
+        must start with (e.g. the four-digit year of ISO 8601), which are
+        checked before the compiled parser runs.
+
+        :param date_formats: The formats to recognise, in order of preference.
+        :type date_formats: Sequence[Union[DateFormat, str]]
+
+        :return: The converter.
+        :rtype: Callable[[Any], Any]
+        """
+
+        checks: List[Tuple[int, int, Tuple[int, ...], Callable[[str], Optional[datetime]]]] = []
+
+        for date_format in date_formats:
+            formatter: CompiledFormat = compile_format(date_format)
+
+            checks.append(
+                (
+                    formatter.min_length,
+                    formatter.max_length,
+                    _LEADING_DIGITS.get(formatter.pattern[:2], ()),
+                    formatter.match,
+                )
+            )
+
+        def convert(value: _Value) -> _Value:
+            if value.__class__ is list:
+                return [convert(item) if item.__class__ is str else item for item in value]
+
+            size: int = len(value)
+
+            for minimum, maximum, positions, match in checks:
+                if minimum <= size <= maximum and _digits_at(value, positions):
+                    parsed: Optional[datetime] = match(value)
+
+                    if parsed is not None:
+                        return parsed
+
+            return value
+
+        return convert
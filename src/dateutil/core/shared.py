@@ -0,0 +1,589 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import islice
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from operator import le
+from struct import Struct
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .column import epoch_bound
+from .core import DateDeserializationError, DateSerializationError
+
+
+__all__: Final[List[str]] = ["SharedTimestamps"]
+
+
+# The segment header: magic, unit, flags, value count (16 bytes, native byte order).
+MAGIC: Final[bytes] = b"DUSM"
+
+_HEADER: Final[Struct] = Struct("=4s2sHQ")
+
+# The header flags.
+FLAG_SORTED: Final[int] = 1
+
+# The epoch units a buffer can hold.
+EpochUnit = Literal["s", "ms", "us", "ns"]
+
+_UNITS: Final[Dict[str, timedelta]] = {
+    "s": timedelta(seconds=1),
+    "ms": timedelta(milliseconds=1),
+    "us": timedelta(microseconds=1),
+    "ns": timedelta(microseconds=1),
+}
+
+# A bound is an epoch number in the buffer's unit or a datetime (naive values are taken as UTC).
+Bound = Union[int, datetime]
+
+
+class SharedTimestamps:
+    """
+    An int64 epoch timestamp table in a multiprocessing.shared_memory segment.
+
+    One process creates the segment and owns it; workers attach by name
+    (pickling an instance only sends the name), so N workers share one
+    copy instead of unpickling N lists of datetime objects. The values are
+    exposed as a memoryview, read-only for attached processes by default,
+    and the batch operations work on that view without copying it. Every
+    batch operation takes an index range, so workers can split the table.
+
+    Call close() in every process and unlink() once in the owner, or use
+    the instance as a context manager, which closes it and, in the owner,
+    unlinks the segment.
+
+    The sorted flag lives in the shared header. A process that writes
+    through a writable values view must call refresh() afterwards, or
+    search and between keep relying on a stale flag.
+    """
+
+    def __init__(
+        self,
+        memory: SharedMemory,
+        owner: bool,
+        readonly: bool,
+    ) -> None:
+        """
+        Initializes the SharedTimestamps over a segment (use create or attach).
+
+        :param memory: The shared memory segment.
+        :type memory: SharedMemory
+        :param owner: Whether this process created the segment and is responsible for unlinking it.
+        :type owner: bool
+        :param readonly: Whether the values view is read-only.
+        :type readonly: bool
+
+        :return: None
+        :rtype: None
+
+        :raises DateDeserializationError: If the segment does not hold a timestamp table.
+        """
+
+        magic, unit, flags, count = _HEADER.unpack_from(memory.buf)
+
+        if magic != MAGIC or unit.decode("ascii").strip() not in _UNITS or memory.size < _HEADER.size + count * 8:
+            raise DateDeserializationError(
+                f"Invalid shared timestamp segment: {memory.name}.",
+            )
+
+        self.memory: SharedMemory = memory
+        self.owner: bool = owner
+        self.readonly: bool = readonly
+
+        self.unit: str = unit.decode("ascii").strip()
+        self.count: int = count
+
+        view: memoryview = memory.buf[_HEADER.size : _HEADER.size + count * 8].cast("q")
+
+        self.values: memoryview = view.toreadonly() if readonly else view
+
+        self._views: List[memoryview] = [view, self.values]
+
+    def __del__(self) -> None:
+        """
+        Closes a table that is garbage collected without close(), before the segment releases its buffer.
+
+        :return: None
+        :rtype: None
+        """
+
+        if getattr(self, "_views", None):
+            self.close()
+
+    def __enter__(self) -> "SharedTimestamps":
+        """
+        :return: The table itself.
+        :rtype: SharedTimestamps
+        """
+
+        return self
+
+    def __exit__(
+        self,
+        *exc_info: Any,
+    ) -> None:
+        """
+        Closes the table and, in the owner, unlinks the segment.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.close()
+
+        if self.owner:
+            self.unlink()
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[int, memoryview]:
+        """
+        :return: The value at an index, or a zero-copy view of a slice.
+        :rtype: Union[int, memoryview]
+        """
+
+        return self.values[index]
+
+    def __len__(self) -> int:
+        """
+        :return: The number of values.
+        :rtype: int
+        """
+
+        return self.count
+
+    def __reduce__(self) -> Tuple[Callable[..., "SharedTimestamps"], Tuple[str, bool]]:
+        """
+        Pickles the table by name, so other processes attach instead of copying it.
+
+        Unpickled tables are always read-only; a worker that has to write
+        attaches with attach(name, readonly=False) instead.
+
+        :return: The attach call of the unpickling process.
+        :rtype: Tuple[Callable[..., SharedTimestamps], Tuple[str, bool]]
+        """
+
+        return (SharedTimestamps.attach, (self.name, True))
+
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the table.
+
+        :return: The representation, including the segment name, size and unit.
+        :rtype: str
+        """
+
+        return f"SharedTimestamps({self.name!r}, count={self.count}, unit={self.unit!r}, owner={self.owner})"
+
+    @property
+    def name(self) -> str:
+        """
+        :return: The name other processes attach by.
+        :rtype: str
+        """
+
+        return self.memory.name
+
+    @property
+    def sorted(self) -> bool:
+        """
+        :return: True if the values are sorted, as last recorded in the shared header.
+        :rtype: bool
+        """
+
+        return bool(_HEADER.unpack_from(self.memory.buf)[2] & FLAG_SORTED)
+
+    @classmethod
+    def attach(
+        cls,
+        name: str,
+        readonly: bool = True,
+    ) -> "SharedTimestamps":
+        """
+        Attaches to a table another process created.
+
+        :param name: The segment name.
+        :type name: str
+        :param readonly: Whether the values view is read-only. Defaults to True.
+        :type readonly: bool
+
+        :return: The attached table (not the owner).
+        :rtype: SharedTimestamps
+
+        :raises FileNotFoundError: If no segment has that name.
+        :raises DateDeserializationError: If the segment does not hold a timestamp table.
+        """
+
+        # Only the owner may be tracked for cleanup: before 3.13 attaching registers
+        # the segment with this process's resource tracker, which would unlink it
+        # when an independently started worker exits.
+        if sys.version_info >= (3, 13):
+            memory: SharedMemory = SharedMemory(name=name, track=False)
+        else:
+            memory = SharedMemory(name=name)
+
+            if os.name == "posix":
+                resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore[attr-defined]
+
+        return cls(memory, owner=False, readonly=readonly)
+
+    def between(
+        self,
+        start: Bound,
+        end: Bound,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> Union[memoryview, array]:
+        """
+        Returns the values in [start, end) within an index range.
+
+        :param start: The inclusive lower bound.
+        :type start: Union[int, datetime]
+        :param end: The exclusive upper bound.
+        :type end: Union[int, datetime]
+        :param first: The first index to search. Defaults to 0.
+        :type first: int
+        :param last: The index to stop before (default is the end).
+        :type last: Optional[int]
+
+        :return: A zero-copy view for sorted tables, or an array('q') of the matches in order otherwise.
+        :rtype: Union[memoryview, array]
+        """
+
+        if self.sorted:
+            low, high = self.search(start, end, first, last)
+
+            return self.values[low:high]
+
+        lower: int = self._epoch(start)
+        upper: int = self._epoch(end)
+
+        return array("q", [value for value in self._range(first, last) if lower <= value < upper])
+
+    def bucket(
+        self,
+        width: Union[int, timedelta],
+        origin: Bound = 0,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> array:
+        """
+        Returns the bucket number of every value: (value - origin) // width.
+
+        :param width: The bucket width in the table's unit or as a timedelta.
+        :type width: Union[int, timedelta]
+        :param origin: The start of bucket 0. Defaults to the Unix epoch.
+        :type origin: Union[int, datetime]
+        :param first: The first index to process. Defaults to 0.
+        :type first: int
+        :param last: The index to stop before (default is the end).
+        :type last: Optional[int]
+
+        :return: The bucket numbers as an array('q'), in index order.
+        :rtype: array
+
+        :raises ValueError: If the width is not positive.
+        """
+
+        step: int = self._width(width)
+        base: int = self._epoch(origin)
+
+        return array("q", [(value - base) // step for value in self._range(first, last)])
+
+    def bucket_counts(
+        self,
+        width: Union[int, timedelta],
+        origin: Bound = 0,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> Dict[int, int]:
+        """
+        Counts the values per bucket, e.g. events per minute.
+
+        See bucket for the parameters.
+
+        :return: A dictionary of bucket number to count (buckets without values are omitted).
+        :rtype: Dict[int, int]
+
+        :raises ValueError: If the width is not positive.
+        """
+
+        step: int = self._width(width)
+        base: int = self._epoch(origin)
+
+        return dict(Counter((value - base) // step for value in self._range(first, last)))
+
+    def close(self) -> None:
+        """
+        Releases the views and detaches this process from the segment.
+
+        Views returned by between or slicing must be released (or dropped) first.
+
+        :return: None
+        :rtype: None
+        """
+
+        for view in reversed(self._views):
+            view.release()
+
+        self._views = []
+        self.memory.close()
+
+    @classmethod
+    def create(
+        cls,
+        values: Iterable[int],
+        unit: EpochUnit = "us",
+        name: Optional[str] = None,
+    ) -> "SharedTimestamps":
+        """
+        Creates a shared table holding a copy of the values; the calling process owns it.
+
+        Buffers of int64 values (array('q'), memoryview, a TimestampColumn's
+        values) are copied into the segment in one step.
+
+        :param values: The epoch values in the given unit.
+        :type values: Iterable[int]
+        :param unit: The epoch unit of the values. Defaults to "us".
+        :type unit: Literal["s", "ms", "us", "ns"]
+        :param name: The segment name (default is a random name).
+        :type name: Optional[str]
+
+        :return: The owned table, with a writable values view.
+        :rtype: SharedTimestamps
+
+        :raises ValueError: If the unit is invalid.
+        :raises DateSerializationError: If a value does not fit into an int64.
+        """
+
+        if unit not in _UNITS:
+            raise ValueError(
+                f"Invalid value for 'unit': {unit}. Must be one of: 's', 'ms', 'us', 'ns'.",
+            )
+
+        source: memoryview
+
+        if isinstance(values, (array, memoryview)) and memoryview(values).format == "q":
+            source = memoryview(values)
+        else:
+            try:
+                source = memoryview(array("q", values))
+            except OverflowError as e:
+                raise DateSerializationError(
+                    "Invalid value: values must fit into a signed 64-bit integer.",
+                ) from e
+
+        count: int = len(source)
+
+        # Sortedness is checked by a C-level pairwise comparison over the source buffer.
+        is_sorted: bool = all(map(le, source, islice(source, 1, None)))
+
+        # A segment cannot be empty, so empty tables still get room for one value.
+        memory: SharedMemory = SharedMemory(name=name, create=True, size=_HEADER.size + max(count, 1) * 8)
+
+        try:
+            _HEADER.pack_into(
+                memory.buf,
+                0,
+                MAGIC,
+                unit.ljust(2).encode("ascii"),
+                FLAG_SORTED if is_sorted else 0,
+                count,
+            )
+            memory.buf[_HEADER.size : _HEADER.size + count * 8] = source.cast("B")
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+        finally:
+            source.release()
+
+        return cls(memory, owner=True, readonly=False)
+
+    def differences(
+        self,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> array:
+        """
+        Returns the differences between consecutive values, in the table's unit.
+
+        :param first: The first index to process. Defaults to 0.
+        :type first: int
+        :param last: The index to stop before (default is the end).
+        :type last: Optional[int]
+
+        :return: The len - 1 differences as an array('q').
+        :rtype: array
+        """
+
+        return array(
+            "q",
+            [following - value for value, following in zip(self._range(first, last), self._range(first + 1, last))],
+        )
+
+    def refresh(self) -> bool:
+        """
+        Re-checks the order of the values after writes and updates the shared sorted flag.
+
+        :return: True if the values are sorted, False otherwise.
+        :rtype: bool
+
+        :raises DateDeserializationError: If the table is attached read-only.
+        """
+
+        if self.readonly:
+            raise DateDeserializationError(
+                f"Cannot update the read-only shared table {self.name}.",
+            )
+
+        is_sorted: bool = all(map(le, self.values, islice(self.values, 1, None)))
+
+        _HEADER.pack_into(
+            self.memory.buf,
+            0,
+            MAGIC,
+            self.unit.ljust(2).encode("ascii"),
+            FLAG_SORTED if is_sorted else 0,
+            self.count,
+        )
+
+        return is_sorted
+
+    def search(
+        self,
+        start: Bound,
+        end: Bound,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        Finds the index range of the values in [start, end) of a sorted table by binary search.
+
+        The result is only correct if refresh() was called after the last write.
+
+        :param start: The inclusive lower bound.
+        :type start: Union[int, datetime]
+        :param end: The exclusive upper bound.
+        :type end: Union[int, datetime]
+        :param first: The first index to search. Defaults to 0.
+        :type first: int
+        :param last: The index to stop before (default is the end).
+        :type last: Optional[int]
+
+        :return: The (first, last) indices; last is exclusive.
+        :rtype: Tuple[int, int]
+
+        :raises DateDeserializationError: If the table is not sorted.
+        """
+
+        if not self.sorted:
+            raise DateDeserializationError(
+                f"Cannot binary-search the unsorted shared table {self.name}.",
+            )
+
+        stop: int = self.count if last is None else last
+        low: int = bisect_left(self.values, self._epoch(start), first, stop)
+        high: int = bisect_left(self.values, self._epoch(end), low, stop)
+
+        return (low, high)
+
+    def unlink(self) -> None:
+        """
+        Destroys the segment once every process has closed it (call it once, in the owner).
+
+        :return: None
+        :rtype: None
+        """
+
+        # A child process shares the owner's resource tracker, so attaching there
+        # removed the owner's registration; restore it so unlinking can unregister it.
+        if sys.version_info < (3, 13) and os.name == "posix":
+            resource_tracker.register(self.memory._name, "shared_memory")  # type: ignore[attr-defined]
+
+        self.memory.unlink()
+
+    def _epoch(
+        self,
+        bound: Bound,
+    ) -> int:
+        """
+        Converts a bound to an epoch value in the table's unit.
+
+        Datetime bounds between two units are rounded up to the next unit.
+
+        :param bound: The bound as an epoch value or a datetime object.
+        :type bound: Union[int, datetime]
+
+        :return: The epoch value.
+        :rtype: int
+        """
+
+        return epoch_bound(bound, self.unit)
+
+    def _range(
+        self,
+        first: int,
+        last: Optional[int],
+    ) -> memoryview:
+        """
+        Returns a zero-copy view of an index range.
+
+        :param first: The first index.
+        :type first: int
+        :param last: The index to stop before (default is the end).
+        :type last: Optional[int]
+
+        :return: The view.
+        :rtype: memoryview
+        """
+
+        return self.values[first:last]
+
+    def _width(
+        self,
+        width: Union[int, timedelta],
+    ) -> int:
+        """
+        Converts a bucket width to the table's unit.
+
+        :param width: The width as a number or a timedelta.
+        :type width: Union[int, timedelta]
+
+        :return: The width in the table's unit.
+        :rtype: int
+
+        :raises ValueError: If the width is not positive.
+        """
+
+        step: int = width // _UNITS[self.unit] if isinstance(width, timedelta) else width
+
+        if self.unit == "ns" and isinstance(width, timedelta):
+            step *= 1000
+
+        if step <= 0:
+            raise ValueError(
+                f"Invalid value for 'width': {width}. Must be positive.",
+            )
+
+        return step
@@ -0,0 +1,682 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from heapq import heappop, heappush
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Final,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .core import DateUtil
+from .timezone import TimezoneUtil, TzLike
+
+
+__all__: Final[List[str]] = [
+    "TimerRegistration",
+    "TimerWheel",
+    "every",
+    "next_aligned",
+    "sleep_until",
+]
+
+
+# Ticks can be aligned to the start of a unit or to an explicit anchor.
+Align = Union[Literal["second", "minute", "hour", "day"], datetime, None]
+
+# Intervals can be given as a timedelta or as seconds.
+Interval = Union[timedelta, float, int]
+
+# The longest single monotonic sleep before the wall clock is consulted again.
+DEFAULT_MAX_STEP: Final[float] = 60.0
+
+# Wakeups this close to the target instant count as on time (seconds).
+_TOLERANCE: Final[float] = 0.001
+
+# The fields reset by each alignment unit.
+_ALIGN_FIELDS: Final[Dict[str, Dict[str, int]]] = {
+    "second": {"microsecond": 0},
+    "minute": {"second": 0, "microsecond": 0},
+    "hour": {"minute": 0, "second": 0, "microsecond": 0},
+    "day": {"hour": 0, "minute": 0, "second": 0, "microsecond": 0},
+}
+
+
+def _now_for(instant: datetime) -> datetime:
+    """
+    Returns the current time in the same flavour (naive or aware) as an instant.
+
+    :param instant: The instant to compare against.
+    :type instant: datetime
+
+    :return: The current local time for naive instants, the current time in the
+        instant's zone for aware ones.
+    :rtype: datetime
+    """
+
+    if instant.tzinfo is None:
+        return DateUtil.now()
+
+    return datetime.now(instant.tzinfo)
+
+
+def _remaining(instant: datetime) -> float:
+    """
+    Returns the seconds left until an instant according to the wall clock.
+
+    :param instant: The instant to wait for.
+    :type instant: datetime
+
+    :return: The remaining seconds (negative if the instant has passed).
+    :rtype: float
+    """
+
+    return (instant - _now_for(instant)).total_seconds()
+
+
+def _as_timedelta(interval: Interval) -> timedelta:
+    """
+    Converts an interval to a positive timedelta.
+
+    :param interval: The interval as a timedelta or in seconds.
+    :type interval: Interval
+
+    :return: The interval as a timedelta.
+    :rtype: timedelta
+
+    :raises ValueError: If the interval is not positive.
+    """
+
+    result: timedelta = (
+        interval if isinstance(interval, timedelta) else timedelta(seconds=interval)
+    )
+
+    if result <= timedelta(0):
+        raise ValueError(
+            f"Invalid value for 'interval': {interval}. Must be positive.",
+        )
+
+    return result
+
+
+def _advance(
+    tick: datetime,
+    interval: timedelta,
+    count: int = 1,
+) -> datetime:
+    """
+    Advances a tick by a number of intervals.
+
+    Whole-day intervals on aware ticks keep the wall-clock time across DST
+    transitions; all other intervals advance the absolute instant.
+
+    :param tick: The tick to advance.
+    :type tick: datetime
+    :param interval: The interval between ticks.
+    :type interval: timedelta
+    :param count: The number of intervals to advance by. Defaults to 1.
+    :type count: int
+
+    :return: The advanced tick.
+    :rtype: datetime
+    """
+
+    if tick.tzinfo is None:
+        return tick + interval * count
+
+    if interval % timedelta(days=1) == timedelta(0):
+        return DateUtil.increment(
+            obj=tick,
+            what="days",
+            amount=interval.days * count,
+            mode="wall",
+        )
+
+    return (tick.astimezone(timezone.utc) + interval * count).astimezone(tick.tzinfo)
+
+
+def next_aligned(
+    interval: Interval,
+    align: Align = None,
+    now: Optional[datetime] = None,
+    tz: Optional[TzLike] = None,
+) -> datetime:
+    """
+    Returns the first tick of an aligned schedule that is not in the past.
+
+    Ticks lie at anchor + k * interval, where the anchor is the start of the
+    current second, minute, hour or day (for a unit name), an explicit datetime,
+    or now itself (for None).
+
+    :param interval: The interval between ticks.
+    :type interval: Interval
+    :param align: The alignment unit or anchor. Defaults to None (no alignment).
+    :type align: Align
+    :param now: The current time (default is now, in tz if given).
+    :type now: Optional[datetime]
+    :param tz: The zone to compute the schedule in (default is naive local time).
+    :type tz: Optional[TzLike]
+
+    :return: The next tick.
+    :rtype: datetime
+
+    :raises ValueError: If the interval is not positive or the alignment unit is unknown.
+    """
+
+    step: timedelta = _as_timedelta(interval)
+
+    if now is None:
+        now = DateUtil.now() if tz is None else TimezoneUtil.now(tz)
+
+    if align is None:
+        return now
+
+    if isinstance(align, datetime):
+        anchor: datetime = align
+    elif align in _ALIGN_FIELDS:
+        anchor = now.replace(**_ALIGN_FIELDS[align])
+
+        # Day boundaries are wall-clock times and may need resolving.
+        if align == "day" and now.tzinfo is not None:
+            anchor = TimezoneUtil.localize(
+                obj=anchor.replace(tzinfo=None),
+                tz=now.tzinfo,
+            )
+    else:
+        raise ValueError(
+            f"Invalid value for 'align': {align}. "
+            "Must be one of: 'second', 'minute', 'hour', 'day', a datetime or None.",
+        )
+
+    # Whole intervals between the anchor and now, rounded up.
+    count: int = -((anchor - now) // step)
+
+    return _advance(
+        tick=anchor,
+        interval=step,
+        count=count,
+    )
+
+
+async def sleep_until(
+    instant: datetime,
+    max_step: float = DEFAULT_MAX_STEP,
+) -> None:
+    """
+    Sleeps until the wall clock reaches an instant.
+
+    The wait itself uses the event loop's monotonic clock. Long waits are split
+    into steps of at most max_step seconds, and the remaining time is recomputed
+    from the wall clock before every step, so clock adjustments are corrected
+    instead of accumulating.
+
+    :param instant: The instant to wake at (naive local time or aware).
+    :type instant: datetime
+    :param max_step: The longest single sleep in seconds. Defaults to 60.
+    :type max_step: float
+
+    :return: None
+    :rtype: None
+    """
+
+    while True:
+        remaining: float = _remaining(instant)
+
+        if remaining <= 0:
+            return
+
+        await asyncio.sleep(min(remaining, max_step))
+
+
+async def every(
+    interval: Interval,
+    align: Align = None,
+    tz: Optional[TzLike] = None,
+    skip_missed: bool = True,
+    max_step: float = DEFAULT_MAX_STEP,
+) -> AsyncIterator[datetime]:
+    """
+    Yields the ticks of an aligned schedule as they are reached.
+
+    Every tick is computed from the schedule (anchor + k * interval) rather
+    than from the previous wakeup, so drift never accumulates.
+
+    :param interval: The interval between ticks.
+    :type interval: Interval
+    :param align: The alignment unit or anchor. Defaults to None (start now).
+    :type align: Align
+    :param tz: The zone to compute the schedule in (default is naive local time).
+    :type tz: Optional[TzLike]
+    :param skip_missed: Whether to skip ticks that passed while the consumer was busy. Defaults to True.
+    :type skip_missed: bool
+    :param max_step: The longest single sleep in seconds. Defaults to 60.
+    :type max_step: float
+
+    :return: An async iterator over the scheduled tick instants.
+    :rtype: AsyncIterator[datetime]
+    """
+
+    step: timedelta = _as_timedelta(interval)
+    tick: datetime = next_aligned(
+        interval=step,
+        align=align,
+        tz=tz,
+    )
+
+    while True:
+        await sleep_until(
+            instant=tick,
+            max_step=max_step,
+        )
+
+        yield tick
+
+        tick = _next_tick(
+            tick=tick,
+            step=step,
+            skip_missed=skip_missed,
+        )
+
+
+def _next_tick(
+    tick: datetime,
+    step: timedelta,
+    skip_missed: bool,
+) -> datetime:
+    """
+    Returns the tick following a tick, optionally skipping ticks in the past.
+
+    :param tick: The last tick.
+    :type tick: datetime
+    :param step: The interval between ticks.
+    :type step: timedelta
+    :param skip_missed: Whether to skip ticks that already passed.
+    :type skip_missed: bool
+
+    :return: The next tick.
+    :rtype: datetime
+    """
+
+    following: datetime = _advance(
+        tick=tick,
+        interval=step,
+    )
+
+    if not skip_missed:
+        return following
+
+    now: datetime = _now_for(tick)
+
+    # Jump straight to the first tick that has not passed yet.
+    if following <= now:
+        following = _advance(
+            tick=tick,
+            interval=step,
+            count=(now - tick) // step + 1,
+        )
+
+    return following
+
+
+class TimerRegistration:
+    """
+    A callback registered with a TimerWheel.
+
+    Attributes:
+        instant (datetime): The wall-clock instant the callback is due at.
+        cancelled (bool): Whether the registration was cancelled.
+    """
+
+    __slots__ = ("instant", "cancelled", "_callback", "_args")
+
+    def __init__(
+        self,
+        instant: datetime,
+        callback: Callable[..., Any],
+        args: Tuple[Any, ...],
+    ) -> None:
+        """
+        Initializes the TimerRegistration.
+
+        :param instant: The wall-clock instant the callback is due at.
+        :type instant: datetime
+        :param callback: The callback to run.
+        :type callback: Callable[..., Any]
+        :param args: The positional arguments to pass to the callback.
+        :type args: Tuple[Any, ...]
+
+        :return: None
+        :rtype: None
+        """
+
+        self.instant: datetime = instant
+        self.cancelled: bool = False
+        self._callback: Callable[..., Any] = callback
+        self._args: Tuple[Any, ...] = args
+
+    def cancel(self) -> None:
+        """
+        Cancels the registration. Cancelled callbacks are dropped when they come due.
+
+        :return: None
+        :rtype: None
+        """
+
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    A shared timer that many coroutines can register wakeups with.
+
+    Registrations are kept in a heap ordered by their monotonic deadline and
+    served by one timer task, so a thousand waiting coroutines cost one
+    sleeping task instead of a thousand. When a deadline is reached the wall
+    clock is checked again and early wakeups are re-armed, which corrects
+    drift between the monotonic and the wall clock on every tick.
+    """
+
+    def __init__(
+        self,
+        max_step: float = DEFAULT_MAX_STEP,
+    ) -> None:
+        """
+        Initializes the TimerWheel. The timer task starts with the first registration.
+
+        :param max_step: The longest single monotonic wait in seconds. Defaults to 60.
+        :type max_step: float
+
+        :return: None
+        :rtype: None
+        """
+
+        self.max_step: float = max_step
+
+        self._heap: List[Tuple[float, int, TimerRegistration]] = []
+        self._sequence: int = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._waiter: Optional["asyncio.Future[None]"] = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of pending registrations (including cancelled ones not yet due).
+
+        :return: The number of pending registrations.
+        :rtype: int
+        """
+
+        return len(self._heap)
+
+    def call_at(
+        self,
+        instant: datetime,
+        callback: Callable[..., Any],
+        *args: Any,
+    ) -> TimerRegistration:
+        """
+        Schedules a callback to run on the event loop when the wall clock reaches an instant.
+
+        :param instant: The instant to run the callback at (naive local time or aware).
+        :type instant: datetime
+        :param callback: The callback to run.
+        :type callback: Callable[..., Any]
+        :param args: The positional arguments to pass to the callback.
+
+        :return: The registration, which can be cancelled.
+        :rtype: TimerRegistration
+        """
+
+        registration: TimerRegistration = TimerRegistration(
+            instant=instant,
+            callback=callback,
+            args=args,
+        )
+
+        self._schedule(registration)
+
+        return registration
+
+    async def close(self) -> None:
+        """
+        Stops the timer task and cancels every pending registration.
+
+        :return: None
+        :rtype: None
+        """
+
+        for _, _, registration in self._heap:
+            registration.cancel()
+
+        self._heap.clear()
+
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    def every(
+        self,
+        interval: Interval,
+        align: Align = None,
+        tz: Optional[TzLike] = None,
+        skip_missed: bool = True,
+    ) -> AsyncIterator[datetime]:
+        """
+        Yields the ticks of an aligned schedule, waiting through the shared timer.
+
+        See the module-level every function for the schedule semantics.
+
+        :param interval: The interval between ticks.
+        :type interval: Interval
+        :param align: The alignment unit or anchor. Defaults to None (start now).
+        :type align: Align
+        :param tz: The zone to compute the schedule in (default is naive local time).
+        :type tz: Optional[TzLike]
+        :param skip_missed: Whether to skip ticks that passed while the consumer was busy. Defaults to True.
+        :type skip_missed: bool
+
+        :return: An async iterator over the scheduled tick instants.
+        :rtype: AsyncIterator[datetime]
+        """
+
+        return self._every(
+            step=_as_timedelta(interval),
+            align=align,
+            tz=tz,
+            skip_missed=skip_missed,
+        )
+
+    async def sleep_until(
+        self,
+        instant: datetime,
+    ) -> None:
+        """
+        Sleeps until the wall clock reaches an instant, waiting through the shared timer.
+
+        :param instant: The instant to wake at (naive local time or aware).
+        :type instant: datetime
+
+        :return: None
+        :rtype: None
+        """
+
+        if _remaining(instant) <= 0:
+            return
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        registration: TimerRegistration = self.call_at(
+            instant,
+            _resolve,
+            future,
+        )
+
+        try:
+            await future
+        finally:
+            registration.cancel()
+
+    async def _every(
+        self,
+        step: timedelta,
+        align: Align,
+        tz: Optional[TzLike],
+        skip_missed: bool,
+    ) -> AsyncIterator[datetime]:
+        """
+        Implements every as an async generator.
+
+        :param step: The interval between ticks.
+        :type step: timedelta
+        :param align: The alignment unit or anchor.
+        :type align: Align
+        :param tz: The zone to compute the schedule in.
+        :type tz: Optional[TzLike]
+        :param skip_missed: Whether to skip ticks that already passed.
+        :type skip_missed: bool
+
+        :return: An async iterator over the scheduled tick instants.
+        :rtype: AsyncIterator[datetime]
+        """
+
+        tick: datetime = next_aligned(
+            interval=step,
+            align=align,
+            tz=tz,
+        )
+
+        while True:
+            await self.sleep_until(tick)
+
+            yield tick
+
+            tick = _next_tick(
+                tick=tick,
+                step=step,
+                skip_missed=skip_missed,
+            )
+
+    async def _run(self) -> None:
+        """
+        Runs the shared timer task.
+
+        :return: None
+        :rtype: None
+        """
+
+        loop: asyncio.AbstractEventLoop = self._loop
+        heap: List[Tuple[float, int, TimerRegistration]] = self._heap
+
+        while True:
+            now: float = loop.time()
+
+            # Fire (or re-arm) every registration whose deadline has passed.
+            while heap and heap[0][0] <= now:
+                _, _, registration = heappop(heap)
+
+                if registration.cancelled:
+                    continue
+
+                # The monotonic deadline may be early relative to the wall clock.
+                if _remaining(registration.instant) > _TOLERANCE:
+                    self._push(registration)
+                    continue
+
+                loop.call_soon(registration._callback, *registration._args)
+
+            # Wait until the earliest deadline or until an earlier one is registered.
+            self._waiter = loop.create_future()
+            handle: Optional[asyncio.TimerHandle] = None
+
+            if heap:
+                handle = loop.call_at(heap[0][0], _resolve, self._waiter)
+
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+                if handle is not None:
+                    handle.cancel()
+
+    def _push(
+        self,
+        registration: TimerRegistration,
+    ) -> float:
+        """
+        Pushes a registration onto the heap with a deadline derived from the wall clock.
+
+        :param registration: The registration to push.
+        :type registration: TimerRegistration
+
+        :return: The monotonic deadline of the registration.
+        :rtype: float
+        """
+
+        deadline: float = self._loop.time() + max(
+            0.0,
+            min(_remaining(registration.instant), self.max_step),
+        )
+
+        self._sequence += 1
+
+        heappush(self._heap, (deadline, self._sequence, registration))
+
+        return deadline
+
+    def _schedule(
+        self,
+        registration: TimerRegistration,
+    ) -> None:
+        """
+        Adds a registration and wakes the timer task if it is now the earliest.
+
+        :param registration: The registration to add.
+        :type registration: TimerRegistration
+
+        :return: None
+        :rtype: None
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Start (or restart, e.g. on a new loop) the shared timer task.
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._task = loop.create_task(self._run())
+
+        deadline: float = self._push(registration)
+
+        if self._heap[0][0] == deadline and self._waiter is not None:
+            _resolve(self._waiter)
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    """
+    Resolves a future unless it is already done.
+
+    :param future: The future to resolve.
+    :type future: asyncio.Future[None]
+
+    :return: None
+    :rtype: None
+    """
+
+    if not future.done():
+        future.set_result(None)
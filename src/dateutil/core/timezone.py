@@ -0,0 +1,1307 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from bisect import bisect_right
+from datetime import MAXYEAR, MINYEAR, datetime, timedelta, timezone, tzinfo
+from threading import Lock
+from typing import (
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # pragma: no cover - Python 3.8 without backports
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
+
+from .core import (
+    DateFormat,
+    DateParsingTimezoneError,
+    DateTimezoneError,
+    DateUtil,
+)
+
+
+__all__: Final[List[str]] = [
+    "Ambiguous",
+    "Nonexistent",
+    "TimezoneUtil",
+    "TransitionTable",
+]
+
+
+# A timezone can be passed either as a tzinfo instance or as a name
+# ("UTC", "Europe/Berlin", "+02:00").
+TzLike = Union[str, tzinfo]
+
+# How to resolve a wall time that occurs twice because the clocks were set back.
+Ambiguous = Literal["earlier", "later", "raise"]
+
+# How to resolve a wall time that is skipped because the clocks were set forward.
+Nonexistent = Literal["shift_forward", "shift_backward", "raise"]
+
+# The naive and aware Unix epochs used for integer second arithmetic.
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# The number of seconds in a day.
+_DAY: Final[int] = 86400
+
+# The sampling step used when scanning a year for offset transitions.
+# Real-world zones never change their offset twice within half a day.
+_SAMPLE_STEP: Final[int] = _DAY // 2
+
+# The distance (in seconds) around a local time that can contain the
+# transitions relevant for resolving it. UTC offsets stay within +/- 26 hours.
+_LOCAL_WINDOW: Final[int] = 2 * _DAY
+
+# The first and last UTC second for which transition tables are built.
+_MIN_SECONDS: Final[int] = (datetime(2, 1, 1) - _EPOCH).days * _DAY
+_MAX_SECONDS: Final[int] = (datetime(9998, 12, 31) - _EPOCH).days * _DAY
+
+# The first and last UTC second at which a zone can be sampled: converting
+# them to local time stays within the range datetime can represent.
+_FIRST_SAMPLE: Final[int] = (datetime(MINYEAR, 1, 2) - _EPOCH).days * _DAY
+_LAST_SAMPLE: Final[int] = (datetime(MAXYEAR, 12, 31) - _EPOCH).days * _DAY
+
+# Process-wide caches for zone objects and per-year transition tables.
+_ZONE_CACHE: Final[Dict[str, tzinfo]] = {}
+_YEAR_CACHE: Final[Dict[Tuple[tzinfo, int], Tuple[List[int], List[int]]]] = {}
+_TABLE_CACHE: Final[Dict[Tuple[tzinfo, int, int], "TransitionTable"]] = {}
+_CACHE_LOCK: Final[Lock] = Lock()
+
+
+def _offset_seconds(delta: Optional[timedelta]) -> int:
+    """
+    Converts a UTC offset into whole seconds.
+
+    :param delta: The UTC offset as returned by tzinfo.utcoffset.
+    :type delta: Optional[timedelta]
+
+    :return: The offset in seconds (0 if no offset is given).
+    :rtype: int
+    """
+
+    # A missing offset is treated as UTC.
+    if delta is None:
+        return 0
+
+    return delta.days * _DAY + delta.seconds
+
+
+def _utc_offset_at(
+    zone: tzinfo,
+    seconds: int,
+) -> int:
+    """
+    Returns the UTC offset (in seconds) of a zone at a given UTC instant.
+
+    :param zone: The zone to query.
+    :type zone: tzinfo
+    :param seconds: The UTC instant as seconds since the Unix epoch.
+    :type seconds: int
+
+    :return: The UTC offset of the zone at that instant in seconds.
+    :rtype: int
+    """
+
+    # Converting from an aware UTC datetime uses tzinfo.fromutc,
+    # which is unambiguous for every instant.
+    return _offset_seconds(
+        (_EPOCH_UTC + timedelta(seconds=seconds)).astimezone(zone).utcoffset()
+    )
+
+
+def _year_transitions(
+    zone: tzinfo,
+    year: int,
+) -> Tuple[List[int], List[int]]:
+    """
+    Computes the offset transitions of a zone within one UTC year.
+
+    The year is sampled at a fixed step and every change in offset is
+    narrowed down to the exact second with a binary search. The first and
+    last day of the datetime range are not sampled, since their local times
+    may not be representable.
+
+    :param zone: The zone to scan.
+    :type zone: tzinfo
+    :param year: The UTC year to scan.
+    :type year: int
+
+    :return: A tuple of (transition instants, offsets), where offsets[0] is the
+        offset in effect at the start of the year and offsets[i + 1] the offset
+        in effect from transitions[i] onwards.
+    :rtype: Tuple[List[int], List[int]]
+    """
+
+    key: Tuple[tzinfo, int] = (zone, year)
+
+    # Return the cached table if this year has been scanned before.
+    cached: Optional[Tuple[List[int], List[int]]] = _YEAR_CACHE.get(key)
+
+    if cached is not None:
+        return cached
+
+    start: int = max((datetime(year, 1, 1) - _EPOCH).days * _DAY, _FIRST_SAMPLE)
+    end: int = (
+        (datetime(year + 1, 1, 1) - _EPOCH).days * _DAY
+        if year < MAXYEAR
+        else _LAST_SAMPLE
+    )
+
+    transitions: List[int] = []
+    offsets: List[int] = [_utc_offset_at(zone, start)]
+
+    # Fixed-offset zones never change their offset.
+    if not isinstance(zone, timezone):
+        previous: int = start
+
+        for current in range(start + _SAMPLE_STEP, end + _SAMPLE_STEP, _SAMPLE_STEP):
+            current = min(current, end)
+            offset: int = _utc_offset_at(zone, current)
+
+            if offset != offsets[-1]:
+                # Narrow the transition down to the first second
+                # at which the new offset is in effect.
+                low: int = previous
+                high: int = current
+
+                while high - low > 1:
+                    middle: int = (low + high) // 2
+
+                    if _utc_offset_at(zone, middle) == offsets[-1]:
+                        low = middle
+                    else:
+                        high = middle
+
+                transitions.append(high)
+                offsets.append(offset)
+
+            previous = current
+
+    result: Tuple[List[int], List[int]] = (transitions, offsets)
+
+    with _CACHE_LOCK:
+        _YEAR_CACHE[key] = result
+
+    return result
+
+
+class TransitionTable:
+    """
+    A precomputed table of UTC offset transitions of one zone over a span.
+
+    Lookups are a binary search over plain integers instead of a full tzinfo
+    round trip, which makes the table suitable for converting large batches.
+
+    Attributes:
+        zone (tzinfo): The zone the table was built for.
+        transitions (List[int]): The UTC instants (seconds since the epoch) at which the offset changes.
+        offsets (List[int]): The offsets in seconds; offsets[i] is in effect before transitions[i].
+    """
+
+    __slots__ = ("zone", "transitions", "offsets")
+
+    def __init__(
+        self,
+        zone: tzinfo,
+        transitions: List[int],
+        offsets: List[int],
+    ) -> None:
+        """
+        Initializes the TransitionTable.
+
+        :param zone: The zone the table was built for.
+        :type zone: tzinfo
+        :param transitions: The sorted UTC transition instants in seconds.
+        :type transitions: List[int]
+        :param offsets: The offsets in seconds, one more than there are transitions.
+        :type offsets: List[int]
+
+        :return: None
+        :rtype: None
+        """
+
+        self.zone: tzinfo = zone
+        self.transitions: List[int] = transitions
+        self.offsets: List[int] = offsets
+
+    @classmethod
+    def for_span(
+        cls,
+        zone: tzinfo,
+        start: int,
+        end: int,
+    ) -> "TransitionTable":
+        """
+        Returns the (cached) transition table of a zone covering a UTC span.
+
+        :param zone: The zone to build the table for.
+        :type zone: tzinfo
+        :param start: The first UTC instant of the span in seconds.
+        :type start: int
+        :param end: The last UTC instant of the span in seconds.
+        :type end: int
+
+        :return: The transition table covering the span (padded by one year on each side).
+        :rtype: TransitionTable
+        """
+
+        # Clamp the span to the range datetime can represent.
+        start = max(_MIN_SECONDS, min(start, _MAX_SECONDS))
+        end = max(_MIN_SECONDS, min(end, _MAX_SECONDS))
+
+        first_year: int = max((_EPOCH + timedelta(seconds=start)).year - 1, MINYEAR)
+        last_year: int = min((_EPOCH + timedelta(seconds=end)).year + 1, MAXYEAR)
+
+        key: Tuple[tzinfo, int, int] = (zone, first_year, last_year)
+
+        # Return the cached table if the span has been requested before.
+        table: Optional[TransitionTable] = _TABLE_CACHE.get(key)
+
+        if table is not None:
+            return table
+
+        transitions: List[int] = []
+        offsets: List[int] = [_year_transitions(zone, first_year)[1][0]]
+
+        # Stitch the per-year tables together, dropping "transitions"
+        # that only repeat the offset already in effect.
+        for year in range(first_year, last_year + 1):
+            year_transitions, year_offsets = _year_transitions(zone, year)
+
+            for instant, offset in zip(year_transitions, year_offsets[1:]):
+                if offset != offsets[-1]:
+                    transitions.append(instant)
+                    offsets.append(offset)
+
+        table = cls(
+            zone=zone,
+            transitions=transitions,
+            offsets=offsets,
+        )
+
+        with _CACHE_LOCK:
+            _TABLE_CACHE[key] = table
+
+        return table
+
+    def ambiguous_fold(
+        self,
+        seconds: int,
+    ) -> int:
+        """
+        Returns the fold of a UTC instant once it is expressed as local time.
+
+        :param seconds: The UTC instant in seconds since the epoch.
+        :type seconds: int
+
+        :return: 1 if the instant is the second occurrence of an ambiguous local time, 0 otherwise.
+        :rtype: int
+        """
+
+        index: int = bisect_right(self.transitions, seconds)
+
+        # The instant is a repeated local time if it lies within the overlap
+        # created by the last transition that moved the clocks backwards.
+        if index and seconds - self.transitions[index - 1] < (
+            self.offsets[index - 1] - self.offsets[index]
+        ):
+            return 1
+
+        return 0
+
+    def gap_at(
+        self,
+        local: int,
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the transition that skips a local time, if any.
+
+        :param local: The local wall time in seconds since the epoch.
+        :type local: int
+
+        :return: A tuple of (transition instant, offset before, offset after) if the local
+            time does not exist, None otherwise.
+        :rtype: Optional[Tuple[int, int, int]]
+        """
+
+        first: int = bisect_right(self.transitions, local - _LOCAL_WINDOW)
+        last: int = bisect_right(self.transitions, local + _LOCAL_WINDOW)
+
+        for index in range(first, last):
+            instant: int = self.transitions[index]
+            before: int = self.offsets[index]
+            after: int = self.offsets[index + 1]
+
+            # Clocks moving forwards skip the local times in [T + before, T + after).
+            if after > before and instant + before <= local < instant + after:
+                return (instant, before, after)
+
+        return None
+
+    def offset_at(
+        self,
+        seconds: int,
+    ) -> int:
+        """
+        Returns the UTC offset in effect at a UTC instant.
+
+        :param seconds: The UTC instant in seconds since the epoch.
+        :type seconds: int
+
+        :return: The UTC offset in seconds.
+        :rtype: int
+        """
+
+        return self.offsets[bisect_right(self.transitions, seconds)]
+
+    def unique_span(
+        self,
+        utc: int,
+    ) -> Tuple[int, int]:
+        """
+        Returns the local wall times that share the offset of a UTC instant unambiguously.
+
+        :param utc: The UTC instant in seconds since the epoch.
+        :type utc: int
+
+        :return: A tuple of (first, end) local seconds; every wall time in [first, end)
+            exists exactly once and resolves with the same offset as the instant.
+        :rtype: Tuple[int, int]
+        """
+
+        index: int = bisect_right(self.transitions, utc)
+        offset: int = self.offsets[index]
+
+        # The span ends where the neighbouring transitions open a gap or an overlap.
+        first: int = (
+            self.transitions[index - 1] + max(self.offsets[index - 1], offset)
+            if index
+            else _MIN_SECONDS
+        )
+        end: int = (
+            self.transitions[index] + min(offset, self.offsets[index + 1])
+            if index < len(self.transitions)
+            else _MAX_SECONDS
+        )
+
+        return (first, end)
+
+    def utc_candidates(
+        self,
+        local: int,
+    ) -> List[int]:
+        """
+        Returns every UTC instant that maps to a local wall time.
+
+        :param local: The local wall time in seconds since the epoch.
+        :type local: int
+
+        :return: The matching UTC instants in ascending order: one for regular times,
+            two for ambiguous times and none for nonexistent times.
+        :rtype: List[int]
+        """
+
+        first: int = bisect_right(self.transitions, local - _LOCAL_WINDOW)
+        last: int = bisect_right(self.transitions, local + _LOCAL_WINDOW)
+
+        candidates: List[int] = []
+
+        # Only the offsets in effect around the local time can produce it.
+        for offset in set(self.offsets[first : last + 1]):
+            if self.offset_at(local - offset) == offset:
+                candidates.append(local - offset)
+
+        candidates.sort()
+
+        return candidates
+
+
+class TimezoneUtil:
+    """
+    A utility class for timezone-aware date and time operations.
+
+    It mirrors the parse, format, boundary and arithmetic helpers of DateUtil
+    for aware datetime objects. Zones are resolved through zoneinfo and kept in
+    a process-wide cache, and batch conversions walk precomputed transition
+    tables instead of performing a full tzinfo lookup per element.
+    """
+
+    @classmethod
+    def calculate_difference(
+        cls,
+        start: datetime,
+        as_: Literal[
+            "days",
+            "hours",
+            "milisconds",
+            "minutes",
+            "months",
+            "seconds",
+            "weeks",
+            "years",
+        ] = "seconds",
+        end: Optional[datetime] = None,
+    ) -> Union[Union[float, int], timedelta]:
+        """
+        Calculates the difference between two aware dates.
+
+        Both dates are normalised to UTC first, so the result is the elapsed
+        time between the two instants regardless of their zones.
+
+        :param start: The start date as an aware datetime object.
+        :type start: datetime
+        :param as_: The unit to return the difference in. Defaults to "seconds".
+        :type as_: Literal["days", "hours", "milisconds", "minutes", "months", "seconds", "weeks", "years"]
+        :param end: The end date as an aware datetime object (default is now).
+        :type end: Optional[datetime]
+
+        :return: The difference between the two dates in the requested unit.
+        :rtype: Union[Union[int, float], timedelta]
+
+        :raises DateTimezoneError: If either date is naive.
+        :raises DateArithmeticError: If the end date is before the start date.
+        """
+
+        # Default the end date to the current instant.
+        if end is None:
+            end = cls.now(timezone.utc)
+
+        return DateUtil.calculate_difference(
+            start=cls.to_utc(start).replace(tzinfo=None),
+            as_=as_,
+            end=cls.to_utc(end).replace(tzinfo=None),
+        )
+
+    @classmethod
+    def convert(
+        cls,
+        obj: datetime,
+        from_tz: Optional[TzLike],
+        to_tz: TzLike,
+    ) -> datetime:
+        """
+        Converts a datetime object from one timezone to another.
+
+        :param obj: The datetime object to convert. Naive values are interpreted in from_tz.
+        :type obj: datetime
+        :param from_tz: The zone of naive input values (ignored for aware values).
+        :type from_tz: Optional[TzLike]
+        :param to_tz: The zone to convert to.
+        :type to_tz: TzLike
+
+        :return: The converted aware datetime object.
+        :rtype: datetime
+
+        :raises DateTimezoneError: If a zone is unknown or a naive value has no from_tz.
+        """
+
+        # Attach the source zone to naive values first.
+        if obj.tzinfo is None:
+            if from_tz is None:
+                raise DateTimezoneError(
+                    f"Cannot convert naive datetime {obj} without a source timezone.",
+                )
+
+            obj = obj.replace(tzinfo=cls.get_zone(from_tz))
+
+        return obj.astimezone(cls.get_zone(to_tz))
+
+    @classmethod
+    def convert_many(
+        cls,
+        values: Iterable[datetime],
+        from_tz: Optional[TzLike],
+        to_tz: TzLike,
+    ) -> List[datetime]:
+        """
+        Converts a batch of datetime objects from one timezone to another.
+
+        The offsets are taken from transition tables precomputed for the span
+        being converted. Consecutive values that fall between the same pair of
+        transitions reuse the previous lookup, so sorted input is walked rather
+        than searched.
+
+        :param values: The datetime objects to convert. Naive values are interpreted in from_tz.
+        :type values: Iterable[datetime]
+        :param from_tz: The zone of naive input values (ignored for aware values).
+        :type from_tz: Optional[TzLike]
+        :param to_tz: The zone to convert to.
+        :type to_tz: TzLike
+
+        :return: The converted aware datetime objects, in input order.
+        :rtype: List[datetime]
+
+        :raises DateTimezoneError: If a zone is unknown or a naive value has no from_tz.
+        """
+
+        values = list(values)
+
+        # Nothing to do for an empty batch.
+        if not values:
+            return []
+
+        target: tzinfo = cls.get_zone(to_tz)
+        source_table: Optional[TransitionTable] = None
+
+        # First pass: express every value as the elapsed time since the
+        # UTC epoch. Aware subtraction applies each value's own offset.
+        instants: List[timedelta] = []
+
+        for value in values:
+            if value.tzinfo is not None:
+                instants.append(value - _EPOCH_UTC)
+                continue
+
+            # Naive values are resolved against the source zone's table,
+            # which is built once for the whole batch.
+            if source_table is None:
+                if from_tz is None:
+                    raise DateTimezoneError(
+                        "Cannot convert naive datetimes without a source timezone.",
+                    )
+
+                source_table = TransitionTable.for_span(
+                    cls.get_zone(from_tz),
+                    (min(values, key=cls._naive).replace(tzinfo=None) - _EPOCH).days
+                    * _DAY
+                    - _LOCAL_WINDOW,
+                    (max(values, key=cls._naive).replace(tzinfo=None) - _EPOCH).days
+                    * _DAY
+                    + 2 * _LOCAL_WINDOW,
+                )
+
+            delta: timedelta = value - _EPOCH
+
+            instants.append(
+                timedelta(
+                    0,
+                    cls._resolve_local(
+                        table=source_table,
+                        local=delta.days * _DAY + delta.seconds,
+                        fold=value.fold,
+                    ),
+                    delta.microseconds,
+                )
+            )
+
+        target_table: TransitionTable = TransitionTable.for_span(
+            target,
+            min(instants).days * _DAY,
+            max(instants).days * _DAY + _DAY,
+        )
+
+        transitions: List[int] = target_table.transitions
+        offsets: List[int] = target_table.offsets
+
+        # Adding a timedelta to an aware datetime keeps its tzinfo without
+        # consulting it, so results are built from a wall-time anchor.
+        anchor: datetime = _EPOCH.replace(tzinfo=target)
+
+        # The interval [lower, upper) in which the cached offset is valid,
+        # and the end of the repeated local times at its start.
+        lower: timedelta = timedelta.max
+        upper: timedelta = timedelta.min
+        fold_until: timedelta = timedelta.min
+        current: timedelta = timedelta(0)
+
+        results: List[datetime] = []
+
+        # Second pass: walk the target table and build the output values.
+        # The table is only searched when a value leaves the current interval.
+        for instant in instants:
+            if not lower <= instant < upper:
+                index: int = bisect_right(
+                    transitions,
+                    instant.days * _DAY + instant.seconds,
+                )
+                lower = (
+                    timedelta(seconds=transitions[index - 1])
+                    if index
+                    else timedelta.min
+                )
+                upper = (
+                    timedelta(seconds=transitions[index])
+                    if index < len(transitions)
+                    else timedelta.max
+                )
+                current = timedelta(seconds=offsets[index])
+
+                # Values right after a backwards transition repeat a local time.
+                fold_until = (
+                    lower + timedelta(seconds=offsets[index - 1] - offsets[index])
+                    if index and offsets[index - 1] > offsets[index]
+                    else timedelta.min
+                )
+
+            if instant < fold_until:
+                results.append((anchor + (instant + current)).replace(fold=1))
+            else:
+                results.append(anchor + (instant + current))
+
+        return results
+
+    @classmethod
+    def datetime_to_string(
+        cls,
+        date: datetime,
+        tz: TzLike,
+        date_format: DateFormat = DateFormat.ISO_8601,
+    ) -> str:
+        """
+        Converts a datetime object to a string in the specified format and timezone.
+
+        ISO 8601 output always carries the literal "Z" suffix, so it is rendered in UTC.
+
+        :param date: The datetime object to convert. Naive values are interpreted in tz.
+        :type date: datetime
+        :param tz: The zone to render the value in.
+        :type tz: TzLike
+        :param date_format: The format to convert the datetime to. Defaults to ISO 8601.
+        :type date_format: DateFormat
+
+        :return: The formatted date string.
+        :rtype: str
+
+        :raises DateTimezoneError: If the zone is unknown.
+        """
+
+        obj: datetime = cls.convert(
+            obj=date,
+            from_tz=tz,
+            to_tz=timezone.utc if date_format is DateFormat.ISO_8601 else tz,
+        )
+
+        return DateUtil.datetime_to_string(
+            date=obj,
+            date_format=date_format,
+        )
+
+    @classmethod
+    def end_of_day(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the end of the current day (23:59:59.999999) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The end of the current day as an aware datetime object.
+        :rtype: datetime
+        """
+
+        return cls.localize(
+            obj=cls.now(tz).replace(
+                tzinfo=None,
+                hour=23,
+                minute=59,
+                second=59,
+                microsecond=999999,
+            ),
+            tz=tz,
+        )
+
+    @classmethod
+    def end_of_month(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the end of the current month (last day at 23:59:59.999999) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The end of the current month as an aware datetime object.
+        :rtype: datetime
+        """
+
+        current: datetime = cls.now(tz)
+
+        return cls.localize(
+            obj=current.replace(
+                tzinfo=None,
+                day=DateUtil.days_in_month(
+                    month=current.month,
+                    year=current.year,
+                ),
+                hour=23,
+                minute=59,
+                second=59,
+                microsecond=999999,
+            ),
+            tz=tz,
+        )
+
+    @classmethod
+    def end_of_week(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the end of the current week (Sunday at 23:59:59.999999) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The end of the current week as an aware datetime object.
+        :rtype: datetime
+        """
+
+        current: datetime = cls.now(tz)
+
+        return cls.localize(
+            obj=current.replace(
+                tzinfo=None,
+                hour=23,
+                minute=59,
+                second=59,
+                microsecond=999999,
+            )
+            + timedelta(days=6 - current.weekday()),
+            tz=tz,
+        )
+
+    @classmethod
+    def end_of_year(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the end of the current year (December 31st at 23:59:59.999999) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The end of the current year as an aware datetime object.
+        :rtype: datetime
+        """
+
+        return cls.localize(
+            obj=cls.now(tz).replace(
+                tzinfo=None,
+                month=12,
+                day=31,
+                hour=23,
+                minute=59,
+                second=59,
+                microsecond=999999,
+            ),
+            tz=tz,
+        )
+
+    @classmethod
+    def get_zone(
+        cls,
+        tz: TzLike,
+    ) -> tzinfo:
+        """
+        Returns the tzinfo object for a zone, using the process-wide zone cache.
+
+        Accepted names are "UTC"/"Z", fixed offsets such as "+02:00" or "-0530",
+        and IANA zone keys such as "Europe/Berlin".
+
+        :param tz: The zone name or tzinfo object.
+        :type tz: TzLike
+
+        :return: The resolved tzinfo object.
+        :rtype: tzinfo
+
+        :raises DateTimezoneError: If the zone is unknown or zoneinfo is unavailable.
+        """
+
+        # tzinfo objects are passed through unchanged.
+        if isinstance(tz, tzinfo):
+            return tz
+
+        zone: Optional[tzinfo] = _ZONE_CACHE.get(tz)
+
+        if zone is not None:
+            return zone
+
+        if tz in ("UTC", "Z", "utc"):
+            zone = timezone.utc
+        elif tz[:1] in ("+", "-"):
+            zone = cls._parse_fixed_offset(tz)
+        else:
+            if ZoneInfo is None:
+                raise DateTimezoneError(
+                    f"Cannot resolve timezone {tz!r}: zoneinfo is not available.",
+                )
+
+            try:
+                zone = ZoneInfo(tz)
+            except (ZoneInfoNotFoundError, ValueError) as e:
+                raise DateTimezoneError(
+                    f"Unknown timezone: {tz!r}.",
+                ) from e
+
+        with _CACHE_LOCK:
+            _ZONE_CACHE[tz] = zone
+
+        return zone
+
+    @classmethod
+    def localize(
+        cls,
+        obj: datetime,
+        tz: TzLike,
+        ambiguous: Ambiguous = "earlier",
+        nonexistent: Nonexistent = "shift_forward",
+    ) -> datetime:
+        """
+        Attaches a timezone to a naive local datetime object.
+
+        :param obj: The naive datetime object to localize.
+        :type obj: datetime
+        :param tz: The zone the wall time belongs to.
+        :type tz: TzLike
+        :param ambiguous: How to resolve a wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_forward", "shift_backward", "raise"]
+
+        :return: The aware datetime object.
+        :rtype: datetime
+
+        :raises DateTimezoneError: If the value is already aware, the zone is unknown
+            or the wall time cannot be resolved under the given policies.
+        """
+
+        return cls.localize_many(
+            values=(obj,),
+            tz=tz,
+            ambiguous=ambiguous,
+            nonexistent=nonexistent,
+        )[0]
+
+    @classmethod
+    def localize_many(
+        cls,
+        values: Iterable[datetime],
+        tz: TzLike,
+        ambiguous: Ambiguous = "earlier",
+        nonexistent: Nonexistent = "shift_forward",
+    ) -> List[datetime]:
+        """
+        Attaches a timezone to a batch of naive local datetime objects.
+
+        Offsets are resolved from the cached transition table of the zone.
+        Consecutive values that stay within the same unambiguous span reuse
+        the previous lookup, so long series of local times are walked rather
+        than searched.
+
+        Ambiguous wall times resolve to the first ("earlier") or second ("later")
+        occurrence. Nonexistent wall times resolve to the first instant after the
+        gap ("shift_forward") or the last instant before it ("shift_backward").
+        Either policy can be "raise" instead.
+
+        :param values: The naive datetime objects to localize.
+        :type values: Iterable[datetime]
+        :param tz: The zone the wall times belong to.
+        :type tz: TzLike
+        :param ambiguous: How to resolve a wall time that occurs twice. Defaults to "earlier".
+        :type ambiguous: Literal["earlier", "later", "raise"]
+        :param nonexistent: How to resolve a wall time that is skipped. Defaults to "shift_forward".
+        :type nonexistent: Literal["shift_forward", "shift_backward", "raise"]
+
+        :return: The aware datetime objects, in input order.
+        :rtype: List[datetime]
+
+        :raises DateTimezoneError: If a value is already aware, the zone is unknown
+            or a wall time cannot be resolved under the given policies.
+        """
+
+        values = list(values)
+
+        # Nothing to do for an empty batch.
+        if not values:
+            return []
+
+        # Localizing an aware value would silently change its meaning.
+        for value in values:
+            if value.tzinfo is not None:
+                raise DateTimezoneError(
+                    f"Cannot localize aware datetime {value}.",
+                )
+
+        zone: tzinfo = cls.get_zone(tz)
+
+        table: TransitionTable = TransitionTable.for_span(
+            zone,
+            (min(values) - _EPOCH).days * _DAY - _LOCAL_WINDOW,
+            (max(values) - _EPOCH).days * _DAY + 2 * _LOCAL_WINDOW,
+        )
+
+        # Adding a timedelta to an aware datetime keeps its tzinfo without
+        # consulting it, so results are built from a wall-time anchor.
+        anchor: datetime = _EPOCH.replace(tzinfo=zone)
+
+        # The local span [lower, upper) in which wall times are unambiguous.
+        lower: timedelta = timedelta.max
+        upper: timedelta = timedelta.min
+
+        results: List[datetime] = []
+
+        for value in values:
+            delta: timedelta = value - _EPOCH
+
+            if lower <= delta < upper:
+                results.append(anchor + delta)
+                continue
+
+            local: int = delta.days * _DAY + delta.seconds
+            candidates: List[int] = table.utc_candidates(local)
+
+            if len(candidates) == 1:
+                first, end = table.unique_span(candidates[0])
+                lower = timedelta(seconds=first)
+                upper = timedelta(seconds=end)
+
+                results.append(anchor + delta)
+            elif candidates:
+                if ambiguous == "raise":
+                    raise DateTimezoneError(
+                        f"The local time {value} is ambiguous in timezone {zone}.",
+                    )
+
+                results.append(
+                    (anchor + delta).replace(fold=1 if ambiguous == "later" else 0)
+                )
+            else:
+                instant, before, after = table.gap_at(local)
+
+                if nonexistent == "raise":
+                    raise DateTimezoneError(
+                        f"The local time {value} does not exist in timezone {zone}.",
+                    )
+
+                # The first valid instant after the gap is the transition itself,
+                # the last valid instant before it is one microsecond earlier.
+                results.append(
+                    anchor + timedelta(seconds=instant + after)
+                    if nonexistent == "shift_forward"
+                    else anchor + timedelta(0, instant + before - 1, 999999)
+                )
+
+        return results
+
+    @classmethod
+    def now(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the current date and time in a timezone.
+
+        :param tz: The zone to return the current time in.
+        :type tz: TzLike
+
+        :return: The current date and time as an aware datetime object.
+        :rtype: datetime
+        """
+
+        return datetime.now(cls.get_zone(tz))
+
+    @classmethod
+    def start_of_day(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the start of the current day (midnight) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The start of the current day as an aware datetime object.
+        :rtype: datetime
+        """
+
+        return cls.localize(
+            obj=cls.now(tz).replace(
+                tzinfo=None,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            ),
+            tz=tz,
+        )
+
+    @classmethod
+    def start_of_month(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the start of the current month (first day at midnight) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The start of the current month as an aware datetime object.
+        :rtype: datetime
+        """
+
+        return cls.localize(
+            obj=cls.now(tz).replace(
+                tzinfo=None,
+                day=1,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            ),
+            tz=tz,
+        )
+
+    @classmethod
+    def start_of_week(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the start of the current week (Monday at midnight) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The start of the current week as an aware datetime object.
+        :rtype: datetime
+        """
+
+        current: datetime = cls.now(tz)
+
+        return cls.localize(
+            obj=current.replace(
+                tzinfo=None,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            )
+            - timedelta(days=current.weekday()),
+            tz=tz,
+        )
+
+    @classmethod
+    def start_of_year(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the start of the current year (January 1st at midnight) in a timezone.
+
+        :param tz: The zone to compute the boundary in.
+        :type tz: TzLike
+
+        :return: The start of the current year as an aware datetime object.
+        :rtype: datetime
+        """
+
+        return cls.localize(
+            obj=cls.now(tz).replace(
+                tzinfo=None,
+                month=1,
+                day=1,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            ),
+            tz=tz,
+        )
+
+    @classmethod
+    def string_to_datetime(
+        cls,
+        date_str: str,
+        tz: TzLike,
+        date_format: DateFormat = DateFormat.ISO_8601,
+    ) -> datetime:
+        """
+        Converts a string to an aware datetime object in the specified timezone.
+
+        Strings that carry an offset (RFC 2822) or the "Z" suffix (ISO 8601) are
+        converted to tz; all other strings are taken as wall time in tz.
+
+        :param date_str: The date string to convert.
+        :type date_str: str
+        :param tz: The zone to return the value in.
+        :type tz: TzLike
+        :param date_format: The format of the date string. Defaults to ISO 8601.
+        :type date_format: DateFormat
+
+        :return: The converted aware datetime object.
+        :rtype: datetime
+
+        :raises DateParsingFormatError: If the string cannot be parsed.
+        :raises DateParsingTimezoneError: If the wall time does not exist in tz.
+        :raises DateTimezoneError: If the zone is unknown.
+        """
+
+        obj: datetime = DateUtil.string_to_datetime(
+            date_str=date_str,
+            date_format=date_format,
+        )
+
+        zone: tzinfo = cls.get_zone(tz)
+
+        # The ISO 8601 format ends in a literal "Z", i.e. the value is UTC.
+        if obj.tzinfo is None and date_format is DateFormat.ISO_8601:
+            obj = obj.replace(tzinfo=timezone.utc)
+
+        if obj.tzinfo is not None:
+            return obj.astimezone(zone)
+
+        try:
+            return cls.localize(
+                obj=obj,
+                tz=zone,
+                nonexistent="raise",
+            )
+        except DateTimezoneError as e:
+            # A wall time that falls into a gap cannot have been observed.
+            raise DateParsingTimezoneError(
+                f"The local time {date_str} does not exist in timezone {zone}.",
+            ) from e
+
+    @classmethod
+    def to_utc(
+        cls,
+        obj: datetime,
+    ) -> datetime:
+        """
+        Converts an aware datetime object to UTC.
+
+        :param obj: The aware datetime object to convert.
+        :type obj: datetime
+
+        :return: The datetime object in UTC.
+        :rtype: datetime
+
+        :raises DateTimezoneError: If the value is naive.
+        """
+
+        if obj.tzinfo is None:
+            raise DateTimezoneError(
+                f"Cannot convert naive datetime {obj} to UTC.",
+            )
+
+        return obj.astimezone(timezone.utc)
+
+    @classmethod
+    def today(
+        cls,
+        tz: TzLike,
+    ) -> datetime:
+        """
+        Returns the current date in a timezone with the time set to midnight.
+
+        :param tz: The zone to compute the date in.
+        :type tz: TzLike
+
+        :return: The current date as an aware datetime object with time set to midnight.
+        :rtype: datetime
+        """
+
+        return cls.start_of_day(tz)
+
+    @classmethod
+    def _naive(
+        cls,
+        obj: datetime,
+    ) -> datetime:
+        """
+        Returns the wall time of a datetime object without its tzinfo.
+
+        :param obj: The datetime object.
+        :type obj: datetime
+
+        :return: The naive wall time.
+        :rtype: datetime
+        """
+
+        return obj.replace(tzinfo=None)
+
+    @classmethod
+    def _parse_fixed_offset(
+        cls,
+        value: str,
+    ) -> timezone:
+        """
+        Parses a fixed UTC offset such as "+02:00" or "-0530".
+
+        :param value: The offset string.
+        :type value: str
+
+        :return: The fixed-offset timezone.
+        :rtype: timezone
+
+        :raises DateTimezoneError: If the offset is malformed.
+        """
+
+        digits: str = value[1:].replace(":", "")
+
+        if len(digits) not in (2, 4) or not digits.isdigit():
+            raise DateTimezoneError(
+                f"Invalid UTC offset: {value!r}.",
+            )
+
+        delta: timedelta = timedelta(
+            hours=int(digits[:2]),
+            minutes=int(digits[2:] or 0),
+        )
+
+        try:
+            return timezone(-delta if value[0] == "-" else delta)
+        except ValueError as e:
+            raise DateTimezoneError(
+                f"Invalid UTC offset: {value!r}.",
+            ) from e
+
+    @classmethod
+    def _resolve_local(
+        cls,
+        table: TransitionTable,
+        local: int,
+        fold: int,
+    ) -> int:
+        """
+        Resolves a local wall time to a UTC instant following PEP 495.
+
+        :param table: The transition table of the zone.
+        :type table: TransitionTable
+        :param local: The local wall time in seconds since the epoch.
+        :type local: int
+        :param fold: The fold of the wall time (0 or 1).
+        :type fold: int
+
+        :return: The UTC instant in seconds since the epoch.
+        :rtype: int
+        """
+
+        candidates: List[int] = table.utc_candidates(local)
+
+        if candidates:
+            # Ambiguous times pick the earlier instant for fold=0.
+            return candidates[-1] if fold and len(candidates) > 1 else candidates[0]
+
+        _, before, after = table.gap_at(local)
+
+        # Nonexistent times use the offset before the gap for fold=0.
+        return local - (after if fold else before)
@@ -0,0 +1,470 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from time import monotonic
+from typing import (
+    Callable,
+    Final,
+    Hashable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+
+__all__: Final[List[str]] = ["RateLimiter", "WindowCounter", "WindowStats"]
+
+
+# A point in time: clock seconds, or a datetime object (naive values are taken as UTC).
+Instant = Union[float, int, datetime]
+
+# A clock returning seconds as a float, e.g. time.monotonic or time.time.
+Clock = Callable[[], float]
+
+# The bucket number of a slot that was never used.
+_UNUSED: Final[int] = -(2**63)
+
+_EPOCH: Final[datetime] = datetime(1970, 1, 1)
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class WindowStats(NamedTuple):
+    """
+    The aggregates of one key over a window.
+    """
+
+    count: int
+    sum: float
+    minimum: Optional[float]
+    maximum: Optional[float]
+
+
+class _Ring:
+    """
+    The ring buffer of sub-buckets of one key.
+    """
+
+    __slots__ = ("epochs", "counts", "sums", "minimums", "maximums", "latest")
+
+    def __init__(
+        self,
+        size: int,
+    ) -> None:
+        """
+        Initializes the _Ring with empty buckets.
+
+        :param size: The number of sub-buckets.
+        :type size: int
+
+        :return: None
+        :rtype: None
+        """
+
+        # The absolute bucket number stored in every slot.
+        self.epochs: List[int] = [_UNUSED] * size
+        self.counts: List[int] = [0] * size
+        self.sums: List[float] = [0.0] * size
+        self.minimums: List[float] = [0.0] * size
+        self.maximums: List[float] = [0.0] * size
+
+        # The newest bucket number recorded.
+        self.latest: int = _UNUSED
+
+
+class WindowCounter:
+    """
+    Per-key count, sum, minimum and maximum over a sliding or tumbling time window.
+
+    Every key owns a ring buffer of sub-buckets, so recording is O(1) and a
+    query is O(number of sub-buckets), independent of the number of events.
+    A sliding window covers the current sub-bucket and the ones before it
+    (its edge moves in steps of window / buckets); a tumbling window covers
+    the current aligned period. Memory is bounded by max_keys, evicting the
+    least recently updated key.
+    """
+
+    def __init__(
+        self,
+        window: Union[float, timedelta],
+        buckets: int = 60,
+        mode: Literal["sliding", "tumbling"] = "sliding",
+        clock: Clock = monotonic,
+        max_keys: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the WindowCounter.
+
+        :param window: The window length in seconds or as a timedelta.
+        :type window: Union[float, timedelta]
+        :param buckets: The number of sub-buckets per window (the resolution). Defaults to 60.
+        :type buckets: int
+        :param mode: Whether the window slides with the clock or tumbles in aligned periods. Defaults to "sliding".
+        :type mode: Literal["sliding", "tumbling"]
+        :param clock: The clock used when no instant is passed. Defaults to time.monotonic.
+        :type clock: Callable[[], float]
+        :param max_keys: The maximum number of tracked keys (default is unbounded).
+        :type max_keys: Optional[int]
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If an option is invalid.
+        """
+
+        seconds: float = window.total_seconds() if isinstance(window, timedelta) else float(window)
+
+        if seconds <= 0:
+            raise ValueError(
+                f"Invalid value for 'window': {window}. Must be positive.",
+            )
+
+        if buckets <= 0:
+            raise ValueError(
+                f"Invalid value for 'buckets': {buckets}. Must be positive.",
+            )
+
+        if mode not in ("sliding", "tumbling"):
+            raise ValueError(
+                f"Invalid value for 'mode': {mode}. Must be one of: 'sliding', 'tumbling'.",
+            )
+
+        if max_keys is not None and max_keys <= 0:
+            raise ValueError(
+                f"Invalid value for 'max_keys': {max_keys}. Must be positive.",
+            )
+
+        self.window: float = seconds
+        self.buckets: int = buckets
+        self.mode: str = mode
+        self.clock: Clock = clock
+        self.max_keys: Optional[int] = max_keys
+
+        self._width: float = seconds / buckets
+        self._rings: "OrderedDict[Hashable, _Ring]" = OrderedDict()
+        self._lock: Final[Lock] = Lock()
+
+    def __contains__(
+        self,
+        key: Hashable,
+    ) -> bool:
+        """
+        :return: True if the key is tracked, False otherwise.
+        :rtype: bool
+        """
+
+        return key in self._rings
+
+    def __len__(self) -> int:
+        """
+        :return: The number of tracked keys.
+        :rtype: int
+        """
+
+        return len(self._rings)
+
+    def count(
+        self,
+        key: Hashable = None,
+        now: Optional[Instant] = None,
+    ) -> int:
+        """
+        Returns the number of events of a key in the current window.
+
+        :param key: The key. Defaults to None.
+        :type key: Hashable
+        :param now: The current instant (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: The number of events.
+        :rtype: int
+        """
+
+        return self.query(key, now).count
+
+    def prune(
+        self,
+        now: Optional[Instant] = None,
+    ) -> int:
+        """
+        Drops every key without events in the current window.
+
+        :param now: The current instant (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: The number of dropped keys.
+        :rtype: int
+        """
+
+        current: int = self._bucket(now)
+
+        with self._lock:
+            stale: List[Hashable] = [
+                key
+                for key, ring in self._rings.items()
+                if ring.latest <= current - self.buckets
+            ]
+
+            for key in stale:
+                del self._rings[key]
+
+        return len(stale)
+
+    def query(
+        self,
+        key: Hashable = None,
+        now: Optional[Instant] = None,
+    ) -> WindowStats:
+        """
+        Returns the aggregates of a key over the current window.
+
+        :param key: The key. Defaults to None.
+        :type key: Hashable
+        :param now: The current instant (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: The count, sum, minimum and maximum (None if there are no events).
+        :rtype: WindowStats
+        """
+
+        current: int = self._bucket(now)
+
+        with self._lock:
+            ring: Optional[_Ring] = self._rings.get(key)
+
+            if ring is None:
+                return WindowStats(0, 0.0, None, None)
+
+            # The oldest bucket number that belongs to the window.
+            if self.mode == "sliding":
+                oldest: int = current - self.buckets + 1
+            else:
+                oldest = current - current % self.buckets
+
+            count: int = 0
+            total: float = 0.0
+            minimum: Optional[float] = None
+            maximum: Optional[float] = None
+
+            for slot, epoch in enumerate(ring.epochs):
+                if not oldest <= epoch <= current or not ring.counts[slot]:
+                    continue
+
+                count += ring.counts[slot]
+                total += ring.sums[slot]
+
+                if minimum is None or ring.minimums[slot] < minimum:
+                    minimum = ring.minimums[slot]
+
+                if maximum is None or ring.maximums[slot] > maximum:
+                    maximum = ring.maximums[slot]
+
+        return WindowStats(count, total, minimum, maximum)
+
+    def record(
+        self,
+        key: Hashable = None,
+        value: float = 1.0,
+        now: Optional[Instant] = None,
+    ) -> bool:
+        """
+        Records one event of a key.
+
+        :param key: The key. Defaults to None.
+        :type key: Hashable
+        :param value: The value added to the sum and compared for the minimum and maximum. Defaults to 1.0.
+        :type value: float
+        :param now: The instant of the event (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: True if the event was recorded, False if it is older than the window.
+        :rtype: bool
+        """
+
+        bucket: int = self._bucket(now)
+        slot: int = bucket % self.buckets
+
+        with self._lock:
+            ring: Optional[_Ring] = self._rings.get(key)
+
+            if ring is None:
+                ring = self._rings[key] = _Ring(self.buckets)
+
+                if self.max_keys is not None and len(self._rings) > self.max_keys:
+                    self._rings.popitem(last=False)
+            elif self.max_keys is not None:
+                self._rings.move_to_end(key)
+
+            if bucket <= ring.latest - self.buckets:
+                return False
+
+            if ring.epochs[slot] != bucket:
+                # The slot still holds an expired bucket, which is reused.
+                ring.epochs[slot] = bucket
+                ring.counts[slot] = 1
+                ring.sums[slot] = value
+                ring.minimums[slot] = value
+                ring.maximums[slot] = value
+            else:
+                ring.counts[slot] += 1
+                ring.sums[slot] += value
+
+                if value < ring.minimums[slot]:
+                    ring.minimums[slot] = value
+
+                if value > ring.maximums[slot]:
+                    ring.maximums[slot] = value
+
+            if bucket > ring.latest:
+                ring.latest = bucket
+
+        return True
+
+    def reset(
+        self,
+        key: Hashable = None,
+    ) -> None:
+        """
+        Drops the events of a key.
+
+        :param key: The key. Defaults to None.
+        :type key: Hashable
+
+        :return: None
+        :rtype: None
+        """
+
+        with self._lock:
+            self._rings.pop(key, None)
+
+    def _bucket(
+        self,
+        now: Optional[Instant],
+    ) -> int:
+        """
+        Returns the absolute bucket number of an instant.
+
+        :param now: The instant (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: The bucket number.
+        :rtype: int
+        """
+
+        if now is None:
+            seconds: float = self.clock()
+        elif isinstance(now, datetime):
+            seconds = (now - (_EPOCH if now.tzinfo is None else _EPOCH_UTC)).total_seconds()
+        else:
+            seconds = now
+
+        return int(seconds // self._width)
+
+
+class RateLimiter:
+    """
+    A per-key sliding-window rate limiter built on WindowCounter.
+
+    An event is admitted if the cost of the admitted events in the window
+    plus its own cost stays within the limit.
+    """
+
+    def __init__(
+        self,
+        limit: float,
+        window: Union[float, timedelta],
+        buckets: int = 10,
+        clock: Clock = monotonic,
+        max_keys: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the RateLimiter.
+
+        :param limit: The maximum total cost per window.
+        :type limit: float
+        :param window: The window length in seconds or as a timedelta.
+        :type window: Union[float, timedelta]
+        :param buckets: The number of sub-buckets per window (the resolution). Defaults to 10.
+        :type buckets: int
+        :param clock: The clock used when no instant is passed. Defaults to time.monotonic.
+        :type clock: Callable[[], float]
+        :param max_keys: The maximum number of tracked keys (default is unbounded).
+        :type max_keys: Optional[int]
+
+        :return: None
+        :rtype: None
+
+        :raises ValueError: If an option is invalid.
+        """
+
+        if limit <= 0:
+            raise ValueError(
+                f"Invalid value for 'limit': {limit}. Must be positive.",
+            )
+
+        self.limit: float = limit
+        self.counter: WindowCounter = WindowCounter(
+            window=window,
+            buckets=buckets,
+            mode="sliding",
+            clock=clock,
+            max_keys=max_keys,
+        )
+
+        self._lock: Final[Lock] = Lock()
+
+    def allow(
+        self,
+        key: Hashable = None,
+        cost: float = 1.0,
+        now: Optional[Instant] = None,
+    ) -> bool:
+        """
+        Admits an event if the key is within its limit, and records it.
+
+        :param key: The key. Defaults to None.
+        :type key: Hashable
+        :param cost: The cost of the event. Defaults to 1.0.
+        :type cost: float
+        :param now: The instant of the event (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: True if the event is admitted, False if it is rejected.
+        :rtype: bool
+        """
+
+        # Read the clock once for both the check and the update.
+        if now is None:
+            now = self.counter.clock()
+
+        # The check and the update happen atomically per limiter.
+        with self._lock:
+            if self.counter.query(key, now).sum + cost > self.limit:
+                return False
+
+            return self.counter.record(key, cost, now)
+
+    def remaining(
+        self,
+        key: Hashable = None,
+        now: Optional[Instant] = None,
+    ) -> float:
+        """
+        Returns the cost a key may still spend in the current window.
+
+        :param key: The key. Defaults to None.
+        :type key: Hashable
+        :param now: The current instant (default is a clock read).
+        :type now: Optional[Instant]
+
+        :return: The remaining cost (never negative).
+        :rtype: float
+        """
+
+        return max(self.limit - self.counter.query(key, now).sum, 0.0)
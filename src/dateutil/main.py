@@ -1,24 +1,466 @@
 """
 Author: Louis Goodnews
-Date: 2025-07-08
+Date: 2026-10-19
 """
 
-from datetime import datetime
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
-from core.core import DateFormat, DateUtil
+from .core.core import DateFormat, DateParsingError, DateUtilError
+from .core.formatting import CompiledFormat, compile_format
+from .core.pipeline import Pipeline
+from .core.timezone import TimezoneUtil
 
 
-def main() -> None:
-    """ """
+# The buffer size of the input and output streams.
+BUFFER_SIZE: Final[int] = 1024 * 1024
 
-    obj: datetime = DateUtil.now()
+# The default number of lines handed to a worker process at once.
+DEFAULT_CHUNK_SIZE: Final[int] = 10_000
 
-    print(f"Current Date and Time: {obj}")
+# The epoch units accepted as "epoch-<unit>", and their steps; nanoseconds are scaled from microseconds.
+_EPOCH_UNITS: Final[Dict[str, timedelta]] = {
+    "s": timedelta(seconds=1),
+    "ms": timedelta(milliseconds=1),
+    "us": timedelta(microseconds=1),
+    "ns": timedelta(microseconds=1),
+}
 
-    print(f"Formatted Date: {DateUtil.datetime_to_string(obj, DateFormat.ISO_8601)}")
+_EPOCH_UTC: Final[datetime] = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-    print(DateUtil.STRING)
+# A parsed format option: ("epoch", unit) or ("format", strftime pattern).
+_Codec = Tuple[str, str]
+
+
+def _codec(spec: str) -> _Codec:
+    """
+    Parses a --from/--to option: a DateFormat name, an epoch unit, or a strftime pattern.
+
+    :param spec: The option value, e.g. "ISO_8601", "epoch-ms" or "%d-%b-%Y %H:%M".
+    :type spec: str
+
+    :return: The parsed codec.
+    :rtype: Tuple[str, str]
+
+    :raises argparse.ArgumentTypeError: If the value is none of these.
+    """
+
+    if spec.lower().startswith("epoch-") and spec[6:].lower() in _EPOCH_UNITS:
+        return ("epoch", spec[6:].lower())
+
+    if spec.upper() in DateFormat.__members__:
+        return ("format", DateFormat[spec.upper()].value)
+
+    if "%" in spec:
+        return ("format", spec)
+
+    raise argparse.ArgumentTypeError(
+        f"Invalid format: {spec}. Must be a DateFormat name, epoch-s/ms/us/ns, or a strftime pattern.",
+    )
+
+
+class _Verbatim(str):
+    """
+    A line that is copied to the output unchanged, e.g. a header.
+    """
+
+
+def _is_utc(pattern: str) -> bool:
+    """
+    Checks whether a strftime pattern ends in a literal "Z" (UTC designator).
+
+    :param pattern: The strftime pattern.
+    :type pattern: str
+
+    :return: True if the pattern ends in "Z" that is not the %Z directive, False otherwise.
+    :rtype: bool
+    """
+
+    # An even number of "%" before the "Z" are escaped percent signs.
+    head: str = pattern[:-1]
+
+    return pattern.endswith("Z") and (len(head) - len(head.rstrip("%"))) % 2 == 0
+
+
+class _Converter:
+    """
+    Converts the timestamp of one line; picklable, so worker processes can run it.
+    """
+
+    def __init__(
+        self,
+        source: _Codec,
+        target: _Codec,
+        from_tz: Optional[str],
+        to_tz: Optional[str],
+        column: Optional[int],
+        delimiter: str,
+        errors: str,
+    ) -> None:
+        """
+        Initializes the _Converter.
+
+        :param source: The input codec.
+        :type source: Tuple[str, str]
+        :param target: The output codec.
+        :type target: Tuple[str, str]
+        :param from_tz: The zone of naive input values (default is UTC).
+        :type from_tz: Optional[str]
+        :param to_tz: The zone to render values in (default is no conversion).
+        :type to_tz: Optional[str]
+        :param column: The zero-based column holding the timestamp (default is the whole line).
+        :type column: Optional[int]
+        :param delimiter: The column delimiter.
+        :type delimiter: str
+        :param errors: What to do with lines that cannot be converted: "raise", "skip" or "keep".
+        :type errors: str
+
+        :return: None
+        :rtype: None
+        """
+
+        self.source: _Codec = source
+        self.target: _Codec = target
+        self.from_tz: Optional[str] = from_tz
+        self.to_tz: Optional[str] = to_tz
+        self.column: Optional[int] = column
+        self.delimiter: str = delimiter
+        self.errors: str = errors
+
+        self._parser: Optional[CompiledFormat] = None
+        self._formatter: Optional[CompiledFormat] = None
+
+        if source[0] == "format":
+            self._parser = compile_format(source[1])
+
+        if target[0] == "format":
+            self._formatter = compile_format(target[1])
+
+        # Naive input values are wall times in the source zone, unless the
+        # format ends in a literal "Z" (e.g. ISO 8601), which marks them as UTC.
+        self._from_zone: tzinfo = (
+            timezone.utc if from_tz is None or (source[0] == "format" and _is_utc(source[1])) else TimezoneUtil.get_zone(from_tz)
+        )
+        self._to_zone: Optional[tzinfo] = None if to_tz is None else TimezoneUtil.get_zone(to_tz)
+
+        # ISO 8601 carries a literal "Z", so values are rendered in UTC.
+        self._to_utc: bool = target == ("format", DateFormat.ISO_8601.value)
+
+    def __call__(
+        self,
+        line: str,
+    ) -> str:
+        """
+        Converts one line.
+
+        :param line: The line, with or without its line break.
+        :type line: str
+
+        :return: The converted line with a line break, or "" if the line is skipped.
+        :rtype: str
+
+        :raises DateParsingError: If the line cannot be converted and the error policy is "raise".
+        """
+
+        text: str = line.rstrip("\r\n")
+
+        if not text or line.__class__ is _Verbatim:
+            return text + "\n"
+
+        try:
+            if self.column is None:
+                return self._convert(text.strip()) + "\n"
+
+            fields: List[str] = text.split(self.delimiter)
+            fields[self.column] = self._convert(fields[self.column].strip())
+
+            return self.delimiter.join(fields) + "\n"
+        except (DateUtilError, IndexError, OverflowError, ValueError) as e:
+            if self.errors == "skip":
+                return ""
+
+            if self.errors == "keep":
+                return text + "\n"
+
+            raise DateParsingError(
+                f"Cannot convert line: {text!r}.",
+            ) from e
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """
+        Returns the constructor arguments; the compiled formats are rebuilt after unpickling.
+
+        :return: The pickled state.
+        :rtype: Tuple[Any, ...]
+        """
+
+        return (self.source, self.target, self.from_tz, self.to_tz, self.column, self.delimiter, self.errors)
+
+    def __setstate__(
+        self,
+        state: Tuple[Any, ...],
+    ) -> None:
+        """
+        Restores the converter from its constructor arguments.
+
+        :param state: The pickled state.
+        :type state: Tuple[Any, ...]
+
+        :return: None
+        :rtype: None
+        """
+
+        self.__init__(*state)
+
+    def _convert(
+        self,
+        field: str,
+    ) -> str:
+        """
+        Converts one timestamp field.
+
+        :param field: The timestamp text.
+        :type field: str
+
+        :return: The converted timestamp text.
+        :rtype: str
+
+        :raises ValueError: If the field cannot be parsed.
+        """
+
+        value: datetime
+
+        if self._parser is not None:
+            value = self._parser.parse(field)
+        else:
+            value = self._from_epoch(field, self.source[1])
+
+        # Every value is made aware first, so each output format renders the same instant.
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=self._from_zone)
+
+        if self._to_zone is not None:
+            value = value.astimezone(self._to_zone)
+
+        if self._formatter is not None:
+            if self._to_utc:
+                value = value.astimezone(timezone.utc)
+
+            return self._formatter.format(value)
+
+        unit: str = self.target[1]
+        epoch: int = (value - _EPOCH_UTC) // _EPOCH_UNITS[unit]
+
+        return str(epoch * 1000 if unit == "ns" else epoch)
+
+    @staticmethod
+    def _from_epoch(
+        field: str,
+        unit: str,
+    ) -> datetime:
+        """
+        Converts an epoch number to an aware UTC datetime object.
+
+        :param field: The epoch number (seconds may have a fraction).
+        :type field: str
+        :param unit: The epoch unit.
+        :type unit: str
+
+        :return: The datetime object.
+        :rtype: datetime
+
+        :raises ValueError: If the field is not a number.
+        """
+
+        if unit == "s" and "." in field:
+            return _EPOCH_UTC + timedelta(microseconds=round(float(field) * 1_000_000))
+
+        if unit == "ns":
+            return _EPOCH_UTC + timedelta(microseconds=int(field) // 1000)
+
+        return _EPOCH_UTC + int(field) * _EPOCH_UNITS[unit]
+
+
+def _lines(
+    paths: Sequence[str],
+    encoding: str,
+    header: int,
+) -> Iterator[str]:
+    """
+    Yields the input lines of every file (or stdin); header lines are marked to be copied unchanged.
+
+    :param paths: The input paths ("-" is stdin).
+    :type paths: Sequence[str]
+    :param encoding: The text encoding.
+    :type encoding: str
+    :param header: The number of leading lines of every input copied unchanged.
+    :type header: int
+
+    :return: An iterator over the lines to convert.
+    :rtype: Iterator[str]
+    """
+
+    for path in paths:
+        if path == "-":
+            stream: TextIO = open(sys.stdin.fileno(), encoding=encoding, buffering=BUFFER_SIZE, closefd=False)
+        else:
+            stream = open(path, encoding=encoding, buffering=BUFFER_SIZE)
+
+        with stream:
+            for _ in range(header):
+                line: str = stream.readline()
+
+                if not line:
+                    break
+
+                yield _Verbatim(line)
+
+            yield from stream
+
+
+def _parser() -> argparse.ArgumentParser:
+    """
+    Creates the argument parser of the command line interface.
+
+    :return: The parser.
+    :rtype: argparse.ArgumentParser
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="dateutil",
+        description="Convert timestamps between formats, epoch units and timezones, line by line.",
+        epilog=f"Formats: {', '.join(DateFormat.__members__)}, epoch-s, epoch-ms, epoch-us, epoch-ns, or a strftime pattern.",
+    )
+
+    parser.add_argument("files", nargs="*", default=["-"], help="input files ('-' or none reads stdin)")
+    parser.add_argument("-f", "--from", dest="source", type=_codec, default=_codec("ISO_8601"), help="input format (default: ISO_8601)")
+    parser.add_argument("-t", "--to", dest="target", type=_codec, default=_codec("ISO_8601"), help="output format (default: ISO_8601)")
+    parser.add_argument("--from-tz", help="zone of naive input values (default: UTC; ignored for formats ending in a literal Z, such as ISO_8601)")
+    parser.add_argument("--to-tz", help="zone to render values in (default: no conversion; not with ISO_8601, which is always UTC)")
+    parser.add_argument("-c", "--column", type=int, help="zero-based column holding the timestamp (default: the whole line)")
+    parser.add_argument("-d", "--delimiter", default=",", help="column delimiter (default: ',')")
+    parser.add_argument("--header", type=int, default=0, help="leading lines of every input copied unchanged (default: 0)")
+    parser.add_argument("-e", "--errors", choices=("raise", "skip", "keep"), default="raise", help="lines that cannot be converted: raise, skip or keep unchanged (default: raise)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help=f"lines per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--encoding", default="utf-8", help="text encoding (default: utf-8)")
+
+    return parser
+
+
+def _write(
+    results: Iterable[str],
+    output: TextIO,
+) -> None:
+    """
+    Writes the converted lines in large batches.
+
+    :param results: The converted lines ("" for skipped lines).
+    :type results: Iterable[str]
+    :param output: The output stream.
+    :type output: TextIO
+
+    :return: None
+    :rtype: None
+    """
+
+    batch: List[str] = []
+
+    for result in results:
+        batch.append(result)
+
+        if len(batch) >= DEFAULT_CHUNK_SIZE:
+            output.write("".join(batch))
+            batch.clear()
+
+    output.write("".join(batch))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the command line interface.
+
+    :param argv: The arguments (default is sys.argv).
+    :type argv: Optional[Sequence[str]]
+
+    :return: The exit status: 0 on success, 1 if a line cannot be converted, 2 for invalid options.
+    :rtype: int
+    """
+
+    parser: argparse.ArgumentParser = _parser()
+    arguments: argparse.Namespace = parser.parse_args(argv)
+
+    if arguments.jobs <= 0:
+        parser.error(f"Invalid value for '--jobs': {arguments.jobs}. Must be positive.")
+
+    if arguments.chunk_size <= 0:
+        parser.error(f"Invalid value for '--chunk-size': {arguments.chunk_size}. Must be positive.")
+
+    if arguments.column is not None and arguments.column < 0:
+        parser.error(f"Invalid value for '--column': {arguments.column}. Must not be negative.")
+
+    try:
+        # Resolve the zones once, so a typo fails before any input is read.
+        for zone in (arguments.from_tz, arguments.to_tz):
+            if zone is not None:
+                TimezoneUtil.get_zone(zone)
+    except DateUtilError as e:
+        parser.error(str(e))
+
+    if arguments.to_tz is not None and arguments.target == ("format", DateFormat.ISO_8601.value):
+        parser.error("Invalid value for '--to-tz': ISO_8601 output is always rendered in UTC (Z). Use another --to format.")
+
+    converter: _Converter = _Converter(
+        source=arguments.source,
+        target=arguments.target,
+        from_tz=arguments.from_tz,
+        to_tz=arguments.to_tz,
+        column=arguments.column,
+        delimiter=arguments.delimiter,
+        errors=arguments.errors,
+    )
+
+    if arguments.output is None:
+        output: TextIO = open(sys.stdout.fileno(), "w", encoding=arguments.encoding, buffering=BUFFER_SIZE, closefd=False)
+    else:
+        output = open(arguments.output, "w", encoding=arguments.encoding, buffering=BUFFER_SIZE)
+
+    try:
+        with output:
+            lines: Iterator[str] = _lines(arguments.files, arguments.encoding, arguments.header)
+
+            _write(
+                Pipeline().map(converter).run(
+                    lines,
+                    engine="process" if arguments.jobs > 1 else "stream",
+                    chunk_size=arguments.chunk_size,
+                    workers=arguments.jobs,
+                ),
+                output,
+            )
+    except BrokenPipeError:
+        # The reader went away (e.g. "| head"); that is not an error.
+        return 0
+    except (DateUtilError, OSError) as e:
+        print(f"dateutil: error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import os
+import sys
+from typing import Final
+
+# Test the working tree rather than an installed copy.
+SRC: Final[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+sys.path.insert(0, SRC)
@@ -0,0 +1,49 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from conftest import SRC
+
+SCRIPT = os.path.join(os.path.dirname(SRC), "benchmarks", "bench_dateutil.py")
+
+
+@pytest.fixture(scope="module")
+def bench() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("bench_dateutil", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def test_every_benchmark_runs(bench: ModuleType) -> None:
+    for name, factory in bench.benchmarks().items():
+        factory(3)()
+
+
+def test_run_reports_every_size(bench: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bench, "MIN_REPEAT_NS", 0)
+
+    result = bench.run(sizes=[1, 10], repeats=2, pattern="increment.days")
+
+    assert sorted(result["results"]) == ["increment.days[10]", "increment.days[1]"]
+    assert result["meta"]["sizes"] == [1, 10]
+
+
+def test_compare_exits_with_1_on_regressions(bench: ModuleType, tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps({"results": {"a": {"min_ns": 100.0}, "b": {"min_ns": 100.0}}}), encoding="utf-8")
+    current.write_text(json.dumps({"results": {"a": {"min_ns": 105.0}, "b": {"min_ns": 150.0}}}), encoding="utf-8")
+
+    assert bench.main(["compare", str(baseline), str(current)]) == 1
+    assert bench.main(["compare", str(baseline), str(current), "--threshold", "0.6"]) == 0
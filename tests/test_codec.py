@@ -0,0 +1,77 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import io
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import TimestampCodec, TimestampDecoder, TimestampEncoder
+from dateutil.core.core import DateDeserializationError, DateSerializationError
+
+
+def _series() -> list:
+    generator = random.Random(2026)
+    regular = list(range(1_700_000_000_000_000, 1_700_000_000_000_000 + 5000 * 1_000_000, 1_000_000))
+    irregular = sorted(generator.randrange(-(2**62), 2**62) for _ in range(3000))
+
+    return regular + [regular[-1] + 7] + irregular + [-(2**63), 2**63 - 1]
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 4096])
+def test_round_trip(block_size: int) -> None:
+    values = _series()
+
+    assert TimestampCodec.decode(TimestampCodec.encode(values, block_size=block_size)).tolist() == values
+
+
+def test_regular_series_are_compact() -> None:
+    values = list(range(0, 10_000 * 1_000_000, 1_000_000))
+
+    assert len(TimestampCodec.encode(values)) < len(values) // 10
+
+
+def test_datetimes_are_epoch_microseconds() -> None:
+    moment = datetime(2024, 7, 1, 12, 0, 0, 1)
+    data = TimestampCodec.encode([moment, moment + timedelta(seconds=1)])
+
+    assert TimestampCodec.to_datetimes(TimestampCodec.decode(data)) == [moment, moment + timedelta(seconds=1)]
+
+
+def test_decoder_indexes_and_skips_blocks() -> None:
+    values = list(range(0, 1000 * 10, 10))
+    decoder = TimestampDecoder(TimestampCodec.encode(values, block_size=100))
+
+    assert (len(decoder), decoder.block_count()) == (1000, 10)
+    assert decoder[0] == 0 and decoder[-1] == 9990 and decoder[555] == 5550
+    assert decoder.between(995, 2005).tolist() == list(range(1000, 2010, 10))
+    assert list(decoder) == values
+
+    with pytest.raises(IndexError):
+        decoder[1000]
+
+
+def test_streaming_encoder_and_decoder() -> None:
+    stream = io.BytesIO()
+
+    with TimestampEncoder(stream, block_size=3) as encoder:
+        encoder.write_many(range(10))
+        encoder.write(100)
+
+    stream.seek(0)
+
+    assert [block.tolist() for block in TimestampCodec.iter_decode(stream)] == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 100]]
+
+
+def test_invalid_streams_are_rejected() -> None:
+    data = TimestampCodec.encode(range(100))
+
+    for corrupt in (b"XXXX" + data[4:], data[:-3]):
+        with pytest.raises(DateDeserializationError):
+            TimestampCodec.decode(corrupt)
+
+    with pytest.raises(DateSerializationError):
+        TimestampCodec.encode([2**63])
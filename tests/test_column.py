@@ -0,0 +1,53 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from dateutil import TimestampColumn
+from dateutil.core.core import DateSerializationError
+
+
+@pytest.mark.parametrize("values", [list(range(10)), [5, 3, 9, 0, 1, 8, 2, 7, 4, 6]])
+def test_datetime_bounds_follow_the_half_open_interval(tmp_path: Path, values: list) -> None:
+    path = tmp_path / "values.dutc"
+    TimestampColumn.write(path, values, unit="s", block_size=4)
+    column = TimestampColumn(path)
+
+    try:
+        assert list(column.between(datetime(1970, 1, 1, 0, 0, 0, 500000), datetime(1970, 1, 1, 0, 0, 1))) == []
+        assert sorted(column.between(datetime(1970, 1, 1), datetime(1970, 1, 1, 0, 0, 1, 500000))) == [0, 1]
+        assert sorted(column.between(datetime(1969, 12, 31, 23, 59, 59, 500000), datetime(1970, 1, 1, 0, 0, 2))) == [0, 1]
+        assert column.count_between(datetime(1970, 1, 1, 0, 0, 0, 500000), datetime(1970, 1, 1, 0, 0, 3, 1)) == 3
+    finally:
+        column.close()
+
+
+def test_failed_write_keeps_the_previous_file(tmp_path: Path) -> None:
+    path = tmp_path / "values.dutc"
+    TimestampColumn.write(path, range(10), unit="s")
+
+    with pytest.raises(DateSerializationError):
+        TimestampColumn.write(path, [1, 2, 2**70], unit="s")
+
+    column = TimestampColumn(path)
+
+    try:
+        assert column.count == 10
+    finally:
+        column.close()
+
+    assert [entry.name for entry in tmp_path.iterdir()] == ["values.dutc"]
+
+
+def test_failed_write_leaves_no_file(tmp_path: Path) -> None:
+    path = tmp_path / "values.dutc"
+
+    with pytest.raises(DateSerializationError):
+        TimestampColumn.write(path, [1, 2, 2**70], unit="s")
+
+    assert list(tmp_path.iterdir()) == []
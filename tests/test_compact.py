@@ -0,0 +1,74 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import pickle
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from dateutil import CompactDate, CompactDateTime, DateFormat, DateUtil
+
+
+def test_compact_types_are_ints() -> None:
+    value = CompactDateTime.from_datetime(datetime(2024, 7, 1, 12, 30, 5, 123))
+    day = CompactDate.from_date(date(2024, 7, 1))
+
+    assert isinstance(value, int) and isinstance(day, int)
+    assert not hasattr(value, "__dict__") and not hasattr(day, "__dict__")
+    assert sorted([value, CompactDateTime(0)]) == [CompactDateTime(0), value]
+    assert hash(value) == hash(CompactDateTime(int(value)))
+
+
+def test_compact_strftime_matches_datetime() -> None:
+    moment = datetime(2024, 7, 1, 12, 30, 5, 123)
+    value = CompactDateTime.from_datetime(moment)
+    day = CompactDate.from_date(moment.date())
+
+    assert value.strftime("%Y-%m-%d %H:%M:%S.%f %j %a") == moment.strftime("%Y-%m-%d %H:%M:%S.%f %j %a")
+    assert day.strftime("%d.%m.%Y %A") == moment.date().strftime("%d.%m.%Y %A")
+    assert f"{day:%d.%m.%Y}" == "01.07.2024"
+    assert DateUtil.datetime_to_string(value, DateFormat.ISO_8601) == "2024-07-01T12:30:05.000123Z"
+
+
+def test_compact_arithmetic_and_pickling() -> None:
+    value = CompactDateTime.from_datetime(datetime(2024, 7, 1, 12))
+
+    assert value + timedelta(days=1) == CompactDateTime.from_datetime(datetime(2024, 7, 2, 12))
+    assert datetime(2024, 7, 1, 13) - value == timedelta(hours=1)
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert bool(CompactDateTime(0))
+
+
+def test_compact_types_do_not_compare_equal_to_ints() -> None:
+    assert len({CompactDate(5), CompactDateTime(5), 5}) == 3
+    assert CompactDate(5) != 5 and CompactDateTime(5) != CompactDate(5)
+    assert {CompactDate(5): "day"}.get(5) is None
+
+
+def test_compact_types_order_against_dates() -> None:
+    day = CompactDate.from_date(date(2024, 7, 1))
+    value = CompactDateTime.from_datetime(datetime(2024, 7, 1, 12))
+
+    assert date(2024, 6, 30) < day <= date(2024, 7, 1)
+    assert day < datetime(2024, 7, 1, 0, 0, 1)
+    assert datetime(2024, 7, 1) < value < datetime(2024, 7, 1, 12, 0, 0, 1)
+    assert DateUtil.is_date_in_range(value, datetime(2024, 1, 1), datetime(2025, 1, 1))
+    assert DateUtil.is_date_in_range(day, datetime(2024, 1, 1), datetime(2025, 1, 1))
+    assert DateUtil.calculate_difference(CompactDateTime.from_datetime(datetime(2000, 1, 1)), as_="years") > 20
+
+
+def test_compact_types_reject_int_arithmetic() -> None:
+    value = CompactDateTime.from_datetime(datetime(2024, 7, 1, 12))
+
+    for operation in (
+        lambda: CompactDate.today() + 1,
+        lambda: 1 + CompactDate.today(),
+        lambda: value - 1,
+        lambda: value * 2,
+        lambda: -value,
+        lambda: value < 0,
+    ):
+        with pytest.raises(TypeError):
+            operation()
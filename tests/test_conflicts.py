@@ -0,0 +1,67 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from dateutil import Conflict, ConflictDetector, ConflictGroup
+from dateutil.core.core import DateComparisonError, DateRangeError
+
+
+def test_pairs_match_brute_force() -> None:
+    generator = random.Random(2026)
+
+    for _ in range(200):
+        items = []
+
+        for _ in range(generator.randrange(12)):
+            start = generator.randrange(30)
+            items.append((start, start + generator.randrange(1, 8)))
+
+        expected = {
+            frozenset((first, second))
+            for first, second in combinations(range(len(items)), 2)
+            if items[first][0] < items[second][1] and items[second][0] < items[first][1]
+        }
+        found = [
+            frozenset((first, second))
+            for _, first, second in ConflictDetector.pairs(range(len(items)), bounds=items.__getitem__)
+        ]
+
+        assert len(found) == len(expected) and set(found) == expected
+
+
+def test_resources_and_endpoints() -> None:
+    bookings = [("room a", 9, 10), ("room a", 10, 11), ("room b", 9, 12), ("room a", 10, 12)]
+
+    def bounds(booking: tuple) -> tuple:
+        return booking[1:]
+
+    def room(booking: tuple) -> str:
+        return booking[0]
+
+    assert list(ConflictDetector.pairs(bookings, bounds, room)) == [Conflict("room a", bookings[1], bookings[3])]
+    assert len(list(ConflictDetector.pairs(bookings, bounds, room, closed=True))) == 3
+    assert not ConflictDetector.has_conflict([(1, 2), (2, 3)])
+    assert ConflictDetector.has_conflict([(1, 2), (2, 3)], closed=True)
+
+
+def test_groups_chain_overlaps() -> None:
+    items = [(0, 2), (1, 4), (3, 5), (6, 8), (9, 10), (9, 11)]
+
+    assert list(ConflictDetector.groups(items)) == [
+        ConflictGroup(None, 0, 5, [(0, 2), (1, 4), (3, 5)]),
+        ConflictGroup(None, 9, 11, [(9, 10), (9, 11)]),
+    ]
+
+
+def test_invalid_input_is_rejected() -> None:
+    with pytest.raises(DateRangeError):
+        list(ConflictDetector.pairs([(2, 1)]))
+
+    with pytest.raises(DateComparisonError):
+        list(ConflictDetector.pairs([(2, 3), (1, 4)], presorted=True))
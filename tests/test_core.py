@@ -0,0 +1,112 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dateutil import DateUtil, RelativeDay, TimezoneUtil
+
+BERLIN = TimezoneUtil.get_zone("Europe/Berlin")
+NEW_YORK = TimezoneUtil.get_zone("America/New_York")
+
+
+def _elapsed(start: datetime, end: datetime) -> timedelta:
+    return end.astimezone(timezone.utc) - start.astimezone(timezone.utc)
+
+
+@pytest.mark.parametrize("many", [False, True])
+def test_wall_increment_by_minutes_keeps_the_second_occurrence(many: bool) -> None:
+    value = datetime(2024, 10, 27, 2, 30, fold=1, tzinfo=BERLIN)
+
+    if many:
+        result = DateUtil.increment_many([value], "minutes", 10)[0]
+    else:
+        result = DateUtil.increment(value, "minutes", 10)
+
+    assert _elapsed(value, result) == timedelta(minutes=10)
+    assert result.fold == 1
+
+
+@pytest.mark.parametrize("many", [False, True])
+def test_wall_increment_by_hours_never_moves_backwards(many: bool) -> None:
+    value = datetime(2024, 10, 27, 2, 30, tzinfo=BERLIN)
+
+    if many:
+        result = DateUtil.increment_many([value], "hours", 1)[0]
+    else:
+        result = DateUtil.increment(value, "hours", 1)
+
+    assert _elapsed(value, result) == timedelta(hours=1)
+
+
+def test_wall_increment_by_days_keeps_the_wall_time() -> None:
+    value = datetime(2024, 3, 30, 12, 0, tzinfo=BERLIN)
+
+    single = DateUtil.increment(value, "days", 1)
+    batch = DateUtil.increment_many([value, datetime(2024, 10, 26, 12, 0, tzinfo=NEW_YORK)], "days", 1)
+
+    assert single == batch[0] == datetime(2024, 3, 31, 12, 0, tzinfo=BERLIN)
+    assert _elapsed(value, single) == timedelta(hours=23)
+    assert batch[1] == datetime(2024, 10, 27, 12, 0, tzinfo=NEW_YORK)
+
+
+def test_wall_increment_splits_durations_into_calendar_and_exact_parts() -> None:
+    value = datetime(2024, 3, 30, 12, 0, tzinfo=BERLIN)
+
+    assert DateUtil.increment(value, "P1DT2H", 1) == datetime(2024, 3, 31, 14, 0, tzinfo=BERLIN)
+    assert DateUtil.increment_many([value], "P1DT2H", 1) == [datetime(2024, 3, 31, 14, 0, tzinfo=BERLIN)]
+
+
+def test_absolute_increment_adds_elapsed_time() -> None:
+    value = datetime(2024, 3, 30, 12, 0, tzinfo=BERLIN)
+
+    result = DateUtil.increment(value, "days", 1, mode="absolute")
+
+    assert _elapsed(value, result) == timedelta(days=1)
+    assert result == datetime(2024, 3, 31, 13, 0, tzinfo=BERLIN)
+
+
+@pytest.mark.parametrize(
+    "option",
+    [{"mode": "bogus"}, {"ambiguous": "bogus"}, {"nonexistent": "bogus"}],
+)
+@pytest.mark.parametrize("many", [False, True])
+def test_increment_validates_policies_for_naive_values(option: dict, many: bool) -> None:
+    with pytest.raises(ValueError):
+        if many:
+            DateUtil.increment_many([datetime(2024, 1, 1)], "days", 1, **option)
+        else:
+            DateUtil.increment(datetime(2024, 1, 1), "days", 1, **option)
+
+
+def test_classify_relative_clamps_deltas_to_codes() -> None:
+    reference = datetime(2024, 7, 10, 23, 59)
+    values = [reference - timedelta(days=days) for days in (10, 3, 2, 1, 0, -1, -2, -30)]
+    values.append(datetime(2024, 7, 10, 0, 0))
+
+    codes, deltas = DateUtil.classify_relative(values, reference=reference.date())
+
+    assert deltas.tolist() == [-10, -3, -2, -1, 0, 1, 2, 30, 0]
+    assert [RelativeDay(code) for code in codes] == [
+        RelativeDay.OLDER,
+        RelativeDay.OLDER,
+        RelativeDay.DAY_BEFORE_YESTERDAY,
+        RelativeDay.YESTERDAY,
+        RelativeDay.TODAY,
+        RelativeDay.TOMORROW,
+        RelativeDay.LATER,
+        RelativeDay.LATER,
+        RelativeDay.TODAY,
+    ]
+
+
+def test_classify_relative_uses_the_local_date_of_aware_values() -> None:
+    value = datetime(2024, 7, 11, 0, 30, tzinfo=BERLIN)
+
+    codes, _ = DateUtil.classify_relative([value, value.astimezone(timezone.utc)], reference=datetime(2024, 7, 10))
+
+    assert codes.tolist() == [RelativeDay.TOMORROW, RelativeDay.TODAY]
+    assert DateUtil.classify_relative([DateUtil.now()])[0].tolist() == [RelativeDay.TODAY]
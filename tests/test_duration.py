@@ -0,0 +1,39 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from dateutil import Duration
+from dateutil.core.core import DateParsingFormatError
+
+
+@pytest.mark.parametrize(
+    ("text", "years", "months", "delta"),
+    [
+        ("P1Y2M3DT4H5M6S", 1, 2, timedelta(days=3, hours=4, minutes=5, seconds=6)),
+        ("PT1.5S", 0, 0, timedelta(seconds=1.5)),
+        ("P2W", 0, 0, timedelta(weeks=2)),
+        ("-P1D", 0, 0, timedelta(days=-1)),
+        ("PT0,25H", 0, 0, timedelta(minutes=15)),
+    ],
+)
+def test_parse(text: str, years: int, months: int, delta: timedelta) -> None:
+    duration = Duration.parse(text)
+
+    assert (duration.years, duration.months, duration.delta) == (years, months, delta)
+
+
+@pytest.mark.parametrize("text", ["P", "PT", "P1H", "1D", "P1DT", "PT1D"])
+def test_parse_rejects_invalid_durations(text: str) -> None:
+    with pytest.raises(DateParsingFormatError):
+        Duration.parse(text)
+
+
+@pytest.mark.parametrize("text", ["P9999999999D", "PT999999999999999H", "-P9999999999W"])
+def test_parse_rejects_durations_beyond_the_timedelta_range(text: str) -> None:
+    with pytest.raises(DateParsingFormatError):
+        Duration.parse(text)
@@ -0,0 +1,115 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dateutil import DateFormat, DateUtil, clear_format_cache, compile_format, format_cache_info
+from dateutil.core import formatting
+
+PATTERNS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%fZ",
+    "%d.%m.%Y",
+    "%m/%d/%Y",
+    "%Y%m%d",
+    "%H:%M",
+    "100%% %Y",
+    "%a %d %b %Y %H:%M:%S %z",
+    "%d %b %y",
+    "%Y-%j",
+]
+
+
+def _values(count: int) -> list:
+    generator = random.Random(2026)
+    start = datetime(1000, 1, 1)
+
+    return [start + timedelta(microseconds=generator.randrange(10**17)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_format_matches_strftime(pattern: str) -> None:
+    compiled = compile_format(pattern)
+
+    for value in _values(500):
+        assert compiled.format(value) == value.strftime(pattern)
+
+
+def test_format_matches_strftime_for_aware_values() -> None:
+    compiled = compile_format("%a %d %b %Y %H:%M:%S %z")
+    value = datetime(2024, 7, 1, 12, 30, tzinfo=timezone(timedelta(hours=-3, minutes=-30)))
+
+    assert compiled.format(value) == value.strftime("%a %d %b %Y %H:%M:%S %z")
+
+
+def test_rfc_2822_format_uses_the_rfc_codecs() -> None:
+    assert DateUtil.datetime_to_string(datetime(2024, 6, 1), DateFormat.RFC_2822) == "Sat, 01 Jun 2024 00:00:00 +0000"
+    assert DateUtil.string_to_datetime("Sun, 06 Nov 1994 08:49:37 GMT", DateFormat.RFC_2822) == datetime(
+        1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc
+    )
+    assert compile_format(DateFormat.RFC_2822).match("Sun, 06 Nov 1994") is None
+
+
+@pytest.mark.parametrize("pattern", [pattern for pattern in PATTERNS if "%j" not in pattern and "%z" not in pattern])
+def test_parse_matches_strptime(pattern: str) -> None:
+    compiled = compile_format(pattern)
+
+    for value in _values(200):
+        text = value.strftime(pattern)
+
+        assert compiled.parse(text) == datetime.strptime(text, pattern)
+
+
+@pytest.mark.parametrize(
+    ("text", "pattern"),
+    [
+        ("2024-02-30", "%Y-%m-%d"),
+        ("2024-13-01", "%Y-%m-%d"),
+        ("2024-01-01 24:00:00", "%Y-%m-%d %H:%M:%S"),
+        ("01.01.2024 ", "%d.%m.%Y"),
+    ],
+)
+def test_parse_rejects_what_strptime_rejects(text: str, pattern: str) -> None:
+    with pytest.raises(ValueError):
+        datetime.strptime(text, pattern)
+
+    with pytest.raises(ValueError):
+        compile_format(pattern).parse(text)
+
+    assert compile_format(pattern).match(text) is None
+
+
+def test_parse_offsets() -> None:
+    parsed = compile_format("%Y-%m-%d %z").parse("2024-01-01 -05:30")
+
+    assert parsed.utcoffset() == -timedelta(hours=5, minutes=30)
+
+
+def test_string_to_datetime_uses_the_compiled_formats() -> None:
+    assert DateUtil.string_to_datetime("2024-01-02 03:04:05", DateFormat.CUSTOM_DATE) == datetime(2024, 1, 2, 3, 4, 5)
+    assert DateUtil.datetime_to_string(datetime(2024, 1, 2), DateFormat.EU_DATE) == "02.01.2024"
+
+
+def test_cache_evicts_the_least_recently_used_pattern(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(formatting, "FORMAT_CACHE_SIZE", 2)
+    clear_format_cache()
+
+    try:
+        first = compile_format("%Y")
+        compile_format("%m")
+
+        # Using the first pattern again makes "%m" the eviction candidate.
+        assert compile_format("%Y") is first
+
+        compile_format("%d")
+
+        assert compile_format("%Y") is first
+        assert format_cache_info()["evictions"] == 1
+        assert list(formatting._COMPILED) == ["%d", "%Y"]
+    finally:
+        clear_format_cache()
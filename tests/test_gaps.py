@@ -0,0 +1,52 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import GapDetector, SeriesEvent
+
+
+def test_scan_reports_gaps_duplicates_and_late_values() -> None:
+    start = datetime(2024, 7, 1)
+    values = [start + timedelta(minutes=minute) for minute in (0, 1, 2, 5, 5, 3, 6, 7)]
+    detector = GapDetector(timedelta(minutes=1), unit="minutes")
+
+    events = list(detector.scan(values))
+
+    assert [(event.kind, event.missing, event.difference) for event in events] == [
+        ("gap", 2, 3.0),
+        ("duplicate", 0, 0.0),
+        ("out_of_order", 0, -2.0),
+    ]
+    assert events[0] == SeriesEvent(None, "gap", values[2], values[3], 2, 3.0)
+    assert detector.counts == {"gap": 1, "duplicate": 1, "out_of_order": 1}
+
+
+def test_tolerance_absorbs_jitter() -> None:
+    detector = GapDetector(10, tolerance=0.5, epoch_unit="s")
+
+    assert list(detector.scan([0, 10, 25, 41])) == [SeriesEvent(None, "gap", 25, 41, 1, 16.0)]
+
+
+def test_keyed_streams_are_independent() -> None:
+    detector = GapDetector(1, epoch_unit="s")
+    pairs = [("a", 0), ("b", 100), ("a", 1), ("b", 101), ("a", 5), ("b", 102)]
+
+    events = list(detector.scan_keyed(pairs))
+
+    assert [(event.key, event.kind, event.missing) for event in events] == [("a", "gap", 3)]
+    assert len(detector) == 2
+
+    detector.forget("a")
+
+    assert len(detector) == 1 and detector.observe(0, "a") is None
+
+
+def test_invalid_options_are_rejected() -> None:
+    for options in ({"cadence": 0}, {"cadence": 1, "unit": "months"}, {"cadence": 1, "tolerance": -1}):
+        with pytest.raises(ValueError):
+            GapDetector(**options)
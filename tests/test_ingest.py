@@ -0,0 +1,59 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from pathlib import Path
+
+import pytest
+
+from dateutil import NAT, IngestStats, ParallelIngest
+from dateutil.core.core import DateParsingError
+
+PATTERN = "%Y-%m-%dT%H:%M:%S"
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "values.txt"
+    path.write_text("2024-01-01T00:00:00\nbad\n2024-01-02T00:00:00\nnope\n" * 500, encoding="utf-8")
+
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_skip_reports_the_failures(path: Path, workers: int) -> None:
+    stats = IngestStats()
+
+    values = ParallelIngest.parse_file(path, PATTERN, errors="skip", workers=workers, chunk_size=4096, stats=stats)
+
+    assert len(values) == 1000
+    assert (stats.values, stats.failures) == (1000, 1000)
+    assert stats.chunks == len(ParallelIngest.split(path, chunk_size=4096))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sentinel_reports_the_failures(path: Path, workers: int) -> None:
+    stats = IngestStats()
+
+    values = ParallelIngest.parse_file(path, PATTERN, errors="sentinel", workers=workers, chunk_size=4096, stats=stats)
+
+    assert values[:2].tolist() == [1_704_067_200_000_000, NAT]
+    assert (stats.values, stats.failures) == (2000, 1000)
+
+
+def test_raise_stops_at_the_first_failure(path: Path) -> None:
+    with pytest.raises(DateParsingError):
+        ParallelIngest.parse_file(path, PATTERN, workers=1)
+
+
+def test_undecodable_and_out_of_range_lines_follow_the_policy(tmp_path: Path) -> None:
+    path = tmp_path / "mixed.txt"
+    path.write_bytes(b"2024-01-01T00:00:00\n\xff\xfe\n2300-01-01T00:00:00\n")
+
+    values = ParallelIngest.parse_file(path, PATTERN, errors="sentinel", workers=1, unit="ns")
+
+    assert values.tolist() == [1_704_067_200_000_000_000, NAT, NAT]
+
+    with pytest.raises(DateParsingError, match="byte offset 20"):
+        ParallelIngest.parse_file(path, PATTERN, workers=1, unit="ns")
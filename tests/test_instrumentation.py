@@ -0,0 +1,65 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime
+
+import pytest
+
+from dateutil import DateFormat, DateUtil, Instrumentation
+
+
+@pytest.fixture
+def instrumentation():
+    Instrumentation.reset()
+    Instrumentation.enable()
+
+    yield Instrumentation
+
+    Instrumentation.disable()
+    Instrumentation.reset()
+
+
+def test_nested_operations_are_counted_once(instrumentation) -> None:
+    DateUtil.decrement(datetime(2024, 1, 1), "days", 1)
+    DateUtil.parse_date_string("2024-01-01", "%Y-%m-%d")
+
+    snapshot = instrumentation.snapshot()
+
+    assert set(snapshot) == {"decrement", "parse_date_string"}
+    assert snapshot["decrement"]["calls"] == 1
+
+
+def test_batch_arithmetic_is_instrumented(instrumentation) -> None:
+    DateUtil.increment_many([datetime(2024, 1, 1)] * 3, "hours", 1)
+    DateUtil.decrement_many([datetime(2024, 1, 1)], "days", 1)
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot["increment_many"]["by_unit"]["hours"]["calls"] == 1
+    assert snapshot["decrement_many"]["by_unit"]["days"]["calls"] == 1
+    assert "increment" not in snapshot
+
+
+def test_label_values_are_bounded(instrumentation) -> None:
+    for hours in range(1, 50):
+        DateUtil.increment(datetime(2024, 1, 1), f"PT{hours}H", 1)
+        DateUtil.datetime_to_string(datetime(2024, 1, 1), f"%Y-%m-%d {hours}")
+
+    DateUtil.datetime_to_string(datetime(2024, 1, 1), DateFormat.ISO_8601)
+
+    snapshot = instrumentation.snapshot()
+
+    assert set(snapshot["increment"]["by_unit"]) == {"duration"}
+    assert snapshot["increment"]["by_unit"]["duration"]["calls"] == 49
+    assert set(snapshot["datetime_to_string"]["by_format"]) == {"ISO_8601", "custom"}
+    assert snapshot["datetime_to_string"]["by_format"]["custom"]["calls"] == 49
+
+
+def test_disable_stops_counting(instrumentation) -> None:
+    instrumentation.disable()
+    DateUtil.increment(datetime(2024, 1, 1), "days", 1)
+
+    assert not instrumentation.is_enabled()
+    assert instrumentation.snapshot() == {}
@@ -0,0 +1,69 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import IntervalSet
+from dateutil.core.core import DateRangeError
+
+
+def _cells(intervals: IntervalSet) -> set:
+    return {cell for start, end in intervals for cell in range(start, end)}
+
+
+def _random_set(generator: random.Random) -> IntervalSet:
+    pairs = []
+
+    for _ in range(generator.randrange(6)):
+        start = generator.randrange(50)
+        pairs.append((start, start + generator.randrange(10)))
+
+    return IntervalSet(pairs)
+
+
+def test_intervals_are_normalised() -> None:
+    intervals = IntervalSet([(5, 7), (0, 2), (2, 3), (6, 9), (4, 4)])
+
+    assert list(intervals) == [(0, 3), (5, 9)]
+    assert (intervals.start, intervals.end, len(intervals)) == (0, 9, 2)
+    assert 2 in intervals and 3 not in intervals and 9 not in intervals
+
+
+def test_set_operations_match_brute_force() -> None:
+    generator = random.Random(2026)
+
+    for _ in range(500):
+        left, right = _random_set(generator), _random_set(generator)
+
+        assert _cells(left | right) == _cells(left) | _cells(right)
+        assert _cells(left & right) == _cells(left) & _cells(right)
+        assert _cells(left - right) == _cells(left) - _cells(right)
+        assert _cells(left.complement(10, 40)) == set(range(10, 40)) - _cells(left)
+        assert _cells(left.clip(10, 40)) == _cells(left) & set(range(10, 40))
+        assert left | right == IntervalSet(list(left) + list(right))
+
+
+def test_datetime_intervals() -> None:
+    day = datetime(2024, 7, 1)
+    busy = IntervalSet([(day + timedelta(hours=9), day + timedelta(hours=12)), (day + timedelta(hours=13), day + timedelta(hours=17))])
+
+    assert busy.total_duration() == timedelta(hours=7)
+    assert IntervalSet().total_duration() == timedelta(0) and not IntervalSet()
+    assert list(busy.complement(day + timedelta(hours=8), day + timedelta(hours=18))) == [
+        (day + timedelta(hours=8), day + timedelta(hours=9)),
+        (day + timedelta(hours=12), day + timedelta(hours=13)),
+        (day + timedelta(hours=17), day + timedelta(hours=18)),
+    ]
+
+
+def test_reversed_intervals_are_rejected() -> None:
+    with pytest.raises(DateRangeError):
+        IntervalSet([(2, 1)])
+
+    with pytest.raises(DateRangeError):
+        IntervalSet([(0, 1)]).clip(5, 0)
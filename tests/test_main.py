@@ -0,0 +1,123 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from dateutil.main import main
+
+
+def _run(tmp_path: Path, lines: List[str], *options: str) -> List[str]:
+    source = tmp_path / "input.txt"
+    target = tmp_path / "output.txt"
+    source.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+
+    assert main([*options, "-o", str(target), str(source)]) == 0
+
+    return target.read_text(encoding="utf-8").splitlines()
+
+
+def test_naive_input_defaults_to_utc(tmp_path: Path) -> None:
+    assert _run(tmp_path, ["2024-07-01 12:00:00"], "-f", "CUSTOM_DATE", "-t", "epoch-s") == ["1719835200"]
+
+
+@pytest.mark.parametrize(
+    ("target", "expected"),
+    [
+        ("ISO_8601", "2024-07-01T10:00:00.000000Z"),
+        ("epoch-s", "1719828000"),
+        ("epoch-ms", "1719828000000"),
+        ("RFC_2822", "Mon, 01 Jul 2024 12:00:00 +0200"),
+        ("%Y-%m-%d %H:%M", "2024-07-01 12:00"),
+    ],
+)
+def test_from_tz_localizes_naive_input_for_every_output(tmp_path: Path, target: str, expected: str) -> None:
+    lines = _run(tmp_path, ["2024-07-01 12:00:00"], "-f", "CUSTOM_DATE", "-t", target, "--from-tz", "Europe/Berlin")
+
+    assert lines == [expected]
+
+
+def test_from_tz_does_not_apply_to_utc_input(tmp_path: Path) -> None:
+    lines = _run(
+        tmp_path,
+        ["2024-03-10T12:00:00.000000Z"],
+        "-f",
+        "ISO_8601",
+        "-t",
+        "epoch-s",
+        "--from-tz",
+        "America/New_York",
+    )
+
+    assert lines == ["1710072000"]
+
+
+def test_from_tz_localizes_epoch_input_consistently(tmp_path: Path) -> None:
+    lines = _run(tmp_path, ["1719828000"], "-f", "epoch-s", "-t", "CUSTOM_DATE", "--to-tz", "Europe/Berlin")
+
+    assert lines == ["2024-07-01 12:00:00"]
+
+
+@pytest.mark.parametrize(
+    ("target", "expected"),
+    [
+        ("CUSTOM_DATE", "2024-07-01 06:00:00"),
+        ("RFC_2822", "Mon, 01 Jul 2024 06:00:00 -0400"),
+        ("epoch-s", "1719828000"),
+    ],
+)
+def test_to_tz_renders_in_the_target_zone(tmp_path: Path, target: str, expected: str) -> None:
+    lines = _run(
+        tmp_path,
+        ["2024-07-01 12:00:00"],
+        "-f",
+        "CUSTOM_DATE",
+        "-t",
+        target,
+        "--from-tz",
+        "Europe/Berlin",
+        "--to-tz",
+        "America/New_York",
+    )
+
+    assert lines == [expected]
+
+
+def test_rfc_2822_output_is_locale_independent_and_round_trips(tmp_path: Path) -> None:
+    lines = _run(tmp_path, ["Sun, 06 Nov 1994 08:49:37 -0500"], "-f", "RFC_2822", "-t", "RFC_2822")
+
+    assert lines == ["Sun, 06 Nov 1994 08:49:37 -0500"]
+
+
+def test_rfc_2822_input_accepts_zone_names(tmp_path: Path) -> None:
+    lines = _run(tmp_path, ["Sun, 06 Nov 1994 08:49:37 GMT"], "-f", "RFC_2822", "-t", "epoch-s")
+
+    assert lines == ["784111777"]
+
+
+def test_to_tz_with_iso_8601_output_is_rejected(tmp_path: Path) -> None:
+    source = tmp_path / "input.txt"
+    source.write_text("2024-07-01 12:00:00\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit) as raised:
+        main(["-f", "CUSTOM_DATE", "-t", "ISO_8601", "--to-tz", "Europe/Berlin", str(source)])
+
+    assert raised.value.code == 2
+
+
+def test_unknown_zones_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit) as raised:
+        main(["--from-tz", "Mars/Olympus_Mons", str(tmp_path / "missing.txt")])
+
+    assert raised.value.code == 2
+
+
+def test_worker_processes_produce_the_same_output(tmp_path: Path) -> None:
+    values = [f"2024-07-01 12:{minute:02d}:00" for minute in range(60)]
+    options = ("-f", "CUSTOM_DATE", "-t", "epoch-s", "--from-tz", "Europe/Berlin", "--chunk-size", "7")
+
+    assert _run(tmp_path, values, *options, "-j", "2") == _run(tmp_path, values, *options)
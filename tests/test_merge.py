@@ -0,0 +1,51 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime
+
+import pytest
+
+from dateutil import DateFormat, TimestampMerge
+from dateutil.core.core import DateComparisonError
+
+
+def test_merge_is_ordered_and_stable() -> None:
+    streams = [[(1, "a"), (3, "a"), (3, "a2")], [(0, "b"), (3, "b")], [], [(2, "c")]]
+
+    merged = list(TimestampMerge.merge(streams, key=lambda record: record[0]))
+
+    assert merged == [(0, "b"), (1, "a"), (2, "c"), (3, "a"), (3, "a2"), (3, "b")]
+
+
+def test_merge_is_lazy() -> None:
+    def endless(start: int):
+        while True:
+            yield start
+            start += 2
+
+    merged = TimestampMerge.merge([endless(0), endless(1)])
+
+    assert [next(merged) for _ in range(5)] == [0, 1, 2, 3, 4]
+
+
+def test_merge_parses_and_dedupes() -> None:
+    streams = [["2024-07-01 12:00:00", "2024-07-01 13:00:00"], ["2024-07-01 12:00:00"]]
+
+    merged = list(TimestampMerge.merge(streams, date_format=DateFormat.CUSTOM_DATE, dedupe=True))
+
+    assert merged == [datetime(2024, 7, 1, 12), datetime(2024, 7, 1, 13)]
+
+
+def test_merge_strings_yields_the_original_strings() -> None:
+    streams = [["01.07.2024", "03.07.2024"], ["02.07.2024"]]
+
+    assert list(TimestampMerge.merge_strings(streams, DateFormat.EU_DATE)) == ["01.07.2024", "02.07.2024", "03.07.2024"]
+
+
+def test_strict_merge_rejects_unsorted_streams() -> None:
+    assert list(TimestampMerge.merge([[2, 1]])) == [2, 1]
+
+    with pytest.raises(DateComparisonError):
+        list(TimestampMerge.merge([[2, 1]], strict=True))
@@ -0,0 +1,51 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from dateutil import NanoTimestamp
+from dateutil.core.core import DateParsingError, DateSerializationError
+
+
+def test_parse_keeps_nanoseconds() -> None:
+    value = NanoTimestamp.parse("2024-01-01T00:00:00.123456789Z")
+
+    assert value.nanos == 1_704_067_200_123_456_789
+    assert value.isoformat() == "2024-01-01T00:00:00.123456789Z"
+
+
+def test_parse_applies_offsets() -> None:
+    value = NanoTimestamp.parse("2024-01-01T05:30:00+05:30")
+
+    assert value == NanoTimestamp.from_datetime(datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+@pytest.mark.parametrize("offset", ["+05:99", "+0560", "+24:00", "-99:00"])
+def test_parse_rejects_out_of_range_offsets(offset: str) -> None:
+    with pytest.raises(DateParsingError):
+        NanoTimestamp.parse(f"2024-01-01T00:00:00{offset}")
+
+
+@pytest.mark.parametrize("text", ["2024-02-30T00:00:00Z", "2024-01-01T24:00:00Z", "2024-01-01"])
+def test_parse_rejects_invalid_timestamps(text: str) -> None:
+    with pytest.raises(DateParsingError):
+        NanoTimestamp.parse(text)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [NanoTimestamp(2**80), NanoTimestamp(-(2**80)), NanoTimestamp.parse("9999-12-31T23:59:59-23:59")],
+)
+def test_formatting_out_of_range_values_raises_serialization_error(value: NanoTimestamp) -> None:
+    with pytest.raises(DateSerializationError):
+        value.isoformat()
+
+    with pytest.raises(DateSerializationError):
+        str(value)
+
+    with pytest.raises(DateSerializationError):
+        NanoTimestamp.format_many([value.nanos])
@@ -0,0 +1,29 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import os
+import subprocess
+import sys
+
+import dateutil
+
+
+def test_import_does_not_load_optional_modules() -> None:
+    src = os.path.dirname(os.path.dirname(dateutil.__file__))
+    code = (
+        f"import sys; sys.path.insert(0, {src!r}); import dateutil; "
+        "print(sorted(name for name in ('asyncio', 'multiprocessing', 'concurrent.futures.process') if name in sys.modules))"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_every_public_name_resolves() -> None:
+    for name in dateutil.__all__:
+        assert getattr(dateutil, name) is not None
+
+    assert set(dateutil.__all__) <= set(dir(dateutil))
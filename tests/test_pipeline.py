@@ -0,0 +1,62 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import DateFormat, Pipeline
+from dateutil.core.core import DateParsingFormatError
+
+
+@pytest.mark.parametrize("what", ["years", "days"])
+def test_skip_policy_gives_the_same_result_with_every_engine(what: str) -> None:
+    pipeline = Pipeline(errors="skip").shift(what, 1)
+    values = [datetime(2024, 2, 29), datetime(2023, 1, 1), datetime(9999, 12, 31)]
+
+    assert list(pipeline.run(values, engine="batch")) == list(pipeline.run(values))
+
+
+@pytest.mark.parametrize("engine", ["stream", "batch", "process"])
+def test_every_engine_gives_the_same_result(engine: str) -> None:
+    pipeline = (
+        Pipeline()
+        .parse(DateFormat.CUSTOM_DATE)
+        .shift("hours", 1)
+        .floor("days")
+        .convert("Europe/Berlin")
+        .format("%Y-%m-%d %H:%M %z")
+    )
+    values = [f"2024-07-{day:02d} 23:30:00" for day in range(1, 31)]
+    expected = [f"2024-07-{day + 1:02d} 02:00 +0200" for day in range(1, 30)] + ["2024-07-31 02:00 +0200"]
+
+    assert list(pipeline.run(values, engine=engine, chunk_size=7, workers=2)) == expected
+
+
+def test_stages_are_immutable_and_compiled_once() -> None:
+    base = Pipeline().floor(timedelta(minutes=15))
+    extended = base.map(lambda value: value.minute)
+
+    assert len(base.stages) == 1 and len(extended.stages) == 2
+    assert base.compile() is base.compile()
+    assert list(extended.run([datetime(2024, 7, 1, 12, 44, 59)])) == [30]
+
+
+def test_errors_raise_by_default() -> None:
+    with pytest.raises(DateParsingFormatError):
+        list(Pipeline().parse(DateFormat.CUSTOM_DATE).run(["not a date"]))
+
+    assert list(Pipeline(errors="skip").parse(DateFormat.CUSTOM_DATE).run(["not a date"], engine="batch")) == []
+
+
+def test_invalid_options_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        Pipeline(errors="ignore")
+
+    with pytest.raises(ValueError):
+        Pipeline().floor("decades")
+
+    with pytest.raises(ValueError):
+        Pipeline().run([], engine="threads")
@@ -0,0 +1,69 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import pytest
+
+from dateutil import LatencyHistogram, Profiler
+
+
+def test_histogram_percentiles_stay_within_the_bucket_error() -> None:
+    histogram = LatencyHistogram()
+
+    for value in range(1, 10_001):
+        histogram.record(value)
+
+    assert (histogram.count, histogram.minimum, histogram.maximum) == (10_000, 1, 10_000)
+    assert histogram.mean() == 5000.5
+
+    for q, expected in ((50, 5000), (90, 9000), (99, 9900), (100, 10_000)):
+        assert abs(histogram.percentile(q) - expected) <= expected * 0.125
+
+    with pytest.raises(ValueError):
+        histogram.percentile(101)
+
+
+def test_empty_histogram_and_negative_values() -> None:
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) == 0 and histogram.mean() == 0.0
+
+    histogram.record(-5)
+
+    assert histogram.to_dict()["min"] == 0 and histogram.to_dict()["max"] == 0
+
+
+def test_profiler_aggregates_every_way_of_timing() -> None:
+    profiler = Profiler()
+
+    @profiler.profile("call")
+    def call() -> int:
+        return 1
+
+    assert [call() for _ in range(3)] == [1, 1, 1]
+
+    with profiler.timer("block"):
+        pass
+
+    assert profiler.start("explicit").stop() >= 0
+    assert profiler.labels() == ["block", "call", "explicit"]
+    assert profiler.snapshot()["call"]["count"] == 3
+
+    profiler.reset("call")
+
+    assert profiler.histogram("call") is None
+    assert profiler.percentile("call", 50) == 0
+
+
+def test_disabled_profiler_records_nothing() -> None:
+    profiler = Profiler(enabled=False)
+
+    @profiler.profile()
+    def call() -> int:
+        return 1
+
+    call()
+    profiler.record("manual", 10)
+
+    assert profiler.labels() == []
@@ -0,0 +1,43 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import ReorderBuffer
+
+
+def test_events_within_the_lateness_are_reordered() -> None:
+    late = []
+    buffer = ReorderBuffer(allowed_lateness=2, on_late=late.append)
+
+    assert list(buffer.process([1, 3, 2, 5, 4, 0, 8, 6])) == [1, 2, 3, 4, 5, 6, 8]
+    assert late == [0]
+    assert (buffer.received, buffer.emitted, buffer.late) == (7, 7, 1)
+
+
+def test_ties_keep_their_arrival_order() -> None:
+    start = datetime(2024, 7, 1)
+    events = [(start, "a"), (start + timedelta(seconds=2), "c"), (start, "b")]
+    buffer = ReorderBuffer(timedelta(seconds=5), key=lambda event: event[0])
+
+    assert [name for _, name in buffer.process(events)] == ["a", "b", "c"]
+
+
+def test_watermark_progress_and_advance() -> None:
+    buffer = ReorderBuffer(allowed_lateness=10)
+
+    assert buffer.push(100) == [] and buffer.push(95) == []
+    assert buffer.progress()["lag"] == 10 and len(buffer) == 2
+    assert buffer.advance(96) == [95]
+    assert buffer.advance(50) == [] and buffer.watermark == 96
+    assert buffer.flush() == [100]
+    assert buffer.progress()["buffered"] == 0
+
+
+def test_negative_lateness_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        ReorderBuffer(timedelta(seconds=-1))
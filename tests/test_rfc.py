@@ -0,0 +1,77 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dateutil import RFCDate
+from dateutil.core.core import DateParsingFormatError
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Sun, 06 Nov 1994 08:49:37 +0000", datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc)),
+        (
+            "Sun, 06 Nov 1994 08:49:37 -2359",
+            datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone(-timedelta(hours=23, minutes=59))),
+        ),
+        (
+            "6 Nov 94 08:49 EST",
+            datetime(1994, 11, 6, 8, 49, tzinfo=timezone(-timedelta(hours=5))),
+        ),
+    ],
+)
+def test_parse_rfc_2822(text: str, expected: datetime) -> None:
+    result = RFCDate.parse_rfc_2822(text)
+
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize("offset", ["+9999", "+0260", "+2400", "-0099"])
+def test_parse_rfc_2822_rejects_out_of_range_offsets(offset: str) -> None:
+    with pytest.raises(DateParsingFormatError):
+        RFCDate.parse_rfc_2822(f"Sun, 06 Nov 1994 08:49:37 {offset}")
+
+
+def test_format_rfc_2822_round_trips() -> None:
+    value = datetime(2024, 2, 29, 23, 59, 1, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+
+    assert RFCDate.parse_rfc_2822(RFCDate.format_rfc_2822(value)) == value
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Sun, 06 Nov 1994 08:49:37 GMT",
+        "Sunday, 06-Nov-94 08:49:37 GMT",
+        "Sun Nov  6 08:49:37 1994",
+    ],
+)
+def test_parse_http_accepts_every_http_date_format(text: str) -> None:
+    assert RFCDate.parse_http(text) == datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Xyz, 06 Nov 1994 08:49:37 GMT",
+        "Sun, 31 Nov 1994 08:49:37 GMT",
+        "Sun, 06 Nov 1994 08:49:37 UTC",
+        "Sun, 06 Nov 1994 08:49:3\u00b2 GMT",
+    ],
+)
+def test_parse_http_rejects_invalid_dates(text: str) -> None:
+    with pytest.raises(DateParsingFormatError):
+        RFCDate.parse_http(text)
+
+
+def test_format_http_round_trips() -> None:
+    value = datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc)
+
+    assert RFCDate.format_http(value) == "Sun, 06 Nov 1994 08:49:37 GMT"
+    assert RFCDate.parse_http(RFCDate.format_http(value)) == value
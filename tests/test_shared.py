@@ -0,0 +1,131 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Tuple
+
+import pytest
+
+import dateutil
+from dateutil import SharedTimestamps
+from dateutil.core.core import DateDeserializationError
+
+
+def _count(shared: SharedTimestamps) -> Tuple[bool, int]:
+    try:
+        return (shared.readonly, len(shared.between(10, 20)))
+    finally:
+        shared.close()
+
+
+@pytest.fixture
+def table():
+    shared = SharedTimestamps.create(array("q", range(100)), unit="s")
+
+    yield shared
+
+    shared.close()
+    shared.unlink()
+
+
+def test_create_and_query(table: SharedTimestamps) -> None:
+    assert len(table) == 100
+    assert table.sorted
+    assert table.search(10, 20) == (10, 20)
+    assert list(table.between(10, 13)) == [10, 11, 12]
+
+
+@pytest.mark.parametrize("values", [[0, 1, 2, 3], [3, 1, 0, 2]])
+def test_datetime_bounds_follow_the_half_open_interval(values: list) -> None:
+    with SharedTimestamps.create(values, unit="s") as shared:
+        start = datetime(1970, 1, 1, 0, 0, 1, 500000)
+        end = datetime(1970, 1, 1, 0, 0, 2, 500000)
+
+        assert list(shared.between(start, end)) == [2]
+        assert list(shared.between(datetime(1970, 1, 1), datetime(1970, 1, 1, 0, 0, 1))) == [0]
+
+
+def test_attach_is_read_only_by_default(table: SharedTimestamps) -> None:
+    attached = SharedTimestamps.attach(table.name)
+
+    try:
+        assert attached.readonly
+        assert list(attached.values[:3]) == [0, 1, 2]
+
+        with pytest.raises(TypeError):
+            attached.values[0] = 1
+
+        with pytest.raises(DateDeserializationError):
+            attached.refresh()
+    finally:
+        attached.close()
+
+
+def test_pickling_attaches_read_only(table: SharedTimestamps) -> None:
+    copy = pickle.loads(pickle.dumps(table))
+
+    try:
+        assert copy.name == table.name
+        assert copy.readonly
+    finally:
+        copy.close()
+
+
+def test_segment_survives_independent_processes_attaching(table: SharedTimestamps) -> None:
+    src = os.path.dirname(os.path.dirname(dateutil.__file__))
+    code = (
+        f"import sys; sys.path.insert(0, {src!r}); from dateutil import SharedTimestamps; "
+        f"shared = SharedTimestamps.attach({table.name!r}); print(len(shared)); shared.close()"
+    )
+
+    for _ in range(2):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "100"
+
+    attached = SharedTimestamps.attach(table.name)
+    attached.close()
+
+
+def test_workers_receive_the_table_by_name(table: SharedTimestamps) -> None:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(_count, [table, table])) == [(True, 10), (True, 10)]
+
+    assert list(table.between(10, 13)) == [10, 11, 12]
+
+
+def test_refresh_updates_the_shared_sorted_flag(table: SharedTimestamps) -> None:
+    table.values[0] = 1000
+
+    assert not table.refresh()
+    assert not table.sorted
+
+    with pytest.raises(DateDeserializationError):
+        table.search(0, 5)
+
+    table.values[0] = 0
+
+    assert table.refresh()
+    assert table.search(0, 5) == (0, 5)
+
+
+def test_context_manager_unlinks_in_the_owner() -> None:
+    with SharedTimestamps.create(range(10)) as shared:
+        name = shared.name
+
+        with SharedTimestamps.attach(name) as attached:
+            assert len(attached) == 10
+
+        # Closing an attached table leaves the segment in place.
+        SharedTimestamps.attach(name).close()
+
+    with pytest.raises(FileNotFoundError):
+        SharedTimestamps.attach(name)
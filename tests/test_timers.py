@@ -0,0 +1,75 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import TimerWheel, every, next_aligned, sleep_until
+
+
+@pytest.mark.parametrize(
+    ("interval", "align", "expected"),
+    [
+        (timedelta(minutes=15), "hour", datetime(2024, 7, 1, 12, 15)),
+        (60, "minute", datetime(2024, 7, 1, 12, 8)),
+        (timedelta(hours=6), datetime(2024, 7, 1, 1), datetime(2024, 7, 1, 13)),
+        (5, None, datetime(2024, 7, 1, 12, 7, 30)),
+    ],
+)
+def test_next_aligned(interval, align, expected: datetime) -> None:
+    assert next_aligned(interval, align, now=datetime(2024, 7, 1, 12, 7, 30)) == expected
+
+
+def test_next_aligned_rejects_invalid_options() -> None:
+    with pytest.raises(ValueError):
+        next_aligned(0)
+
+    with pytest.raises(ValueError):
+        next_aligned(1, "week")
+
+
+def test_every_yields_scheduled_ticks() -> None:
+    async def collect() -> list:
+        ticks = []
+
+        async for tick in every(0.02):
+            ticks.append(tick)
+
+            if len(ticks) == 3:
+                break
+
+        return ticks
+
+    ticks = asyncio.run(collect())
+
+    # Ticks follow the schedule, not the wakeups, so they are exactly one interval apart.
+    assert [later - earlier for earlier, later in zip(ticks, ticks[1:])] == [timedelta(seconds=0.02)] * 2
+    assert datetime.now() >= ticks[-1]
+
+
+def test_timer_wheel_serves_many_sleepers_and_cancellations() -> None:
+    async def scenario() -> list:
+        wheel = TimerWheel()
+        woken = []
+        start = datetime.now()
+
+        async def sleeper(delay: float) -> None:
+            await wheel.sleep_until(start + timedelta(seconds=delay))
+            woken.append(delay)
+
+        cancelled = wheel.call_at(start + timedelta(seconds=0.01), woken.append, "cancelled")
+        cancelled.cancel()
+
+        await asyncio.gather(*(sleeper(delay) for delay in (0.05, 0.01, 0.03)))
+        await sleep_until(start + timedelta(seconds=0.06))
+        await wheel.close()
+
+        assert datetime.now() >= start + timedelta(seconds=0.05)
+
+        return woken
+
+    assert asyncio.run(scenario()) == [0.01, 0.03, 0.05]
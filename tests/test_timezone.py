@@ -0,0 +1,73 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dateutil import TimezoneUtil
+from dateutil.core.core import DateTimezoneError
+
+BERLIN = TimezoneUtil.get_zone("Europe/Berlin")
+
+
+def test_convert_many_matches_astimezone_across_transitions() -> None:
+    values = [datetime(2024, 3, 31, 0, 0) + timedelta(minutes=15 * step) for step in range(16)]
+    values += [datetime(2024, 10, 27, 0, 0) + timedelta(minutes=15 * step) for step in range(16)]
+
+    converted = TimezoneUtil.convert_many(values, "UTC", "Europe/Berlin")
+
+    for value, result in zip(values, converted):
+        expected = value.replace(tzinfo=timezone.utc).astimezone(BERLIN)
+
+        assert result == expected
+        assert result.utcoffset() == expected.utcoffset()
+        assert result.fold == expected.fold
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime(9999, 6, 1), datetime(9999, 12, 31, 12), datetime(1, 1, 2), datetime(1, 6, 1)],
+)
+def test_convert_many_at_the_ends_of_the_datetime_range(value: datetime) -> None:
+    result = TimezoneUtil.convert_many([value], "UTC", "Europe/Berlin")[0]
+
+    assert result == value.replace(tzinfo=timezone.utc).astimezone(BERLIN)
+    assert result.utcoffset() == value.replace(tzinfo=timezone.utc).astimezone(BERLIN).utcoffset()
+
+
+def test_localize_many_resolves_ambiguous_times() -> None:
+    value = datetime(2024, 10, 27, 2, 30)
+
+    earlier = TimezoneUtil.localize_many([value], "Europe/Berlin", ambiguous="earlier")[0]
+    later = TimezoneUtil.localize_many([value], "Europe/Berlin", ambiguous="later")[0]
+
+    assert earlier.utcoffset() == timedelta(hours=2)
+    assert later.utcoffset() == timedelta(hours=1)
+    assert (earlier.fold, later.fold) == (0, 1)
+
+    with pytest.raises(DateTimezoneError):
+        TimezoneUtil.localize_many([value], "Europe/Berlin", ambiguous="raise")
+
+
+def test_localize_many_resolves_nonexistent_times() -> None:
+    value = datetime(2024, 3, 31, 2, 30)
+
+    forward = TimezoneUtil.localize_many([value], "Europe/Berlin", nonexistent="shift_forward")[0]
+    backward = TimezoneUtil.localize_many([value], "Europe/Berlin", nonexistent="shift_backward")[0]
+
+    assert forward.astimezone(timezone.utc) == datetime(2024, 3, 31, 1, 0, tzinfo=timezone.utc)
+    assert backward.astimezone(timezone.utc) == datetime(2024, 3, 31, 0, 59, 59, 999999, tzinfo=timezone.utc)
+
+    with pytest.raises(DateTimezoneError):
+        TimezoneUtil.localize_many([value], "Europe/Berlin", nonexistent="raise")
+
+
+def test_localize_many_near_the_end_of_the_datetime_range() -> None:
+    values = [datetime(9999, 7, 1, 12), datetime(9999, 12, 31, 12)]
+
+    localized = TimezoneUtil.localize_many(values, "Europe/Berlin")
+
+    assert [value.utcoffset() for value in localized] == [timedelta(hours=2), timedelta(hours=1)]
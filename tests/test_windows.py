@@ -0,0 +1,67 @@
+"""
+Author: Louis Goodnews
+Date: 2026-10-19
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from dateutil import RateLimiter, WindowCounter, WindowStats
+
+
+def test_sliding_window_expires_old_buckets() -> None:
+    counter = WindowCounter(window=60, buckets=60)
+
+    for second, value in ((0, 5.0), (10, 1.0), (59, 3.0)):
+        assert counter.record("a", value, now=second)
+
+    assert counter.query("a", now=59) == WindowStats(3, 9.0, 1.0, 5.0)
+    assert counter.query("a", now=60) == WindowStats(2, 4.0, 1.0, 3.0)
+    assert counter.count("a", now=200) == 0
+
+    # Events older than the window are rejected once newer ones were recorded.
+    assert not counter.record("a", now=-1)
+
+
+def test_tumbling_window_restarts_every_period() -> None:
+    counter = WindowCounter(window=timedelta(minutes=1), buckets=6, mode="tumbling")
+    start = datetime(2024, 7, 1, 12)
+
+    counter.record(now=start + timedelta(seconds=50))
+
+    assert counter.count(now=start + timedelta(seconds=59)) == 1
+    assert counter.count(now=start + timedelta(seconds=61)) == 0
+
+
+def test_keys_are_bounded_and_pruned() -> None:
+    counter = WindowCounter(window=10, buckets=10, max_keys=2)
+
+    for key in ("a", "b", "c"):
+        counter.record(key, now=0)
+
+    assert "a" not in counter and len(counter) == 2
+
+    counter.record("c", now=15)
+
+    assert counter.prune(now=15) == 1
+    assert list(counter._rings) == ["c"]
+
+
+def test_rate_limiter_admits_up_to_the_limit() -> None:
+    limiter = RateLimiter(limit=3, window=1, buckets=10)
+
+    assert [limiter.allow("client", now=0.0) for _ in range(4)] == [True, True, True, False]
+    assert limiter.remaining("client", now=0.5) == 0.0
+    assert not limiter.allow("client", cost=0.5, now=0.95)
+    assert limiter.allow("client", now=1.05)
+    assert limiter.allow("other", cost=3, now=0.0)
+
+
+def test_invalid_options_are_rejected() -> None:
+    for options in ({"window": 0}, {"window": 1, "buckets": 0}, {"window": 1, "mode": "hopping"}):
+        with pytest.raises(ValueError):
+            WindowCounter(**options)
+
+    with pytest.raises(ValueError):
+        RateLimiter(limit=0, window=1)